@@ -20,7 +20,13 @@ from pyslurm.core.job import (
     Jobs,
     JobStep,
     JobSteps,
+    JobPriorityFactor,
+    JobPriorityFactors,
     JobSubmitDescription,
+    HeterogeneousJobSubmitDescription,
+    JobWillRunResult,
+    wait_for,
+    wait_for_async,
 )
 from pyslurm.core.node import Node, Nodes
 from pyslurm.core.partition import Partition, Partitions
@@ -0,0 +1,411 @@
+#########################################################################
+# aio.py - asyncio front-end for pyslurm
+#########################################################################
+# Copyright (C) 2026 Toni Harzendorf <toni.harzendorf@gmail.com>
+#
+# This file is part of PySlurm
+#
+# PySlurm is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+
+# PySlurm is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with PySlurm; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+"""asyncio front-end for pyslurm
+
+All functions in this module are coroutines, which run the blocking pyslurm
+calls in a bounded pool of threads, so the event loop is never blocked. The
+GIL is released while waiting for the slurmctld or slurmdbd, so multiple
+calls can be in progress at the same time.
+
+Calls that only load data are coalesced: if the same call with the same
+arguments is already in progress, no new request is sent, and all callers
+receive the result of the call in progress. Note that this means these
+callers also get the same object returned.
+
+Cancelling a coroutine, or running into its timeout, stops waiting for the
+result. A call that hasn't been started yet is not started anymore. A call
+which is already running in a thread can't be interrupted, but its result
+is discarded. Coalesced calls are shared by all their callers, and are
+therefore never cancelled: when one caller is cancelled or times out, the
+call keeps running for the other callers, and a new caller with the same
+arguments still receives its result.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from pyslurm.core.job import Job, Jobs
+from pyslurm.core.node import Node, Nodes
+from pyslurm.core.partition import Partition, Partitions
+from pyslurm.core.reservation import Reservation, Reservations
+from pyslurm import db
+
+
+_executor = None
+_max_workers = 8
+_inflight = {}
+
+# asyncio.get_running_loop() is only available since Python 3.7
+_get_loop = getattr(asyncio, "get_running_loop", asyncio.get_event_loop)
+
+
+def set_max_workers(max_workers):
+    """Set the maximum amount of threads used to run pyslurm calls.
+
+    Calls that are already in progress are not affected.
+
+    Args:
+        max_workers (int):
+            Maximum amount of threads. The default is 8.
+
+    Examples:
+        >>> import pyslurm.aio
+        >>> pyslurm.aio.set_max_workers(32)
+    """
+    global _executor, _max_workers
+
+    old = _executor
+    _executor = None
+    _max_workers = max_workers
+    if old is not None:
+        old.shutdown(wait=False)
+
+
+def _get_executor():
+    global _executor
+
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=_max_workers,
+                                       thread_name_prefix="pyslurm-aio")
+    return _executor
+
+
+def _coalesce_key(loop, func, args, kwargs):
+    key = (loop, func, args, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _forget(key, fut):
+    if _inflight.get(key) is fut:
+        del _inflight[key]
+
+    # Nobody might be waiting for the result anymore, so make sure an
+    # exception is not reported as never retrieved.
+    if not fut.cancelled():
+        fut.exception()
+
+
+async def run(func, *args, timeout=None, coalesce=False, **kwargs):
+    """Run a blocking function in the pool of threads.
+
+    This can be used for any pyslurm function which has no coroutine in
+    this module.
+
+    Args:
+        func (Callable):
+            The function to run.
+        *args (Any):
+            Positional arguments for the function.
+        timeout (float, optional):
+            Maximum amount of seconds to wait for the result. By default,
+            there is no timeout.
+        coalesce (bool, optional):
+            Whether concurrent calls to the same function with the same
+            arguments should be coalesced into a single call. Only use this
+            for functions without side-effects. Calls with arguments that
+            are not hashable are never coalesced.
+        **kwargs (Any):
+            Keyword arguments for the function. To pass a `timeout` or
+            `coalesce` argument to the function itself, use
+            `functools.partial`.
+
+    Returns:
+        (Any): The return value of the function.
+
+    Raises:
+        (asyncio.TimeoutError): When the result was not available before
+            the timeout.
+
+    Examples:
+        >>> import pyslurm
+        >>> import pyslurm.aio
+        >>> job = await pyslurm.aio.run(pyslurm.Job.load, 9999)
+        >>> await pyslurm.aio.run(job.suspend, timeout=10)
+    """
+    loop = _get_loop()
+    call = functools.partial(func, *args, **kwargs)
+    key = _coalesce_key(loop, func, args, kwargs) if coalesce else None
+
+    if key is None:
+        fut = loop.run_in_executor(_get_executor(), call)
+        return await asyncio.wait_for(fut, timeout)
+
+    fut = _inflight.get(key)
+    if fut is None:
+        fut = loop.run_in_executor(_get_executor(), call)
+        _inflight[key] = fut
+        fut.add_done_callback(functools.partial(_forget, key))
+
+    # Other callers may also be waiting for this call, so cancelling one of
+    # them must not cancel the call itself.
+    return await asyncio.wait_for(asyncio.shield(fut), timeout)
+
+
+async def load_jobs(timeout=None, **kwargs):
+    """Coroutine for [pyslurm.Jobs.load][].
+
+    Args:
+        timeout (float, optional):
+            Maximum amount of seconds to wait for the result.
+        **kwargs (Any):
+            Arguments for [pyslurm.Jobs.load][].
+
+    Returns:
+        (pyslurm.Jobs): A collection of Job objects.
+
+    Examples:
+        >>> import pyslurm.aio
+        >>> jobs = await pyslurm.aio.load_jobs(user="alice", timeout=30)
+    """
+    if isinstance(kwargs.get("user"), list):
+        kwargs["user"] = tuple(kwargs["user"])
+    return await run(Jobs.load, timeout=timeout, coalesce=True, **kwargs)
+
+
+async def load_job(job_id, timeout=None):
+    """Coroutine for [pyslurm.Job.load][].
+
+    Args:
+        job_id (int):
+            The ID of the Job to load.
+        timeout (float, optional):
+            Maximum amount of seconds to wait for the result.
+
+    Returns:
+        (pyslurm.Job): The Job.
+    """
+    return await run(Job.load, job_id, timeout=timeout, coalesce=True)
+
+
+async def load_job_states(job_ids=None, timeout=None):
+    """Coroutine for [pyslurm.Jobs.load_states][].
+
+    Args:
+        job_ids (list[int], optional):
+            The IDs of the Jobs to retrieve the state for.
+        timeout (float, optional):
+            Maximum amount of seconds to wait for the result.
+
+    Returns:
+        (dict[int, str]): The state of each Job.
+    """
+    if job_ids is not None:
+        job_ids = tuple(job_ids)
+    return await run(Jobs.load_states, job_ids, timeout=timeout,
+                     coalesce=True)
+
+
+async def submit(desc, timeout=None):
+    """Coroutine for [pyslurm.JobSubmitDescription.submit][].
+
+    Args:
+        desc (pyslurm.JobSubmitDescription):
+            The description of the Job to submit.
+        timeout (float, optional):
+            Maximum amount of seconds to wait for the result.
+
+    Returns:
+        (int): The ID of the submitted Job.
+    """
+    return await run(desc.submit, timeout=timeout)
+
+
+async def modify_job(job_id, changes, timeout=None):
+    """Coroutine for [pyslurm.Job.modify][].
+
+    Args:
+        job_id (int):
+            The ID of the Job to modify.
+        changes (pyslurm.JobSubmitDescription):
+            The changes to apply.
+        timeout (float, optional):
+            Maximum amount of seconds to wait for the result.
+    """
+    return await run(Job(job_id).modify, changes, timeout=timeout)
+
+
+async def cancel_job(job_id, timeout=None):
+    """Coroutine for [pyslurm.Job.cancel][].
+
+    Args:
+        job_id (int):
+            The ID of the Job to cancel.
+        timeout (float, optional):
+            Maximum amount of seconds to wait for the result.
+    """
+    return await run(Job(job_id).cancel, timeout=timeout)
+
+
+async def cancel_jobs(job_ids, timeout=None):
+    """Coroutine for [pyslurm.Jobs.cancel][].
+
+    Args:
+        job_ids (list[int]):
+            The IDs of the Jobs to cancel.
+        timeout (float, optional):
+            Maximum amount of seconds to wait for the result.
+
+    Returns:
+        (dict[int, int]): The result for each Job.
+    """
+    return await run(Jobs(list(job_ids)).cancel, timeout=timeout)
+
+
+async def load_nodes(timeout=None, **kwargs):
+    """Coroutine for [pyslurm.Nodes.load][].
+
+    Args:
+        timeout (float, optional):
+            Maximum amount of seconds to wait for the result.
+        **kwargs (Any):
+            Arguments for [pyslurm.Nodes.load][].
+
+    Returns:
+        (pyslurm.Nodes): A collection of Node objects.
+    """
+    return await run(Nodes.load, timeout=timeout, coalesce=True, **kwargs)
+
+
+async def load_node(name, timeout=None):
+    """Coroutine for [pyslurm.Node.load][].
+
+    Args:
+        name (str):
+            The name of the Node to load.
+        timeout (float, optional):
+            Maximum amount of seconds to wait for the result.
+
+    Returns:
+        (pyslurm.Node): The Node.
+    """
+    return await run(Node.load, name, timeout=timeout, coalesce=True)
+
+
+async def modify_node(name, changes, timeout=None):
+    """Coroutine for [pyslurm.Node.modify][].
+
+    Args:
+        name (str):
+            The name of the Node to modify.
+        changes (pyslurm.Node):
+            The changes to apply.
+        timeout (float, optional):
+            Maximum amount of seconds to wait for the result.
+    """
+    return await run(Node(name).modify, changes, timeout=timeout)
+
+
+async def load_partitions(timeout=None):
+    """Coroutine for [pyslurm.Partitions.load][].
+
+    Args:
+        timeout (float, optional):
+            Maximum amount of seconds to wait for the result.
+
+    Returns:
+        (pyslurm.Partitions): A collection of Partition objects.
+    """
+    return await run(Partitions.load, timeout=timeout, coalesce=True)
+
+
+async def load_partition(name, timeout=None):
+    """Coroutine for [pyslurm.Partition.load][].
+
+    Args:
+        name (str):
+            The name of the Partition to load.
+        timeout (float, optional):
+            Maximum amount of seconds to wait for the result.
+
+    Returns:
+        (pyslurm.Partition): The Partition.
+    """
+    return await run(Partition.load, name, timeout=timeout, coalesce=True)
+
+
+async def load_reservations(timeout=None):
+    """Coroutine for [pyslurm.Reservations.load][].
+
+    Args:
+        timeout (float, optional):
+            Maximum amount of seconds to wait for the result.
+
+    Returns:
+        (pyslurm.Reservations): A collection of Reservation objects.
+    """
+    return await run(Reservations.load, timeout=timeout, coalesce=True)
+
+
+async def load_reservation(name, timeout=None):
+    """Coroutine for [pyslurm.Reservation.load][].
+
+    Args:
+        name (str):
+            The name of the Reservation to load.
+        timeout (float, optional):
+            Maximum amount of seconds to wait for the result.
+
+    Returns:
+        (pyslurm.Reservation): The Reservation.
+    """
+    return await run(Reservation.load, name, timeout=timeout, coalesce=True)
+
+
+async def load_db_jobs(db_filter=None, timeout=None):
+    """Coroutine for [pyslurm.db.Jobs.load][].
+
+    A new connection to the slurmdbd is opened for each call, since a
+    connection must not be shared between threads.
+
+    Args:
+        db_filter (pyslurm.db.JobFilter, optional):
+            The filter to select the Jobs.
+        timeout (float, optional):
+            Maximum amount of seconds to wait for the result.
+
+    Returns:
+        (pyslurm.db.Jobs): A collection of database Job objects.
+    """
+    return await run(db.Jobs.load, db_filter, timeout=timeout, coalesce=True)
+
+
+async def load_db_job(job_id, timeout=None, **kwargs):
+    """Coroutine for [pyslurm.db.Job.load][].
+
+    Args:
+        job_id (int):
+            The ID of the Job to load.
+        timeout (float, optional):
+            Maximum amount of seconds to wait for the result.
+        **kwargs (Any):
+            Arguments for [pyslurm.db.Job.load][].
+
+    Returns:
+        (pyslurm.db.Job): The database Job.
+    """
+    return await run(db.Job.load, job_id, timeout=timeout, coalesce=True,
+                     **kwargs)
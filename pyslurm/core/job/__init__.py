@@ -1,3 +1,9 @@
 from .job import Job, Jobs
 from .step import JobStep, JobSteps
-from .submission import JobSubmitDescription
+from .priority import JobPriorityFactor, JobPriorityFactors
+from .submission import (
+    JobSubmitDescription,
+    HeterogeneousJobSubmitDescription,
+    JobWillRunResult,
+)
+from .wait import wait_for, wait_for_async
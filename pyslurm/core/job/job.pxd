@@ -28,7 +28,7 @@ from pyslurm.utils.ctime cimport time_t
 from pyslurm.db.stats cimport JobStatistics
 from pyslurm.db.tres cimport TrackableResources, GPU
 from libc.string cimport memcpy, memset
-from libc.stdint cimport uint8_t, uint16_t, uint32_t, uint64_t, int64_t
+from libc.stdint cimport uint8_t, uint16_t, uint32_t, uint64_t, int32_t, int64_t
 from libc.stdlib cimport free
 from pyslurm.core.job.submission cimport JobSubmitDescription
 from pyslurm.core.job.step cimport JobSteps, JobStep
@@ -46,6 +46,11 @@ from pyslurm.slurm cimport (
     slurm_free_job_info,
     slurm_load_job,
     slurm_load_jobs,
+    slurm_load_job_user,
+    slurm_load_job_state,
+    job_state_response_msg_t,
+    slurm_free_job_state_response_msg,
+    slurm_selected_step_t,
     job_info_msg_t,
     slurm_job_info_t,
     slurm_job_state_string,
@@ -57,11 +62,19 @@ from pyslurm.slurm cimport (
     slurm_get_job_stderr,
     slurm_signal_job,
     slurm_kill_job,
+    slurm_kill_jobs,
+    kill_jobs_msg_t,
+    kill_jobs_resp_msg_t,
+    kill_jobs_resp_job_t,
+    slurm_free_kill_jobs_response_msg,
     slurm_resume,
     slurm_suspend,
     slurm_update_job,
     slurm_notify_job,
     slurm_requeue,
+    slurm_load_node,
+    slurm_free_node_info_msg,
+    node_info_msg_t,
     xfree,
     try_xmalloc,
 )
@@ -97,6 +110,14 @@ cdef class Jobs(MultiClusterMap):
             Slurm controllers memory will not be removed either.
             The default is False, so old jobs will be removed, and new Jobs
             will be added - basically the same behaviour as doing Jobs.load().
+        lazy (bool):
+            Whether the Job objects in this collection are only created when
+            they are accessed for the first time. This is set by the `lazy`
+            argument of `Jobs.load()`.
+        view (bool):
+            Whether the Job objects in this collection are views into the
+            shared response from the slurmctld. This is set by the `view`
+            argument of `Jobs.load()`.
         stats (pyslurm.db.JobStatistics):
             Real-time statistics of all Jobs in this collection.
             Before you can access the stats data for this, you have to call
@@ -105,11 +126,26 @@ cdef class Jobs(MultiClusterMap):
     cdef:
         job_info_msg_t *info
         slurm_job_info_t tmp_info
+        time_t last_update
+        list user_ids
+        dict passwd
+        dict groups
+
+    cdef readonly:
+        bint lazy
+        bint view
 
     cdef public:
         frozen
         JobStatistics stats
 
+    cdef dict _load_data(self, time_t update_time, int flags)
+    cdef _extract_info(self, job_info_msg_t *info, dict out)
+    cdef _c_column(self, field, list items, np)
+
+
+cdef class _JobInfoMsg
+
 
 cdef class Job:
     """A Slurm Job.
@@ -431,11 +467,16 @@ cdef class Job:
             Whether the segments should be consolidated.
         slurm_protocol_version (int):
             The Slurm Protocol Version used.
+        is_view (bool):
+            Whether this Job is a view into a response from the slurmctld
+            that is shared with other Jobs. See `detach()`.
     """
     cdef:
         slurm_job_info_t *ptr
         dict passwd
         dict groups
+        bint _view
+        _JobInfoMsg _owner
 
     cdef public:
         JobSteps steps
@@ -450,3 +491,25 @@ cdef class Job:
     @staticmethod
     cdef Job from_ptr(slurm_job_info_t *in_ptr)
 
+    @staticmethod
+    cdef Job from_view(_JobInfoMsg msg, int idx)
+
+
+
+cdef class _JobInfoMsg:
+    """Owner of a job_info_msg_t that is shared by lazily created Jobs."""
+    cdef:
+        job_info_msg_t *ptr
+        bint views
+
+    cdef Job wrap(self, int idx)
+
+
+cdef class _LazyJobsDict(dict):
+    """A dict of Jobs which creates a Job on first access of its value."""
+    cdef:
+        dict passwd
+        dict groups
+
+    cdef Job _wrap(self, key, tuple ref)
+    cdef _wrap_all(self)
@@ -30,12 +30,17 @@
 
 from os import WIFSIGNALED, WIFEXITED, WTERMSIG, WEXITSTATUS
 import re
+from array import array
 from typing import Union
 from pyslurm.utils import cstr, ctime
 from pyslurm.utils.uint import *
 from pyslurm.core.job.util import *
+from pyslurm.core.job.stats cimport load_multiple
+from pyslurm.core.node import Nodes
 from pyslurm import settings
 from pyslurm import xcollections
+from pyslurm.xcollections cimport _uint_buffer, _uint_column
+from cpython cimport array as c_array
 from pyslurm.core.error import (
     RPCError,
     verify_rpc,
@@ -45,6 +50,7 @@ from pyslurm.utils.ctime import _raw_time
 from pyslurm.utils.helpers import (
     uid_to_name,
     gid_to_name,
+    user_to_uid,
     signal_to_num,
     _getgrall_to_dict,
     _getpwall_to_dict,
@@ -54,6 +60,76 @@ from pyslurm.utils.helpers import (
 )
 
 
+# How the attributes of a Job parse their raw values, for to_columns().
+# See xcollections._uint_column for the meaning.
+_RAW_SPEC = (slurm.NO_VAL64, slurm.INFINITE64, False, None, False)
+_U32_SPEC = (slurm.NO_VAL, slurm.INFINITE, True, None, False)
+_U32_ZERO_SPEC = (slurm.NO_VAL, slurm.INFINITE, False, None, False)
+_TIME_SPEC = (slurm.NO_VAL, slurm.INFINITE, True, None, True)
+
+# Fields of Jobs.to_columns() that are read directly from slurm_job_info_t.
+_JOB_COLUMNS = {
+    "id": (0, _RAW_SPEC),
+    "user_id": (1, _U32_ZERO_SPEC),
+    "group_id": (2, _U32_ZERO_SPEC),
+    "priority": (3, _U32_ZERO_SPEC),
+    "association_id": (4, _U32_SPEC),
+    "num_nodes": (5, _U32_SPEC),
+    "cpus": (6, (slurm.NO_VAL, slurm.INFINITE, True, 1, False)),
+    "array_id": (7, _U32_SPEC),
+    "heterogeneous_id": (8, (0, slurm.INFINITE, True, None, False)),
+    "time_limit": (9, _TIME_SPEC),
+    "submit_time": (10, _TIME_SPEC),
+    "eligible_time": (11, _TIME_SPEC),
+    "start_time": (12, _TIME_SPEC),
+    "end_time": (13, _TIME_SPEC),
+}
+
+
+cdef uint64_t _job_column_value(slurm_job_info_t *ptr, int field):
+    if field == 0:
+        return ptr.job_id
+    elif field == 1:
+        return ptr.user_id
+    elif field == 2:
+        return ptr.group_id
+    elif field == 3:
+        return ptr.priority
+    elif field == 4:
+        return ptr.assoc_id
+    elif field == 5:
+        return ptr.num_nodes
+    elif field == 6:
+        return ptr.num_cpus
+    elif field == 7:
+        return ptr.array_job_id
+    elif field == 8:
+        return ptr.het_job_id
+    elif field == 9:
+        return ptr.time_limit
+    elif field == 10:
+        return ptr.submit_time
+    elif field == 11:
+        return ptr.eligible_time
+    elif field == 12:
+        return ptr.start_time
+    else:
+        return ptr.end_time
+
+
+def _parse_user_ids(user):
+    if user is None:
+        return None
+
+    if isinstance(user, (str, int)):
+        user = [user]
+
+    # Remove duplicates, otherwise the same Jobs are requested twice.
+    user_ids = list(dict.fromkeys(user_to_uid(u) for u in user))
+    # Nothing to filter by, so all Jobs are loaded.
+    return user_ids or None
+
+
 cdef class Jobs(MultiClusterMap):
 
     def __cinit__(self):
@@ -72,7 +148,8 @@ cdef class Jobs(MultiClusterMap):
                          key_type=int)
 
     @staticmethod
-    def load(preload_passwd_info=False, frozen=False):
+    def load(preload_passwd_info=False, frozen=False, user=None, lazy=False,
+             view=False):
         """Retrieve all Jobs from the Slurm controller
 
         Args:
@@ -85,6 +162,28 @@ cdef class Jobs(MultiClusterMap):
                 instances.
             frozen (bool, optional):
                 Decide whether this collection of Jobs should be frozen.
+            user (Union[str, int, list[Union[str, int]]], optional):
+                Only retrieve the Jobs of this User, either by name or UID.
+                A list of Users can also be given. The filtering is done by
+                the slurmctld, so only the matching Jobs are sent back. The
+                collection remembers this filter, so calling `reload()` or
+                `refresh()` will also only retrieve the Jobs of these Users.
+                An empty list is the same as not giving any User, so all Jobs
+                are retrieved.
+            lazy (bool, optional):
+                Only create the Job objects when they are accessed for the
+                first time. The response from the slurmctld is kept in memory
+                until all Jobs have been created or the collection is gone.
+                This is useful for large amounts of Jobs if only some of them
+                are actually needed. The order of the Jobs is the same as
+                without this option.
+            view (bool, optional):
+                Don't copy the data of each Job out of the response from the
+                slurmctld. Instead, the Jobs are read-only views into the
+                response, which is shared by all of them and released at
+                once when the last Job referencing it is gone. This saves an
+                allocation and copy per Job. Use `Job.detach()` to get a Job
+                that is independent of the response.
 
         Returns:
             (pyslurm.Jobs): A collection of Job objects.
@@ -92,6 +191,7 @@ cdef class Jobs(MultiClusterMap):
         Raises:
             (pyslurm.RPCError): When getting all the Jobs from the slurmctld
                 failed.
+            (KeyError): When a User given in `user` does not exist.
 
         Examples:
             >>> import pyslurm
@@ -100,47 +200,215 @@ cdef class Jobs(MultiClusterMap):
             pyslurm.Jobs({1: pyslurm.Job(1), 2: pyslurm.Job(2)})
             >>> print(jobs[1])
             pyslurm.Job(1)
+            >>>
+            >>> # Only retrieve the Jobs of specific Users
+            >>> jobs = pyslurm.Jobs.load(user="alice")
+            >>> jobs = pyslurm.Jobs.load(user=["alice", 1001])
+            >>>
+            >>> # Only create the Job objects which are actually accessed
+            >>> jobs = pyslurm.Jobs.load(lazy=True)
+            >>> print(jobs[1])
+            pyslurm.Job(1)
+            >>>
+            >>> # Don't copy each Job out of the response
+            >>> jobs = pyslurm.Jobs.load(view=True)
+            >>> job = jobs[1].detach()
         """
         cdef:
-            dict passwd = {}
-            dict groups = {}
             Jobs jobs = Jobs(frozen=frozen)
             int flags = slurm.SHOW_ALL | slurm.SHOW_DETAIL
-            Job job
 
-        verify_rpc(slurm_load_jobs(0, &jobs.info, flags))
+        jobs.user_ids = _parse_user_ids(user)
+        jobs.lazy = lazy
+        jobs.view = view
 
         # If requested, preload the passwd and groups database to potentially
         # speedup lookups for an attribute in a Job, e.g. user_name or
-        # group_name.
+        # group_name. The collection keeps them, so Jobs from a refresh()
+        # also get them.
         if preload_passwd_info:
-            passwd = _getpwall_to_dict()
-            groups = _getgrall_to_dict()
+            jobs.passwd = _getpwall_to_dict()
+            jobs.groups = _getgrall_to_dict()
+
+        jobs.data = jobs._load_data(0, flags)
+        jobs.frozen = frozen
+        return jobs
+
+    cdef dict _load_data(self, time_t update_time, int flags):
+        cdef:
+            job_info_msg_t *info = NULL
+            dict out = {}
+            uint32_t user_id
+            uint16_t show_flags = flags
+            int rc
+
+        if self.user_ids is not None:
+            # slurm_load_job_user has no notion of an update_time, so the Jobs
+            # of each User are always retrieved in full.
+            for uid in self.user_ids:
+                user_id = uid
+                with nogil:
+                    rc = slurm_load_job_user(&info, user_id, show_flags)
+                verify_rpc(rc)
+                self._extract_info(info, out)
+            return out
+
+        with nogil:
+            rc = slurm_load_jobs(update_time, &info, flags)
+        if rc != slurm.SLURM_SUCCESS:
+            # The slurmctld tells us when nothing has changed since the
+            # update_time we passed in. The data we already have is still
+            # valid then.
+            if update_time and slurm_errno() == slurm.SLURM_NO_CHANGE_IN_DATA:
+                return None
+            verify_rpc(rc)
+
+        self._extract_info(info, out)
+        return out
+
+    cdef _extract_info(self, job_info_msg_t *info, dict out):
+        cdef:
+            Job job
+            _JobInfoMsg msg
+            _LazyJobsDict lazy_jobs
+
+        # Only release the previous response once we actually got new data.
+        slurm_free_job_info_msg(self.info)
+        self.info = NULL
+        self.last_update = info.last_update
+
+        if self.lazy or self.view:
+            # The response is owned by all Jobs that are views into it, or
+            # haven't been created yet, so refreshing the collection doesn't
+            # invalidate them.
+            msg = _JobInfoMsg.__new__(_JobInfoMsg)
+            msg.ptr = info
+            msg.views = self.view
+
+        if self.lazy:
+            # The Jobs are only referenced by their index in the response for
+            # now.
+            for cnt in range(info.record_count):
+                cluster = cstr.to_unicode(info.job_array[cnt].cluster)
+                if cluster not in out:
+                    lazy_jobs = _LazyJobsDict()
+                    if self.passwd is not None:
+                        lazy_jobs.passwd = self.passwd
+                        lazy_jobs.groups = self.groups
+                    out[cluster] = lazy_jobs
+                dict.__setitem__(out[cluster], info.job_array[cnt].job_id,
+                                 (msg, cnt))
+            return
+        elif self.view:
+            for cnt in range(info.record_count):
+                job = Job.from_view(msg, cnt)
+                if self.passwd is not None:
+                    job.passwd = self.passwd
+                    job.groups = self.groups
+
+                cluster = job.cluster
+                if cluster not in out:
+                    out[cluster] = {}
+                out[cluster][job.id] = job
+            return
+
+        self.info = info
 
         # zero-out a dummy job_step_info_t
-        memset(&jobs.tmp_info, 0, sizeof(slurm_job_info_t))
+        memset(&self.tmp_info, 0, sizeof(slurm_job_info_t))
 
         # Put each job pointer into its own "Job" instance.
-        for cnt in range(jobs.info.record_count):
-            job = Job.from_ptr(&jobs.info.job_array[cnt])
+        for cnt in range(self.info.record_count):
+            job = Job.from_ptr(&self.info.job_array[cnt])
 
             # Prevent double free if xmalloc fails mid-loop and a MemoryError
             # is raised by replacing it with a zeroed-out slurm_job_info_t.
-            jobs.info.job_array[cnt] = jobs.tmp_info
+            self.info.job_array[cnt] = self.tmp_info
 
-            if preload_passwd_info:
-                job.passwd = passwd
-                job.groups = groups
+            if self.passwd is not None:
+                job.passwd = self.passwd
+                job.groups = self.groups
 
             cluster = job.cluster
-            if cluster not in jobs.data:
-                jobs.data[cluster] = {}
-            jobs[cluster][job.id] = job
+            if cluster not in out:
+                out[cluster] = {}
+            out[cluster][job.id] = job
 
         # We have extracted all pointers
-        jobs.info.record_count = 0
-        jobs.frozen = frozen
-        return jobs
+        self.info.record_count = 0
+
+    @staticmethod
+    def load_states(job_ids=None):
+        """Retrieve only the state of Jobs from the Slurm controller.
+
+        Implements the slurm_load_job_state RPC. Compared to `load()`, the
+        slurmctld only sends a small record with the state for each Job,
+        which is a lot cheaper if nothing else is needed, e.g. when
+        periodically checking whether Jobs have finished.
+
+        !!! note
+
+            Jobs that are unknown to the slurmctld, for example because they
+            have already been purged, are not included in the result.
+
+        Args:
+            job_ids (list[int], optional):
+                The IDs of the Jobs to retrieve the state for. By default,
+                the state of all Jobs is retrieved.
+
+        Returns:
+            (dict[int, str]): A dict where the key is the Job-ID, and the
+                value the state of the Job, for example `RUNNING`.
+
+        Raises:
+            (pyslurm.RPCError): When getting the Job states from the
+                slurmctld failed.
+
+        Examples:
+            >>> import pyslurm
+            >>> states = pyslurm.Jobs.load_states([1, 2])
+            >>> print(states)
+            {1: 'RUNNING', 2: 'PENDING'}
+        """
+        cdef:
+            job_state_response_msg_t *resp = NULL
+            slurm_selected_step_t *selected = NULL
+            int cnt = 0
+            int rc
+            dict out = {}
+
+        if job_ids is not None:
+            job_ids = list(dict.fromkeys(int(job_id) for job_id in job_ids))
+            if not job_ids:
+                return out
+
+            cnt = len(job_ids)
+            selected = <slurm_selected_step_t*>try_xmalloc(
+                    sizeof(slurm_selected_step_t) * cnt)
+            if not selected:
+                raise MemoryError("xmalloc failed for slurm_selected_step_t")
+
+            for i, job_id in enumerate(job_ids):
+                selected[i].step_id.job_id = job_id
+                selected[i].step_id.step_id = slurm.NO_VAL
+                selected[i].step_id.step_het_comp = slurm.NO_VAL
+                selected[i].array_task_id = slurm.NO_VAL
+                selected[i].het_job_offset = slurm.NO_VAL
+                selected[i].array_bitmap = NULL
+
+        try:
+            with nogil:
+                rc = slurm_load_job_state(cnt, selected, &resp)
+            verify_rpc(rc)
+
+            for i in range(resp.jobs_count):
+                out[resp.jobs[i].job_id] = cstr.to_unicode(
+                        slurm_job_state_string(resp.jobs[i].state))
+        finally:
+            xfree(selected)
+            slurm_free_job_state_response_msg(resp)
+
+        return out
 
     def reload(self):
         """Reload the information for jobs in a collection.
@@ -152,7 +420,83 @@ cdef class Jobs(MultiClusterMap):
             (pyslurm.RPCError): When getting the Jobs from the slurmctld
                 failed.
         """
-        return xcollections.multi_reload(self, frozen=self.frozen)
+        return xcollections.multi_reload(
+            self, frozen=self.frozen, user=self.user_ids, lazy=self.lazy,
+            view=self.view, preload_passwd_info=self.passwd is not None)
+
+    def refresh(self):
+        """Incrementally refresh the information for Jobs in a collection.
+
+        Unlike `reload()`, this remembers the time of the last update
+        received from the slurmctld and only asks for new data if something
+        has changed since then. If nothing has changed, no Job instances are
+        recreated and the collection stays as it is.
+
+        If new data is available, the collection is updated in the same way
+        as `reload()` does it, honoring the `frozen` attribute. The options
+        given to `load()` are also applied to the new Jobs, for example the
+        passwd and groups information from `preload_passwd_info`.
+
+        !!! note
+
+            For a collection that was loaded with the `user` argument, the
+            slurmctld can't tell whether something has changed, so the Jobs
+            of these Users are always retrieved again.
+
+        Returns:
+            (bool): `True` if new data was received and the collection was
+                updated, `False` if nothing has changed.
+
+        Raises:
+            (pyslurm.RPCError): When getting the Jobs from the slurmctld
+                failed.
+
+        Examples:
+            >>> import pyslurm
+            >>> jobs = pyslurm.Jobs.load()
+            >>> if jobs.refresh():
+            ...     print("Jobs have changed")
+        """
+        cdef:
+            int flags = slurm.SHOW_ALL | slurm.SHOW_DETAIL
+            dict data
+
+        data = self._load_data(self.last_update, flags)
+        if data is None:
+            return False
+
+        self._clear_indexes()
+
+        if not self.frozen:
+            self.data = data
+        else:
+            for cluster, job_id in list(self.keys().with_cluster()):
+                job = data.get(cluster, {}).get(job_id)
+                if job is not None:
+                    self.data[cluster][job_id] = job
+
+        return True
+
+    cdef _c_column(self, field, list items, np):
+        cdef:
+            c_array.array vals
+            Job job
+            int field_id
+            Py_ssize_t i
+
+        column = _JOB_COLUMNS.get(field)
+        if column is None:
+            return None
+
+        field_id, spec = column
+        vals = _uint_buffer(len(items))
+        for i, item in enumerate(items):
+            if not isinstance(item, Job) or not (<Job>item).ptr:
+                return None
+            job = <Job>item
+            vals.data.as_ulonglongs[i] = _job_column_value(job.ptr, field_id)
+
+        return _uint_column(vals, spec, np)
 
     def load_steps(self):
         """Load all Job steps for this collection of Jobs.
@@ -174,7 +518,7 @@ cdef class Jobs(MultiClusterMap):
             if jid in steps:
                 job.steps = steps[jid]
 
-    def load_stats(self):
+    def load_stats(self, max_workers=1, timeout=None):
         """Load realtime stats for this collection of Jobs.
 
         This function additionally fills in the `stats` attribute for all Jobs
@@ -185,6 +529,18 @@ cdef class Jobs(MultiClusterMap):
 
             Pending Jobs will be ignored, since they don't have any Stats yet.
 
+        Args:
+            max_workers (int, optional):
+                Maximum amount of threads used to retrieve the stats of the
+                Steps concurrently. By default, the stats of each Step are
+                retrieved one after another.
+            timeout (float, optional):
+                Maximum amount of seconds to wait for the stats of a single
+                Step when `max_workers` is greater than 1. Steps whose stats
+                couldn't be retrieved in time are skipped, and a
+                `RuntimeWarning` naming them is emitted. By default, there is
+                no timeout.
+
         Returns:
             (pyslurm.db.JobStatistics): The statistics of this job collection.
 
@@ -199,16 +555,347 @@ cdef class Jobs(MultiClusterMap):
             >>>
             >>> # Print the CPU Time Used
             >>> print(stats.total_cpu_time)
+            >>>
+            >>> # Retrieve the stats of up to 16 Steps at the same time
+            >>> stats = jobs.load_stats(max_workers=16, timeout=5)
         """
         self.load_steps()
+        load_multiple([step for job in self.values()
+                       for step in job.steps.values()], max_workers, timeout)
+
         stats = JobStatistics()
         for job in self.values():
-            job.load_stats()
+            job._sum_step_stats()
             stats.add(job.stats)
 
         self.stats = stats
         return self.stats
 
+    def jobs_by_node(self):
+        """Map the names of nodes to the Jobs that are allocated on them.
+
+        The mapping is built from the node indexes that the slurmctld sends
+        along with each Job, so no nodelists have to be parsed. To translate
+        the indexes into names, the list of nodes is retrieved from the
+        slurmctld once per call.
+
+        !!! note
+
+            Only Jobs from the local Cluster are considered. Pending Jobs are
+            ignored, since they have no nodes allocated yet.
+
+        Returns:
+            (dict[str, list[pyslurm.Job]]): A dict where the key is the name
+                of a node, and the value the Jobs allocated on it, in the
+                same order as in this collection. Nodes without any Jobs are
+                not included.
+
+        Raises:
+            (pyslurm.RPCError): When getting the Nodes from the slurmctld
+                failed.
+
+        Examples:
+            >>> import pyslurm
+            >>> jobs = pyslurm.Jobs.load()
+            >>> by_node = jobs.jobs_by_node()
+            >>> for job in by_node.get("node001", []):
+            ...     print(job.id)
+        """
+        cdef:
+            node_info_msg_t *node_info = NULL
+            uint16_t flags = slurm.SHOW_ALL
+            list names = []
+            dict out = {}
+            Job job
+            int32_t *node_inx
+            int32_t inx
+            Py_ssize_t node_cnt
+            int i, rc
+
+        with nogil:
+            rc = slurm_load_node(0, &node_info, flags)
+        verify_rpc(rc)
+
+        # The node indexes of a Job refer to the position of a node in the
+        # node table of the slurmctld, which is the same order in which the
+        # nodes are returned.
+        try:
+            for i in range(node_info.record_count):
+                names.append(cstr.to_unicode(node_info.node_array[i].name))
+        finally:
+            slurm_free_node_info_msg(node_info)
+
+        node_cnt = len(names)
+        for job in self.values():
+            node_inx = job.ptr.node_inx
+            if not node_inx or job.cluster != settings.LOCAL_CLUSTER:
+                continue
+
+            # node_inx contains pairs of start and end indexes (inclusive),
+            # and is terminated by -1
+            i = 0
+            while node_inx[i] != -1:
+                for inx in range(node_inx[i], node_inx[i+1] + 1):
+                    if inx >= node_cnt or not names[inx]:
+                        continue
+
+                    name = names[inx]
+                    if name not in out:
+                        out[name] = []
+                    out[name].append(job)
+                i += 2
+
+        return out
+
+    def resource_layouts(self, nodes=None):
+        """Retrieve the CPU layout of all Jobs in this collection.
+
+        Compared to calling `Job.get_resource_layout_per_node()` for each
+        Job, the threads per core of each node are only determined once, and
+        the CPU-IDs are returned as compact arrays instead of formatted
+        strings.
+
+        !!! note
+
+            Only Jobs from the local Cluster are considered. Pending Jobs are
+            ignored, since they have no resources allocated yet.
+
+        Args:
+            nodes (pyslurm.Nodes, optional):
+                A snapshot of the Nodes, used to determine the threads per
+                core on each node. By default, the Nodes are retrieved from
+                the slurmctld once per call.
+
+        Returns:
+            (dict[int, dict[str, array.array]]): A dict where the key is the
+                Job-ID, and the value a dict which maps the name of each node
+                allocated to the Job to the IDs of the CPUs allocated on it.
+
+        Raises:
+            (pyslurm.RPCError): When getting the Nodes from the slurmctld
+                failed.
+
+        Examples:
+            >>> import pyslurm
+            >>> jobs = pyslurm.Jobs.load()
+            >>> layouts = jobs.resource_layouts()
+            >>> print(list(layouts[1]["node001"]))
+            [0, 1, 2, 3]
+        """
+        cdef:
+            dict threads = _node_threads(nodes)
+            dict out = {}
+            Job job
+
+        for job in self.values():
+            if job.cluster != settings.LOCAL_CLUSTER:
+                continue
+
+            layout = _cpu_layout(<slurm.job_resources*>job.ptr.job_resrcs,
+                                 threads)
+            if layout is not None:
+                out[job.id] = layout
+
+        return out
+
+    def send_signal(self, signal, steps="children", hurry=False):
+        """Send a signal to all Jobs in this collection.
+
+        Implements the slurm_kill_jobs RPC. Unlike calling `send_signal()`
+        on each Job, all Jobs are signaled with a single request to the
+        slurmctld.
+
+        Args:
+            signal (Union[str, int]):
+                Any valid signal which will be sent to the Jobs. Can be either
+                a str like `SIGUSR1`, or simply an [int][].
+            steps (str):
+                Selects which steps should be signaled. Valid values for this
+                are: `all`, `batch` and `children`. The default value is
+                `children`, where all steps except the batch-step will be
+                signaled.
+                The value `batch` in contrast means, that only the batch-step
+                will be signaled. With `all` every step is signaled.
+            hurry (bool):
+                If True, no burst buffer data will be staged out. The default
+                value is False.
+
+        Returns:
+            (dict[int, int]): The result for each Job, where the key is the
+                Job-ID and the value a Slurm error code. An error code of `0`
+                means success. The error codes can be translated with
+                `pyslurm.error.slurm_strerror()`.
+
+        Raises:
+            (pyslurm.RPCError): When the request to the slurmctld failed as
+                a whole.
+
+        Examples:
+            >>> import pyslurm
+            >>> jobs = pyslurm.Jobs.load(user="alice")
+            >>> results = jobs.send_signal("SIGUSR1")
+            >>> for job_id, errno in results.items():
+            ...     if errno:
+            ...         print(job_id, pyslurm.error.slurm_strerror(errno))
+        """
+        cdef:
+            kill_jobs_msg_t msg
+            list job_ids = [str(job_id).encode()
+                            for job_id in dict.fromkeys(self.keys())]
+            bytes job_id
+
+        if not job_ids:
+            return {}
+
+        _init_kill_jobs_msg(&msg, signal, steps, hurry)
+        try:
+            msg.jobs_array = <char**>try_xmalloc(sizeof(char*) * len(job_ids))
+            if not msg.jobs_array:
+                raise MemoryError("xmalloc failed for jobs_array")
+
+            # The strings are still owned by job_ids, which is alive until
+            # the request is done.
+            for i, job_id in enumerate(job_ids):
+                msg.jobs_array[i] = job_id
+            msg.jobs_cnt = len(job_ids)
+
+            return _kill_jobs(&msg)
+        finally:
+            _free_kill_jobs_msg_members(&msg)
+
+    def cancel(self):
+        """Cancel all Jobs in this collection.
+
+        Implements the slurm_kill_jobs RPC. Unlike calling `cancel()` on
+        each Job, all Jobs are cancelled with a single request to the
+        slurmctld.
+
+        Returns:
+            (dict[int, int]): The result for each Job, see `send_signal()`.
+
+        Raises:
+            (pyslurm.RPCError): When the request to the slurmctld failed as
+                a whole.
+
+        Examples:
+            >>> import pyslurm
+            >>> jobs = pyslurm.Jobs.load(user="alice")
+            >>> results = jobs.cancel()
+        """
+        return self.send_signal(9)
+
+    @staticmethod
+    def send_signal_matching(signal, user=None, account=None, partition=None,
+                             qos=None, reservation=None, state=None,
+                             name=None, wckey=None, nodes=None,
+                             steps="children", hurry=False):
+        """Send a signal to all Jobs matching the given criteria.
+
+        Implements the slurm_kill_jobs RPC. The Jobs are selected by the
+        slurmctld, so they don't have to be loaded first. A Job must match
+        all the given criteria.
+
+        Args:
+            signal (Union[str, int]):
+                Any valid signal which will be sent to the Jobs. Can be either
+                a str like `SIGUSR1`, or simply an [int][].
+            user (Union[str, int], optional):
+                Only Jobs of this User, either by name or UID.
+            account (str, optional):
+                Only Jobs running under this Account.
+            partition (str, optional):
+                Only Jobs in this Partition.
+            qos (str, optional):
+                Only Jobs with this QoS.
+            reservation (str, optional):
+                Only Jobs in this Reservation.
+            state (str, optional):
+                Only Jobs in this state, for example `PENDING` or `RUNNING`.
+            name (str, optional):
+                Only Jobs with this name.
+            wckey (str, optional):
+                Only Jobs with this WCKey.
+            nodes (Union[str, list[str]], optional):
+                Only Jobs running on these nodes.
+            steps (str):
+                Selects which steps should be signaled. See `send_signal()`.
+            hurry (bool):
+                If True, no burst buffer data will be staged out. The default
+                value is False.
+
+        Returns:
+            (dict[int, int]): The result for each Job, see `send_signal()`.
+
+        Raises:
+            (pyslurm.RPCError): When the request to the slurmctld failed as
+                a whole.
+            (ValueError): When no criteria were given, or the state is
+                invalid.
+
+        Examples:
+            >>> import pyslurm
+            >>> results = pyslurm.Jobs.send_signal_matching(
+            ...     "SIGUSR1", user="alice", partition="debug")
+        """
+        cdef kill_jobs_msg_t msg
+
+        if all(val is None for val in (user, account, partition, qos,
+                                       reservation, state, name, wckey,
+                                       nodes)):
+            raise ValueError("At least one criteria to select the Jobs "
+                             "must be given.")
+
+        _init_kill_jobs_msg(&msg, signal, steps, hurry)
+        try:
+            if user is not None:
+                msg.user_id = user_to_uid(user)
+                cstr.fmalloc(&msg.user_name, uid_to_name(msg.user_id))
+
+            if state is not None:
+                msg.state = _job_state_from_str(state)
+
+            if nodes is not None and not isinstance(nodes, str):
+                nodes = ",".join(nodes)
+
+            cstr.fmalloc(&msg.account, account)
+            cstr.fmalloc(&msg.partition, partition)
+            cstr.fmalloc(&msg.qos, qos)
+            cstr.fmalloc(&msg.reservation, reservation)
+            cstr.fmalloc(&msg.job_name, name)
+            cstr.fmalloc(&msg.wckey, wckey)
+            cstr.fmalloc(&msg.nodelist, nodes)
+
+            return _kill_jobs(&msg)
+        finally:
+            _free_kill_jobs_msg_members(&msg)
+
+    @staticmethod
+    def cancel_matching(**kwargs):
+        """Cancel all Jobs matching the given criteria.
+
+        Implements the slurm_kill_jobs RPC.
+
+        Args:
+            **kwargs (Any):
+                The criteria to select the Jobs. See `send_signal_matching()`
+                for the valid values.
+
+        Returns:
+            (dict[int, int]): The result for each Job, see `send_signal()`.
+
+        Raises:
+            (pyslurm.RPCError): When the request to the slurmctld failed as
+                a whole.
+            (ValueError): When no criteria were given, or the state is
+                invalid.
+
+        Examples:
+            >>> import pyslurm
+            >>> results = pyslurm.Jobs.cancel_matching(user="alice",
+            ...                                        state="PENDING")
+        """
+        return Jobs.send_signal_matching(9, **kwargs)
+
     @property
     def memory(self):
         return xcollections.sum_property(self, Job.memory)
@@ -228,6 +915,9 @@ cdef class Jobs(MultiClusterMap):
 
 cdef class Job:
 
+    # Not part of the Job's data, so it is left out of to_dict().
+    _dict_exclude = frozenset(("is_view",))
+
     def __cinit__(self):
         self.ptr = NULL
 
@@ -248,8 +938,13 @@ cdef class Job:
                 raise MemoryError("xmalloc failed for job_info_t")
 
     def _dealloc_impl(self):
-        slurm_free_job_info(self.ptr)
+        # A view doesn't own its data, the shared response is released once
+        # no Job references it anymore.
+        if not self._view:
+            slurm_free_job_info(self.ptr)
         self.ptr = NULL
+        self._view = False
+        self._owner = None
 
     def __dealloc__(self):
         self._dealloc_impl()
@@ -286,9 +981,13 @@ cdef class Job:
         cdef:
             job_info_msg_t *info = NULL
             Job wrap = None
+            uint32_t _job_id = job_id
+            int rc
 
         try:
-            verify_rpc(slurm_load_job(&info, job_id, slurm.SHOW_DETAIL))
+            with nogil:
+                rc = slurm_load_job(&info, _job_id, slurm.SHOW_DETAIL)
+            verify_rpc(rc)
 
             if info and info.record_count:
                 wrap = Job.from_ptr(&info.job_array[0])
@@ -322,23 +1021,88 @@ cdef class Job:
         memcpy(wrap.ptr, in_ptr, sizeof(slurm_job_info_t))
         return wrap
 
+    @staticmethod
+    cdef Job from_view(_JobInfoMsg msg, int idx):
+        cdef Job wrap = Job.__new__(Job)
+        wrap.ptr = &msg.ptr.job_array[idx]
+        wrap._view = True
+        wrap._owner = msg
+        wrap.passwd = {}
+        wrap.groups = {}
+        wrap.steps = JobSteps.__new__(JobSteps)
+        wrap.stats = JobStatistics()
+        wrap.pids = {}
+        return wrap
+
     cdef _swap_data(Job dst, Job src):
         cdef slurm_job_info_t *tmp = NULL
         if dst.ptr and src.ptr:
             tmp = dst.ptr
             dst.ptr = src.ptr
             src.ptr = tmp
+            dst._view, src._view = src._view, dst._view
+            dst._owner, src._owner = src._owner, dst._owner
+
+    def detach(self):
+        """Make this Job independent of the response it was loaded with.
+
+        This is only needed for Jobs that were loaded with
+        `Jobs.load(view=True)`. Afterwards, the Job no longer keeps the
+        shared response of the slurmctld alive. For all other Jobs, this
+        does nothing.
+
+        Returns:
+            (pyslurm.Job): Returns self
+
+        Raises:
+            (MemoryError): When allocating memory for the Job failed.
+
+        Examples:
+            >>> import pyslurm
+            >>> jobs = pyslurm.Jobs.load(view=True)
+            >>> job = jobs[1].detach()
+            >>> del jobs
+        """
+        cdef slurm_job_info_t *ptr = NULL
+
+        if not self._view:
+            return self
+
+        ptr = <slurm_job_info_t*>try_xmalloc(sizeof(slurm_job_info_t))
+        if not ptr:
+            raise MemoryError("xmalloc failed for job_info_t")
+
+        # The Job takes over the data. Its entry in the response is zeroed,
+        # so the data is not free'd twice.
+        memcpy(ptr, self.ptr, sizeof(slurm_job_info_t))
+        memset(self.ptr, 0, sizeof(slurm_job_info_t))
+        self.ptr = ptr
+        self._view = False
+        self._owner = None
+        return self
+
+    @property
+    def is_view(self):
+        return self._view
 
     def as_dict(self):
         return self.to_dict()
 
-    def to_dict(self, recursive = False):
+    def to_dict(self, recursive = False, fields=None):
         """Job information formatted as a dictionary.
 
+        Args:
+            recursive (bool, optional):
+                Whether nested objects should also be converted to dicts.
+                The default is `False`.
+            fields (list[str], optional):
+                Only include these attributes, in the given order. By
+                default, all attributes are included.
+
         Returns:
             (dict): Job information as dict
         """
-        return instance_to_dict(self, recursive)
+        return instance_to_dict(self, recursive, fields)
 
     def send_signal(self, signal, steps="children", hurry=False):
         """Send a signal to a running Job.
@@ -373,18 +1137,14 @@ cdef class Job:
 
             >>> Job(9999).send_signal(9)
         """
-        cdef uint16_t flags = 0
-
-        if steps.casefold() == "all":
-            flags |= slurm.KILL_FULL_JOB
-        elif steps.casefold() == "batch":
-            flags |= slurm.KILL_JOB_BATCH
-
-        if hurry:
-            flags |= slurm.KILL_HURRY
+        cdef:
+            uint16_t flags = _kill_flags(steps, hurry)
+            uint32_t job_id = self.id
+            uint16_t sig
 
         sig = signal_to_num(signal)
-        slurm_kill_job(self.id, sig, flags)
+        with nogil:
+            slurm_kill_job(job_id, sig, flags)
 
         # Ignore errors when the Job is already done or when SIGKILL was
         # specified and the job id is already purged from slurmctlds memory.
@@ -463,9 +1223,13 @@ cdef class Job:
             >>> changes = pyslurm.JobSubmitDescription(time_limit="20-00:00:00")
             >>> pyslurm.Job(9999).modify(changes)
         """
+        cdef int rc
+
         changes._create_job_submit_desc(is_update=True)
         changes.ptr.step_id.job_id = self.id
-        verify_rpc(slurm_update_job(changes.ptr))
+        with nogil:
+            rc = slurm_update_job(changes.ptr)
+        verify_rpc(rc)
 
     def hold(self, mode=None):
         """Hold a currently pending Job, preventing it from being scheduled.
@@ -558,12 +1322,24 @@ cdef class Job:
         """
         verify_rpc(slurm_notify_job(self.id, msg))
 
-    def load_stats(self):
+    def load_stats(self, max_workers=1, timeout=None):
         """Load realtime statistics for a Job and its steps.
 
         Calling this function returns the Job statistics, and additionally
         populates the `stats` and `pids` attribute of the instance.
 
+        Args:
+            max_workers (int, optional):
+                Maximum amount of threads used to retrieve the stats of the
+                Steps concurrently. By default, the stats of each Step are
+                retrieved one after another.
+            timeout (float, optional):
+                Maximum amount of seconds to wait for the stats of a single
+                Step when `max_workers` is greater than 1. Steps whose stats
+                couldn't be retrieved in time are skipped, and a
+                `RuntimeWarning` naming them is emitted. By default, there is
+                no timeout.
+
         Returns:
             (pyslurm.db.JobStatistics): The statistics of the job.
 
@@ -586,9 +1362,12 @@ cdef class Job:
             job = Job.load(self.id)
             self.steps = job.steps
 
+        load_multiple(list(self.steps.values()), max_workers, timeout)
+        return self._sum_step_stats()
+
+    def _sum_step_stats(self):
         all_pids = {}
         for step in self.steps.values():
-            step.load_stats()
             self.stats._sum_steps(step.stats)
 
             for node, pids in step.pids.items():
@@ -654,7 +1433,9 @@ cdef class Job:
         req.msg_type = slurm.REQUEST_BATCH_SCRIPT
         req.data = &msg
 
-        rc = slurm_send_recv_controller_msg(&req, &resp, working_cluster_rec)
+        with nogil:
+            rc = slurm_send_recv_controller_msg(&req, &resp,
+                                                working_cluster_rec)
         verify_rpc(rc)
 
         if resp.msg_type == slurm.RESPONSE_BATCH_SCRIPT:
@@ -1379,17 +2160,30 @@ cdef class Job:
     def slurm_protocol_version(self):
         return u16_parse(self.ptr.start_protocol_ver)
 
-    def get_resource_layout_per_node(self):
+    def get_resource_layout_per_node(self, nodes=None):
         """Retrieve the resource layout of this Job on each node.
 
         !!! warning
 
             Return type may still be subject to change in the future
 
+        Args:
+            nodes (pyslurm.Nodes, optional):
+                A snapshot of the Nodes, used to determine the threads per
+                core on each node. By default, only the Nodes allocated to
+                this Job are retrieved from the slurmctld, on every call.
+                When calling this for many Jobs, load the Nodes once and
+                pass them in, or use `pyslurm.Jobs.resource_layouts()`.
+
         Returns:
             (dict): Resource layout, where the key is the name of the node and
                 the value another dict with the keys `cpu_ids`, `memory` and
                 `gres`.
+
+        Raises:
+            (pyslurm.RPCError): When getting the Nodes from the slurmctld
+                failed.
+            (ValueError): When the nodelist of the Job could not be parsed.
         """
         # The code for this function is a modified reimplementation from here:
         # https://github.com/SchedMD/slurm/blob/d525b6872a106d32916b33a8738f12510ec7cf04/src/api/job_info.c#L739
@@ -1428,10 +2222,17 @@ cdef class Job:
             char cpu_bitmap_str[128]
             uint32_t threads
             dict output = {}
+            dict node_threads
 
         if not resources or not resources.core_bitmap:
             return output
 
+        if nodes is None:
+            # Only the Nodes of this Job are needed, not the whole node table.
+            nodes = Nodes.load(names=cstr.to_unicode(resources.nodes),
+                               partitions=False)
+        node_threads = _node_threads(nodes)
+
         hl = slurm.slurm_hostlist_create(resources.nodes)
         if not hl:
             raise ValueError("Unable to create hostlist.")
@@ -1454,7 +2255,7 @@ cdef class Job:
 
             # Calculate the amount of threads per core this job has on the
             # specific host.
-            threads = _threads_per_core(host)
+            threads = _threads_per_core(host, node_threads)
 
             # Allocate a new, big enough cpu bitmap
             cpu_bitmap = slurm.slurm_bit_alloc(bit_reps * threads)
@@ -1494,7 +2295,268 @@ cdef class Job:
         return output
 
 
+cdef uint16_t _kill_flags(steps, hurry):
+    cdef uint16_t flags = 0
+
+    if steps.casefold() == "all":
+        flags |= slurm.KILL_FULL_JOB
+    elif steps.casefold() == "batch":
+        flags |= slurm.KILL_JOB_BATCH
+
+    if hurry:
+        flags |= slurm.KILL_HURRY
+
+    return flags
+
+
+cdef _init_kill_jobs_msg(kill_jobs_msg_t *msg, signal, steps, hurry):
+    memset(msg, 0, sizeof(kill_jobs_msg_t))
+    msg.signal = signal_to_num(signal)
+    # KILL_JOBS_VERBOSE makes the slurmctld report a result for every Job,
+    # not just for the ones that failed.
+    msg.flags = _kill_flags(steps, hurry) | slurm.KILL_JOBS_VERBOSE
+    msg.state = slurm.JOB_END
+    msg.user_id = slurm.NO_VAL
+
+
+cdef _free_kill_jobs_msg_members(kill_jobs_msg_t *msg):
+    # The strings in jobs_array are not owned by the msg.
+    xfree(msg.jobs_array)
+    xfree(msg.account)
+    xfree(msg.partition)
+    xfree(msg.qos)
+    xfree(msg.reservation)
+    xfree(msg.job_name)
+    xfree(msg.wckey)
+    xfree(msg.nodelist)
+    xfree(msg.user_name)
+
+
+cdef dict _kill_jobs(kill_jobs_msg_t *msg):
+    cdef:
+        kill_jobs_resp_msg_t *resp = NULL
+        kill_jobs_resp_job_t *job_resp
+        dict out = {}
+        int rc
+
+    with nogil:
+        rc = slurm_kill_jobs(msg, &resp)
+
+    try:
+        verify_rpc(rc)
+        for i in range(resp.jobs_cnt if resp else 0):
+            job_resp = &resp.job_responses[i]
+            job_id = job_resp.real_job_id
+            if not job_id and job_resp.id:
+                job_id = job_resp.id.step_id.job_id
+            out[job_id] = job_resp.error_code
+    finally:
+        slurm_free_kill_jobs_response_msg(resp)
+
+    return out
+
+
+def _job_state_from_str(state):
+    cdef uint32_t inx
+
+    for inx in range(slurm.JOB_END):
+        if cstr.to_unicode(slurm_job_state_string(inx)) == state.upper():
+            return inx
+
+    raise ValueError(f"Invalid Job state: {state}")
+
+
+cdef class _JobInfoMsg:
+
+    def __cinit__(self):
+        self.ptr = NULL
+
+    def __dealloc__(self):
+        slurm_free_job_info_msg(self.ptr)
+
+    cdef Job wrap(self, int idx):
+        cdef:
+            slurm_job_info_t tmp_info
+            Job job
+
+        if self.views:
+            return Job.from_view(self, idx)
+
+        job = Job.from_ptr(&self.ptr.job_array[idx])
+
+        # The Job now owns the data. Replace it with a zeroed-out
+        # slurm_job_info_t to prevent a double free when the response is
+        # released.
+        memset(&tmp_info, 0, sizeof(slurm_job_info_t))
+        self.ptr.job_array[idx] = tmp_info
+        return job
+
+
+cdef class _LazyJobsDict(dict):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.passwd = {}
+        self.groups = {}
+
+    cdef Job _wrap(self, key, tuple ref):
+        cdef:
+            _JobInfoMsg msg = ref[0]
+            Job job = msg.wrap(ref[1])
+
+        job.passwd = self.passwd
+        job.groups = self.groups
+        dict.__setitem__(self, key, job)
+        return job
+
+    cdef _wrap_all(self):
+        for key, val in dict.items(self):
+            if isinstance(val, tuple):
+                self._wrap(key, val)
+
+    def __getitem__(self, key):
+        val = dict.__getitem__(self, key)
+        if isinstance(val, tuple):
+            return self._wrap(key, val)
+        return val
+
+    # Having a custom __iter__ also makes sure that dict.update() and {**x}
+    # go through __getitem__, instead of copying the raw values.
+    def __iter__(self):
+        return dict.__iter__(self)
+
+    def __eq__(self, other):
+        self._wrap_all()
+        return dict.__eq__(self, other)
+
+    def __repr__(self):
+        self._wrap_all()
+        return dict.__repr__(self)
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        dict.__setitem__(self, key, default)
+        return default
+
+    def pop(self, key, *args):
+        if key in self:
+            val = self[key]
+            dict.__delitem__(self, key)
+            return val
+        return dict.pop(self, key, *args)
+
+    def popitem(self):
+        key, val = dict.popitem(self)
+        if isinstance(val, tuple):
+            val = self._wrap(key, val)
+            dict.__delitem__(self, key)
+        return key, val
+
+    def values(self):
+        self._wrap_all()
+        return dict.values(self)
+
+    def items(self):
+        self._wrap_all()
+        return dict.items(self)
+
+    def copy(self):
+        self._wrap_all()
+        return dict(dict.items(self))
+
+
 # https://github.com/SchedMD/slurm/blob/d525b6872a106d32916b33a8738f12510ec7cf04/src/api/job_info.c#L99
-cdef _threads_per_core(char *host):
-    # TODO
-    return 1
+cdef uint32_t _threads_per_core(char *host, dict node_threads):
+    if not host:
+        return 1
+
+    return node_threads.get(cstr.to_unicode(host), 1)
+
+
+cdef dict _node_threads(nodes=None):
+    cdef:
+        node_info_msg_t *node_info = NULL
+        uint16_t flags = slurm.SHOW_ALL
+        uint16_t threads
+        dict out = {}
+        int rc
+
+    if nodes is not None:
+        for node in nodes.values():
+            out[node.name] = node.threads_per_core or 1
+        return out
+
+    with nogil:
+        rc = slurm_load_node(0, &node_info, flags)
+    verify_rpc(rc)
+
+    try:
+        for i in range(node_info.record_count):
+            if not node_info.node_array[i].name:
+                continue
+
+            threads = node_info.node_array[i].threads
+            if not threads or threads == slurm.NO_VAL16:
+                threads = 1
+            out[cstr.to_unicode(node_info.node_array[i].name)] = threads
+    finally:
+        slurm_free_node_info_msg(node_info)
+
+    return out
+
+
+cdef _cpu_layout(slurm.job_resources *resources, dict node_threads):
+    # Same walk over the core bitmap as in get_resource_layout_per_node(),
+    # but the CPU-IDs are collected directly, without a bitmap per node.
+    cdef:
+        slurm.hostlist_t *hl
+        char *host
+        uint32_t rel_node_inx
+        int bit_inx = 0
+        int bit_reps = 0
+        int sock_inx = 0
+        uint32_t sock_reps = 0
+        uint32_t threads
+        uint32_t k
+        int j
+        dict output = {}
+
+    if not resources or not resources.core_bitmap:
+        return None
+
+    hl = slurm.slurm_hostlist_create(resources.nodes)
+    if not hl:
+        raise ValueError("Unable to create hostlist.")
+
+    try:
+        for rel_node_inx in range(resources.nhosts):
+            if sock_reps >= resources.sock_core_rep_count[sock_inx]:
+                sock_inx += 1
+                sock_reps = 0
+            sock_reps += 1
+
+            host = slurm.slurm_hostlist_shift(hl)
+            bit_reps = (resources.sockets_per_node[sock_inx]
+                        * resources.cores_per_socket[sock_inx])
+            threads = _threads_per_core(host, node_threads)
+
+            cpu_ids = array("I")
+            for j in range(bit_reps):
+                if slurm.slurm_bit_test(resources.core_bitmap, bit_inx):
+                    for k in range(threads):
+                        cpu_ids.append(j*threads + k)
+                bit_inx += 1
+
+            if host:
+                output[cstr.to_unicode(host)] = cpu_ids
+            free(host)
+    finally:
+        slurm.slurm_hostlist_destroy(hl)
+
+    return output
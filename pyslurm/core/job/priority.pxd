@@ -0,0 +1,126 @@
+#########################################################################
+# job/priority.pxd - interface to retrieve slurm job priority factors
+#########################################################################
+# Copyright (C) 2026 Toni Harzendorf <toni.harzendorf@gmail.com>
+#
+# This file is part of PySlurm
+#
+# PySlurm is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+
+# PySlurm is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with PySlurm; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# cython: c_string_type=unicode, c_string_encoding=default
+# cython: language_level=3
+
+from libc.stdint cimport uint32_t
+from pyslurm cimport slurm
+from pyslurm.slurm cimport (
+    priority_factors_t,
+    priority_factors_object_t,
+    priority_factors_response_msg_t,
+    slurm_load_job_prio,
+    slurm_free_priority_factors_response_msg,
+)
+from pyslurm.utils cimport cstr
+from pyslurm.db.util cimport SlurmList, SlurmListItem
+from pyslurm.xcollections cimport MultiClusterMap
+
+
+cdef class JobPriorityFactors(MultiClusterMap):
+    """A [`Multi Cluster`][pyslurm.xcollections.MultiClusterMap] collection
+    of [pyslurm.JobPriorityFactor][] objects.
+
+    The keys of the collection are the Job IDs. This is the same information
+    that `sprio` shows, except that `sprio` shows one row per Partition for
+    Jobs pending in multiple Partitions, while this collection only holds
+    one item per Job. See [pyslurm.JobPriorityFactors.load][] for which one
+    is kept.
+
+    Args:
+        factors (Union[list[int], dict, str], optional=None):
+            Priority factors to initialize this collection with. A dict maps
+            the Job IDs to [pyslurm.JobPriorityFactor][] objects.
+    """
+    pass
+
+
+cdef class JobPriorityFactor:
+    """The priority factors of a pending Job.
+
+    All factors are already multiplied with their configured weight.
+
+    Args:
+        job_id (int, optional=None):
+            The ID of the Job.
+
+    Attributes:
+        job_id (int):
+            The ID of the Job.
+        cluster (str):
+            Name of the Cluster the Job belongs to.
+        user_id (int):
+            UID of the User who owns the Job.
+        user_name (str):
+            Name of the User who owns the Job.
+        account (str):
+            Account of the Job.
+        partition (str):
+            Partition for which the factors were calculated.
+        qos (str):
+            QoS of the Job.
+        priority (int):
+            The resulting priority of the Job. This is the sum of all factors,
+            minus the nice value, or the priority that was set directly.
+        is_direct (bool):
+            Whether the priority of the Job was set directly, for example by
+            an administrator. In this case the factors have no influence.
+        age (float):
+            Age factor.
+        association (float):
+            Association factor.
+        fairshare (float):
+            Fair-share factor.
+        job_size (float):
+            Job size factor.
+        partition_factor (float):
+            Partition factor.
+        qos_factor (float):
+            QoS factor.
+        site (int):
+            Site factor.
+        tres (dict[str, float]):
+            TRES factors, by the name of the TRES.
+        nice (int):
+            Nice value of the Job.
+    """
+    cdef readonly:
+        job_id
+        cluster
+        user_id
+        account
+        partition
+        qos
+        priority
+        is_direct
+        age
+        association
+        fairshare
+        job_size
+        partition_factor
+        qos_factor
+        site
+        tres
+        nice
+
+    @staticmethod
+    cdef JobPriorityFactor from_ptr(priority_factors_object_t *in_ptr)
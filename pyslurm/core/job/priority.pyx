@@ -0,0 +1,207 @@
+#########################################################################
+# job/priority.pyx - interface to retrieve slurm job priority factors
+#########################################################################
+# Copyright (C) 2026 Toni Harzendorf <toni.harzendorf@gmail.com>
+#
+# This file is part of PySlurm
+#
+# PySlurm is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+
+# PySlurm is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with PySlurm; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# cython: c_string_type=unicode, c_string_encoding=default
+# cython: language_level=3
+
+from pyslurm import settings
+from pyslurm.core.error import verify_rpc
+from pyslurm.utils.helpers import instance_to_dict, uid_to_name
+from pyslurm.xcollections import _import_numpy, _typed_array
+
+
+cdef class JobPriorityFactors(MultiClusterMap):
+
+    def __init__(self, factors=None):
+        super().__init__(data=factors,
+                         typ="JobPriorityFactors",
+                         val_type=JobPriorityFactor,
+                         id_attr=JobPriorityFactor.job_id,
+                         key_type=int)
+
+    @staticmethod
+    def load():
+        """Load the priority factors of all pending Jobs.
+
+        All factors are retrieved with a single request to the slurmctld.
+        A Job that is pending in multiple Partitions has factors for each of
+        them, and `sprio` shows one row for each. This collection however is
+        keyed by the Job ID, so only the factors of the Partition in which
+        the Job has the highest priority are kept, and the factors for its
+        other Partitions are dropped. Check the `partition` attribute to see
+        which Partition the factors belong to.
+
+        Returns:
+            (pyslurm.JobPriorityFactors): Collection of
+                [pyslurm.JobPriorityFactor][] objects.
+
+        Raises:
+            (pyslurm.RPCError): When getting the priority factors from the
+                slurmctld failed.
+
+        Examples:
+            >>> import pyslurm
+            >>> factors = pyslurm.JobPriorityFactors.load()
+            >>> columns = factors.to_columns(["job_id", "age", "fairshare"])
+        """
+        cdef:
+            JobPriorityFactors factors = JobPriorityFactors()
+            priority_factors_response_msg_t *resp = NULL
+            SlurmListItem item
+            JobPriorityFactor factor
+            int rc
+
+        with nogil:
+            rc = slurm_load_job_prio(&resp, 0)
+
+        try:
+            verify_rpc(rc)
+            for item in SlurmList.wrap(resp.priority_factors_list, owned=False):
+                factor = JobPriorityFactor.from_ptr(
+                        <priority_factors_object_t*>item.data)
+
+                cluster = factor.cluster
+                if cluster not in factors.data:
+                    factors.data[cluster] = {}
+
+                # Only one Partition per Job can be kept, see above.
+                other = factors.data[cluster].get(factor.job_id)
+                if other is None or factor.priority > other.priority:
+                    factors.data[cluster][factor.job_id] = factor
+        finally:
+            slurm_free_priority_factors_response_msg(resp)
+
+        return factors
+
+    def tres_to_columns(self, tres=None):
+        """Export the TRES factors as one column per TRES.
+
+        Args:
+            tres (list[str], optional=None):
+                Names of the TRES to export, for example `cpu` or
+                `gres/gpu`. By default, all TRES that occur in any of the
+                items are exported.
+
+        Returns:
+            (dict[str, Union[numpy.ndarray, array.array]]): The factor of
+                each item for each TRES, in the same order as `to_columns()`.
+                The factor is `0.0` if an item has none for a TRES.
+
+        Examples:
+            >>> import pyslurm
+            >>> factors = pyslurm.JobPriorityFactors.load()
+            >>> columns = factors.tres_to_columns(["cpu", "mem"])
+        """
+        items = list(self.values())
+        if tres is None:
+            tres = {}
+            for item in items:
+                tres.update(dict.fromkeys(item.tres))
+
+        np = _import_numpy()
+        return {
+            name: _typed_array([item.tres.get(name, 0.0) for item in items],
+                               "d", np)
+            for name in tres
+        }
+
+
+cdef class JobPriorityFactor:
+
+    def __init__(self, job_id=None):
+        self.job_id = job_id
+        self.cluster = settings.LOCAL_CLUSTER
+        self.tres = {}
+
+    def __repr__(self):
+        return f'pyslurm.{self.__class__.__name__}({self.job_id})'
+
+    @staticmethod
+    cdef JobPriorityFactor from_ptr(priority_factors_object_t *in_ptr):
+        cdef:
+            JobPriorityFactor wrap = JobPriorityFactor.__new__(
+                JobPriorityFactor)
+            priority_factors_t *prio = in_ptr.prio_factors
+            double total = 0
+
+        wrap.job_id = in_ptr.job_id
+        wrap.cluster = cstr.to_unicode(in_ptr.cluster_name)
+        if not wrap.cluster:
+            wrap.cluster = settings.LOCAL_CLUSTER
+
+        wrap.user_id = in_ptr.user_id
+        wrap.account = cstr.to_unicode(in_ptr.account)
+        wrap.partition = cstr.to_unicode(in_ptr.partition)
+        wrap.qos = cstr.to_unicode(in_ptr.qos)
+        wrap.tres = {}
+
+        if not prio:
+            wrap.is_direct = in_ptr.direct_prio > 0
+            wrap.priority = int(in_ptr.direct_prio)
+            return wrap
+
+        wrap.age = prio.priority_age
+        wrap.association = prio.priority_assoc
+        wrap.fairshare = prio.priority_fs
+        wrap.job_size = prio.priority_js
+        wrap.partition_factor = prio.priority_part
+        wrap.qos_factor = prio.priority_qos
+        wrap.site = prio.priority_site
+        wrap.nice = <int>prio.nice - slurm.NICE_OFFSET
+
+        for i in range(prio.tres_cnt):
+            if prio.tres_names and prio.tres_names[i]:
+                wrap.tres[cstr.to_unicode(prio.tres_names[i])] = \
+                    prio.priority_tres[i]
+
+        # Same calculation as sprio does.
+        if in_ptr.direct_prio > 0:
+            wrap.is_direct = True
+            wrap.priority = int(in_ptr.direct_prio)
+        else:
+            total = (wrap.age + wrap.association + wrap.fairshare
+                     + wrap.job_size + wrap.partition_factor + wrap.qos_factor
+                     + wrap.site - wrap.nice + sum(wrap.tres.values()))
+            wrap.is_direct = False
+            # Priority 0 is reserved for held Jobs.
+            wrap.priority = int(max(total, 1))
+
+        return wrap
+
+    @property
+    def user_name(self):
+        return uid_to_name(self.user_id) if self.user_id is not None else None
+
+    def to_dict(self, recursive=False, fields=None):
+        """Job priority factors formatted as a dictionary.
+
+        Args:
+            recursive (bool, optional):
+                Whether nested objects should also be converted to dicts.
+                The default is `False`.
+            fields (list[str], optional):
+                Only include these attributes, in the given order. By
+                default, all attributes are included.
+
+        Returns:
+            (dict): Priority factors as dict
+        """
+        return instance_to_dict(self, recursive, fields)
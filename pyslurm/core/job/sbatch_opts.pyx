@@ -23,9 +23,11 @@
 # cython: language_level=3
 
 import re
+import hashlib
 from pathlib import Path
 
 SBATCH_MAGIC = "#SBATCH"
+DIRECTIVE_CACHE_SIZE = 1024
 
 
 class SbatchOpt():
@@ -196,26 +198,81 @@ def _parse_line(line):
     return opt, val
 
 
-def _find_opt(opt):
+def _build_opt_table():
+    table = {}
     for sbopt in SBATCH_OPTIONS:
-        # Check if we can find the option in our predefined mapping.
-        if opt == sbopt.short_opt or opt == sbopt.long_opt:
-            return sbopt
+        # The first definition of an option wins.
+        if sbopt.short_opt is not None:
+            table.setdefault(sbopt.short_opt, sbopt)
+        if sbopt.long_opt is not None:
+            table.setdefault(sbopt.long_opt, sbopt)
 
-    return SbatchOpt()
+    return table
 
 
-def _parse_opts_from_batch_script(desc, script, overwrite):
-    flags_and_vals = {}
+_OPT_TABLE = _build_opt_table()
+_directive_cache = {}
+
+
+def _find_opt(opt):
+    return _OPT_TABLE.get(opt)
+
+
+def _parse_directives(script):
+    # Parsed directives are cached by the hash of the script content, so
+    # the same script is only tokenized once.
+    key = hashlib.blake2b(script.encode(), digest_size=16).digest()
+    directives = _directive_cache.get(key)
+    if directives is not None:
+        return directives
+
+    directives = []
+    if SBATCH_MAGIC in script:
+        for line in script.splitlines():
+            line = line.lstrip()
+
+            if line.startswith(SBATCH_MAGIC):
+                flag, val = _parse_line(line)
+                opt = _find_opt(flag)
+                if opt is not None:
+                    directives.append((opt, val))
+
+    directives = tuple(directives)
+    if len(_directive_cache) >= DIRECTIVE_CACHE_SIZE:
+        # Entries are in insertion order, so drop the oldest.
+        del _directive_cache[next(iter(_directive_cache))]
+    _directive_cache[key] = directives
+
+    return directives
 
+
+def _read_script(script):
     if not Path(script).is_file():
         raise ValueError("The script path you provided is not valid.")
 
-    script = Path(script).read_text()
-    for line in script.splitlines():
-        line = line.lstrip()
+    return Path(script).read_text()
+
+
+def _apply_directives(desc, directives, overwrite):
+    for opt, val in directives:
+        opt.set(val, desc, overwrite)
+
+
+def _parse_opts_from_batch_script(desc, script, overwrite):
+    _apply_directives(desc, _parse_directives(_read_script(script)),
+                      overwrite)
+
+
+def _parse_opts_from_batch_scripts(descs, overwrite):
+    cdef dict parsed = {}
+
+    for desc in descs:
+        script = desc.script
+        if not script:
+            raise ValueError("You need to set the 'script' attribute first.")
+
+        # Each script file is only read once per call.
+        if script not in parsed:
+            parsed[script] = _parse_directives(_read_script(script))
 
-        if line.startswith(SBATCH_MAGIC):
-            flag, val = _parse_line(line)
-            opt = _find_opt(flag)
-            opt.set(val, desc, overwrite)
+        _apply_directives(desc, parsed[script], overwrite)
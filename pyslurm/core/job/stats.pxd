@@ -57,6 +57,7 @@ from pyslurm.db.stats cimport JobStepStatistics
 from pyslurm.core.job.step cimport JobStep
 
 cdef load_single(JobStep step)
+cdef list load_multiple(list steps, int max_workers=*, timeout=*)
 
 # The real definition for this is too long, including too many other types that
 # we don't have directly access to.
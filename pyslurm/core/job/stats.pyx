@@ -34,11 +34,108 @@
 # cython: c_string_type=unicode, c_string_encoding=default
 # cython: language_level=3
 
+import sys
+import warnings
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from time import monotonic
 from pyslurm.core.error import verify_rpc
 from pyslurm.utils.helpers import nodelist_to_range_str
 
 
 cdef load_single(JobStep step):
+    result = _fetch_single(step)
+    if result is not None:
+        _apply_single(step, result)
+
+
+cdef list load_multiple(list steps, int max_workers=1, timeout=None):
+    cdef:
+        dict futures = {}
+        dict started = {}
+        list skipped = []
+        set pending
+
+    if max_workers <= 1 or len(steps) <= 1:
+        for step in steps:
+            load_single(step)
+        return skipped
+
+    # The GIL is released while waiting for the response of the slurmstepd,
+    # so the requests for multiple steps can overlap. The worker threads only
+    # fetch the data - the steps are modified in the calling thread, so a
+    # request that has timed out can never touch a step afterwards.
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        for step in steps:
+            fut = executor.submit(_fetch_single_timed, step, started)
+            futures[fut] = step
+
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=_next_deadline(
+                                 pending, futures, started, timeout),
+                                 return_when=FIRST_COMPLETED)
+            for fut in done:
+                result = fut.result()
+                if result is not None:
+                    _apply_single(futures[fut], result)
+
+            if timeout is not None:
+                now = monotonic()
+                for fut in list(pending):
+                    begin = started.get(id(futures[fut]))
+                    if begin is not None and now - begin >= timeout:
+                        pending.discard(fut)
+                        skipped.append(futures[fut])
+    finally:
+        # Requests that are already waiting for a slurmstepd can't be
+        # interrupted, but they will never touch their step anymore.
+        for fut in futures:
+            fut.cancel()
+        if sys.version_info >= (3, 9):
+            executor.shutdown(wait=False, cancel_futures=True)
+        else:
+            executor.shutdown(wait=False)
+
+    if skipped:
+        step_ids = ", ".join(f"{step.job_id}.{step.id}" for step in skipped)
+        warnings.warn(f"Timed out retrieving the stats for Steps: {step_ids}",
+                      RuntimeWarning, stacklevel=2)
+
+    return skipped
+
+
+def _fetch_single_timed(JobStep step, dict started):
+    started[id(step)] = monotonic()
+    return _fetch_single(step)
+
+
+def _next_deadline(pending, futures, started, timeout):
+    if timeout is None:
+        return None
+
+    now = monotonic()
+    deadline = timeout
+    for fut in pending:
+        begin = started.get(id(futures[fut]))
+        if begin is not None:
+            deadline = min(deadline, max(begin + timeout - now, 0))
+
+    return deadline
+
+
+cdef _apply_single(JobStep step, tuple result):
+    stats, pids = result
+    for node, node_pids in pids.items():
+        if node not in step.pids:
+            step.pids[node] = []
+
+        step.pids[node].extend(node_pids)
+
+    step.stats = stats
+
+
+cdef tuple _fetch_single(JobStep step):
     cdef:
         # jobacctinfo_t is the opaque data type provided in slurm.h
         # jobacctinfo is the actual (partial) re-definition of the jobacctinfo
@@ -60,9 +157,11 @@ cdef load_single(JobStep step):
         int rc = slurm.SLURM_SUCCESS
         int ntasks = 0
         list nodes = []
+        dict pids = {}
 
-    rc = slurm_job_step_stat(&step.ptr.step_id, NULL,
-                             step.ptr.start_protocol_ver, &stat_resp)
+    with nogil:
+        rc = slurm_job_step_stat(&step.ptr.step_id, NULL,
+                                 step.ptr.start_protocol_ver, &stat_resp)
     if rc != slurm.SLURM_SUCCESS:
         slurm_job_step_stat_response_msg_free(stat_resp)
         if rc == slurm.ESLURM_INVALID_JOB_ID:
@@ -86,10 +185,10 @@ cdef load_single(JobStep step):
         node = cstr.to_unicode(step_stat.step_pids.node_name)
         if step_stat.step_pids.pid_cnt > 0:
             for i in range(step_stat.step_pids.pid_cnt):
-                if node not in step.pids:
-                    step.pids[node] = []
+                if node not in pids:
+                    pids[node] = []
 
-                step.pids[node].append(step_stat.step_pids.pid[i])
+                pids[node].append(step_stat.step_pids.pid[i])
 
         nodes.append(node)
         ntasks += step_stat.num_tasks
@@ -126,7 +225,7 @@ cdef load_single(JobStep step):
         db_step.stats.tres_usage_out_ave = slurmdb_ave_tres_usage(usage_tmp, ntasks)
         xfree(usage_tmp)
 
-    step.stats = JobStepStatistics.from_ptr(
+    stats = JobStepStatistics.from_ptr(
             &db_step,
             nodes,
             step.cpus,
@@ -136,3 +235,4 @@ cdef load_single(JobStep step):
 
     slurm_job_step_stat_response_msg_free(stat_resp)
     slurmdb_free_slurmdb_stats_members(&db_step.stats)
+    return stats, pids
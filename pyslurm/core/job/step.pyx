@@ -109,9 +109,11 @@ cdef class JobSteps(dict):
             uint32_t cnt = 0
             slurm_step_id_t step_id = init_step_id()
             dict steps = {}
+            int rc
 
         step_id.job_id = job_id
-        rc = slurm_get_job_steps(&step_id, &self.info, flags)
+        with nogil:
+            rc = slurm_get_job_steps(&step_id, &self.info, flags)
         verify_rpc(rc)
 
         # zero-out a dummy job_step_info_t
@@ -237,10 +239,12 @@ cdef class JobStep:
             job_step_info_response_msg_t *info = NULL
             JobStep wrap = None
             slurm_step_id_t _step_id = init_step_id()
+            int rc
 
         _step_id.job_id = job_id.id if isinstance(job_id, Job) else job_id
         _step_id.step_id = dehumanize_step_id(step_id)
-        rc = slurm_get_job_steps(&_step_id, &info, slurm.SHOW_ALL)
+        with nogil:
+            rc = slurm_get_job_steps(&_step_id, &info, slurm.SHOW_ALL)
         verify_rpc(rc)
 
         if info and info.job_step_count == 1:
@@ -351,21 +355,34 @@ cdef class JobStep:
             >>> changes = pyslurm.JobStep(time_limit="20-00:00:00")
             >>> pyslurm.JobStep(9999, 1).modify(changes)
         """
-        cdef JobStep js = <JobStep>changes
+        cdef:
+            JobStep js = <JobStep>changes
+            int rc
+
         js._alloc_umsg()
         js.umsg.step_id = self.ptr.step_id
-        verify_rpc(slurm_update_step(js.umsg))
+        with nogil:
+            rc = slurm_update_step(js.umsg)
+        verify_rpc(rc)
 
     def as_dict(self):
         return self.to_dict()
 
-    def to_dict(self, recursive = False):
+    def to_dict(self, recursive = False, fields=None):
         """JobStep information formatted as a dictionary.
 
+        Args:
+            recursive (bool, optional):
+                Whether nested objects should also be converted to dicts.
+                The default is `False`.
+            fields (list[str], optional):
+                Only include these attributes, in the given order. By
+                default, all attributes are included.
+
         Returns:
             (dict): JobStep information as dict
         """
-        return instance_to_dict(self, recursive)
+        return instance_to_dict(self, recursive, fields)
 
     @property
     def id(self):
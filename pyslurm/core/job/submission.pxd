@@ -29,6 +29,14 @@ from pyslurm.slurm cimport (
     slurm_free_job_desc_msg,
     submit_response_msg_t,
     slurm_submit_batch_job,
+    slurm_submit_batch_het_job,
+    slurm_job_will_run2,
+    will_run_response_msg_t,
+    slurm_free_will_run_response_msg,
+    list_t,
+    slurm_list_create,
+    slurm_list_append,
+    slurm_list_destroy,
     slurm_free_submit_response_response_msg,
     slurm_env_array_free,
     slurm_env_array_create,
@@ -40,6 +48,8 @@ from pyslurm.slurm cimport (
 )
 from pyslurm.utils cimport cstr, ctime
 from pyslurm.utils.uint cimport *
+from pyslurm.db.util cimport SlurmList, SlurmListItem
+from libc.stdint cimport uint32_t
 from pyslurm.utils.ctime cimport time_t
 from pyslurm.core.job.task_dist cimport TaskDistribution
 
@@ -657,3 +667,27 @@ cdef class JobSubmitDescription:
         segment_size
         reserved_ports
         extra
+
+
+cdef class HeterogeneousJobSubmitDescription:
+    """Submit Description for a heterogeneous Slurm Job.
+
+    A heterogeneous Job consists of multiple components, each with its own
+    resource requirements. This is the same as separating the components
+    with `:` on the command line of sbatch, or with `#SBATCH hetjob` in the
+    batch script.
+
+    Args:
+        components (list[pyslurm.JobSubmitDescription], optional=None):
+            The components of the Job.
+
+    Attributes:
+        components (list[pyslurm.JobSubmitDescription]):
+            The components of the Job, in order of their offset. The batch
+            script, `script_args` and `environment` are only taken from the
+            first component, just like with sbatch. The other components
+            don't need a script.
+    """
+    cdef public:
+        list components
+
@@ -25,15 +25,27 @@
 from os import getcwd
 from os import environ as pyenviron
 import re
-from typing import Union, Any
+from typing import Union, Any, NamedTuple
+from time import monotonic
 import shlex
 from pathlib import Path
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    wait,
+    as_completed,
+    FIRST_COMPLETED,
+)
+from libc.string cimport memcpy
 from pyslurm.utils import cstr
 from pyslurm.utils.uint import *
 from pyslurm.core.job.util import *
 from pyslurm.core.error import RPCError, verify_rpc
-from pyslurm.core.job.sbatch_opts import _parse_opts_from_batch_script
+from pyslurm.core.job.sbatch_opts import (
+    _parse_opts_from_batch_script,
+    _parse_opts_from_batch_scripts,
+)
 from pyslurm.utils.ctime import (
+    _raw_time,
     secs_to_timestr,
     timestr_to_secs,
     mins_to_timestr,
@@ -52,6 +64,31 @@ from pyslurm.utils.helpers import (
 )
 
 
+class JobWillRunResult(NamedTuple):
+    """The expected outcome of submitting a Job.
+
+    Attributes:
+        start_time (int):
+            Expected start time of the Job, as unix timestamp.
+        nodes (str):
+            Nodes the Job is expected to run on.
+        partition (str):
+            Partition the Job is expected to run in.
+        cpus (int):
+            Amount of CPUs the Job is expected to get.
+        cluster (str):
+            Cluster the Job is expected to run on.
+        preempted_job_ids (list[int]):
+            IDs of the Jobs that would be preempted to start the Job.
+    """
+    start_time: int
+    nodes: str
+    partition: str
+    cpus: int
+    cluster: str
+    preempted_job_ids: list
+
+
 cdef class JobSubmitDescription:
     def __cinit__(self):
         self.ptr = NULL
@@ -97,10 +134,232 @@ cdef class JobSubmitDescription:
             >>> print(job_id)
             99
         """
-        cdef submit_response_msg_t *resp = NULL
+        self._create_job_submit_desc()
+        return self._submit()
+
+    def submit_many(self, overrides, max_workers=1):
+        """Submit many batch jobs, using this description as a template.
+
+        The template is only prepared once. Jobs which only override plain
+        string attributes, like `name`, `comment`, `account`, `qos`,
+        `working_directory` or the standard input/output/error files, are
+        submitted from a copy of the template's prepared descriptor, in
+        which only these strings are replaced.
+
+        For all other Jobs, the descriptor is built again from the
+        template's attributes and the overrides. The batch script and the
+        environment are still only prepared once, and shared by all Jobs
+        that don't override the `script`, `script_args`, `environment` or
+        `get_user_environment` attributes.
+
+        Args:
+            overrides (Iterable[dict]):
+                The attributes to change for each Job. An empty dict submits
+                the template as is. The iterable is consumed lazily, so a
+                generator can be used for a large amount of Jobs.
+            max_workers (int):
+                Maximum amount of submissions sent to the slurmctld at the
+                same time. The default is 1, which submits the Jobs one after
+                another.
+
+        Returns:
+            (tuple[list, dict]): A list with the IDs of the submitted Jobs,
+                in the same order as `overrides`, and a dict which maps the
+                position of each Job that could not be submitted to the
+                exception that occured. The ID of such a Job is `None`.
+
+        Raises:
+            (ValueError): When the template itself is not valid.
+
+        Examples:
+            >>> import pyslurm
+            >>> template = pyslurm.JobSubmitDescription(
+            ...     cpus_per_task=1,
+            ...     time_limit="10",
+            ...     script="/path/to/your/submit_script.sh")
+            >>>
+            >>> overrides = ({"name": f"sweep-{i}", "script_args": str(i)}
+            ...              for i in range(1000))
+            >>> job_ids, errors = template.submit_many(overrides,
+            ...                                        max_workers=4)
+        """
+        cdef:
+            list job_ids = []
+            dict errors = {}
+            dict pending = {}
 
         self._create_job_submit_desc()
-        verify_rpc(slurm_submit_batch_job(self.ptr, &resp))
+        base = {attr: getattr(self, attr) for attr in _submit_attrs()}
+
+        if max_workers <= 1:
+            for idx, changes in enumerate(overrides):
+                job_ids.append(None)
+                try:
+                    job_ids[idx] = _submit_derived(self, base, changes)
+                except Exception as e:
+                    errors[idx] = e
+
+            return job_ids, errors
+
+        # Only a limited amount of descriptions are in flight, so the
+        # overrides are not all turned into descriptions at once.
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            for idx, changes in enumerate(overrides):
+                job_ids.append(None)
+                fut = executor.submit(_submit_derived, self, base, changes)
+                pending[fut] = idx
+
+                if len(pending) >= max_workers * 2:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    _collect_submitted(done, pending, job_ids, errors)
+
+            _collect_submitted(wait(pending).done, pending, job_ids, errors)
+        finally:
+            for fut in pending:
+                fut.cancel()
+            executor.shutdown(wait=True)
+
+        return job_ids, errors
+
+    def will_run(self):
+        """Determine when and where the Job would run, without submitting it.
+
+        This is the same as `--test-only` from sbatch.
+
+        Returns:
+            (pyslurm.JobWillRunResult): The expected start time, nodes and
+                preempted Jobs.
+
+        Raises:
+            (pyslurm.RPCError): When the Job could not be scheduled, for
+                example because it requests more resources than available.
+
+        Examples:
+            >>> import pyslurm
+            >>> desc = pyslurm.JobSubmitDescription(
+            ...     ntasks=64,
+            ...     time_limit="1-00:00:00",
+            ...     script="/path/to/your/submit_script.sh")
+            >>>
+            >>> result = desc.will_run()
+            >>> print(result.start_time, result.nodes)
+            1735693200 node[001-002]
+        """
+        self._create_job_submit_desc()
+        return self._will_run()
+
+    @staticmethod
+    def will_run_many(descriptions, max_workers=4, cache_ttl=10):
+        """Determine when and where many Jobs would run.
+
+        The descriptions are evaluated concurrently. Descriptions which only
+        differ in attributes that don't influence scheduling, like `name`,
+        `comment` or the output files, are only evaluated once. Results are
+        also kept in a cache shared by all calls to this function, for
+        `cache_ttl` seconds.
+
+        Args:
+            descriptions (Iterable[pyslurm.JobSubmitDescription]):
+                The candidate Jobs to evaluate.
+            max_workers (int):
+                Maximum amount of requests sent to the slurmctld at the same
+                time. The default is 4.
+            cache_ttl (float):
+                Seconds a result is reused by later calls. The default is
+                10. Use `0` to disable the cache.
+
+        Returns:
+            (tuple[list, dict]): A list with a
+                [pyslurm.JobWillRunResult][] for each description, in the
+                same order as `descriptions`, and a dict which maps the
+                position of each description that could not be evaluated to
+                the exception that occured. The result for such a
+                description is `None`.
+
+        Examples:
+            >>> import pyslurm
+            >>> candidates = [
+            ...     pyslurm.JobSubmitDescription(
+            ...         ntasks=n, script="/path/to/your/submit_script.sh")
+            ...     for n in (1, 16, 64)
+            ... ]
+            >>> results, errors = pyslurm.JobSubmitDescription.will_run_many(
+            ...     candidates)
+            >>> for desc, res in zip(candidates, results):
+            ...     print(desc.ntasks, res.start_time if res else None)
+        """
+        cdef:
+            list results = []
+            dict errors = {}
+            dict todo = {}
+            dict futures = {}
+            set uncacheable = set()
+
+        now = monotonic()
+        for idx, desc in enumerate(descriptions):
+            results.append(None)
+            key, cacheable = _will_run_key(desc)
+            if not cacheable:
+                uncacheable.add(key)
+
+            cached = (_will_run_cache.get(key)
+                      if cache_ttl and cacheable else None)
+            if cached is not None and now - cached[0] < cache_ttl:
+                results[idx] = cached[1]
+            else:
+                todo.setdefault(key, []).append(idx)
+                if len(todo[key]) == 1:
+                    todo[key].insert(0, desc)
+
+        if not todo:
+            return results, errors
+
+        executor = ThreadPoolExecutor(max_workers=max(max_workers, 1))
+        try:
+            for key, items in todo.items():
+                futures[executor.submit(_will_run_single, items[0])] = key
+
+            for fut in as_completed(futures):
+                key = futures[fut]
+                try:
+                    res = fut.result()
+                except Exception as e:
+                    for idx in todo[key][1:]:
+                        errors[idx] = e
+                    continue
+
+                if cache_ttl and key not in uncacheable:
+                    _cache_will_run(key, res)
+                for idx in todo[key][1:]:
+                    results[idx] = res
+        finally:
+            executor.shutdown(wait=True)
+
+        return results, errors
+
+    def _will_run(self):
+        cdef:
+            will_run_response_msg_t *resp = NULL
+            int rc
+
+        with nogil:
+            rc = slurm_job_will_run2(self.ptr, &resp)
+
+        try:
+            verify_rpc(rc)
+            return _will_run_result(resp)
+        finally:
+            slurm_free_will_run_response_msg(resp)
+
+    def _submit(self):
+        cdef:
+            submit_response_msg_t *resp = NULL
+            int rc
+
+        with nogil:
+            rc = slurm_submit_batch_job(self.ptr, &resp)
+        verify_rpc(rc)
 
         job_id = resp.step_id.job_id
         slurm_free_submit_response_response_msg(resp)
@@ -159,6 +418,36 @@ cdef class JobSubmitDescription:
             raise ValueError("You need to set the 'script' attribute first.")
         _parse_opts_from_batch_script(self, self.script, overwrite)
 
+    @staticmethod
+    def load_sbatch_options_many(descriptions, overwrite=False):
+        """Load values from `#SBATCH` options for many descriptions at once.
+
+        Every distinct script file is only read once, and the parsed
+        options of a script are cached by its content, so scripts which
+        are used often are not parsed again.
+
+        Args:
+            descriptions (Iterable[pyslurm.JobSubmitDescription]):
+                The descriptions to load the options for. Each must have its
+                `script` attribute set to the path of a batch script.
+            overwrite (bool):
+                If set to `True`, the value from an option found in the
+                batch script will override the current value of the
+                attribute in each description. Default is `False`
+
+        Raises:
+            (ValueError): When a description has no valid script path.
+
+        Examples:
+            >>> import pyslurm
+            >>> descs = [
+            ...     pyslurm.JobSubmitDescription(script="/path/to/script.sh")
+            ...     for _ in range(100)
+            ... ]
+            >>> pyslurm.JobSubmitDescription.load_sbatch_options_many(descs)
+        """
+        _parse_opts_from_batch_scripts(descriptions, overwrite)
+
     def _parse_env(self, overwrite=False):
         for attr in dir(self):
             if attr.startswith("_") or callable(attr):
@@ -181,13 +470,15 @@ cdef class JobSubmitDescription:
 
                 setattr(self, attr, val)
 
-    def _create_job_submit_desc(self, is_update=False):
+    def _create_job_submit_desc(self, is_update=False,
+                                JobSubmitDescription template=None,
+                                het_offset=0):
         self.is_update = is_update
         self._alloc_and_init()
         cdef slurm.job_desc_msg_t *ptr = self.ptr
 
         if not self.is_update:
-            self._validate_options()
+            self._validate_options(need_script=not het_offset)
             self._set_defaults()
 
         if self.nice:
@@ -274,12 +565,26 @@ cdef class JobSubmitDescription:
         ptr.profile = acctg_profile_list_to_int(self.profile_types)
         ptr.shared = shared_type_str_to_int(self.resource_sharing)
 
-        if not self.is_update:
+        if not self.is_update and het_offset:
+            # Only the first component of a heterogeneous Job carries the
+            # script and its environment, because the script only runs in
+            # the allocation of the first component.
             self.ptr.min_nodes, self.ptr.max_nodes = _parse_nodes(self.nodes)
-            cstr.fmalloc(&self.ptr.script,
-                         _validate_batch_script(self.script, self.script_args))
+            self._set_distribution()
+        elif not self.is_update:
+            self.ptr.min_nodes, self.ptr.max_nodes = _parse_nodes(self.nodes)
+            if template is not None and _shares_script(self, template):
+                self.ptr.script = template.ptr.script
+            else:
+                cstr.fmalloc(&self.ptr.script, _validate_batch_script(
+                             self.script, self.script_args))
             self._set_script_args()
-            self._set_environment()
+
+            if template is not None and _shares_environment(self, template):
+                self.ptr.environment = template.ptr.environment
+                self.ptr.env_size = template.ptr.env_size
+            else:
+                self._set_environment()
             self._set_distribution()
 
         self._set_memory()
@@ -314,8 +619,8 @@ cdef class JobSubmitDescription:
             # By default, sbatch also exports everything in the users env.
             self.environment = "ALL"
 
-    def _validate_options(self):
-        if not self.script:
+    def _validate_options(self, need_script=True):
+        if need_script and not self.script:
             raise ValueError("You need to provide a batch script.")
 
         if (self.memory_per_node and self.memory_per_cpu
@@ -562,6 +867,308 @@ cdef class JobSubmitDescription:
             self.ptr.bitflags |= slurm.GRES_ONE_TASK_PER_SHARING
 
 
+cdef class HeterogeneousJobSubmitDescription:
+
+    def __init__(self, components=None):
+        self.components = list(components) if components else []
+
+    def __repr__(self):
+        return f'pyslurm.{self.__class__.__name__}'
+
+    def submit(self):
+        """Submit the heterogeneous batch job.
+
+        The batch script only runs in the allocation of the first
+        component, so only the first component needs a `script`. Its
+        environment is the one the script is started with, which is why the
+        environment is only set up for the first component, and not for any
+        of the others.
+
+        The Job ID of each component is the returned ID plus the offset of
+        the component, which is its position in `components`. Use
+        `pyslurm.Job.load()` and the `heterogeneous_offset` attribute to
+        look them up.
+
+        Returns:
+            (int): The ID of the heterogeneous Job.
+
+        Raises:
+            (pyslurm.RPCError): When the job submission was not successful.
+            (ValueError): When no components were given.
+
+        Examples:
+            >>> import pyslurm
+            >>> desc = pyslurm.HeterogeneousJobSubmitDescription([
+            ...     pyslurm.JobSubmitDescription(
+            ...         ntasks=1,
+            ...         memory_per_node="64G",
+            ...         script="/path/to/your/submit_script.sh"),
+            ...     pyslurm.JobSubmitDescription(
+            ...         ntasks=16,
+            ...         gpus=2),
+            ... ])
+            >>>
+            >>> het_job_id = desc.submit()
+            >>> print(het_job_id)
+            100
+        """
+        cdef:
+            JobSubmitDescription desc
+            submit_response_msg_t *resp = NULL
+            list_t *req_list = NULL
+            int rc
+
+        if not self.components:
+            raise ValueError("A heterogeneous Job needs at least one "
+                             "component.")
+
+        for offset, desc in enumerate(self.components):
+            desc._create_job_submit_desc(het_offset=offset)
+
+        # The list only borrows the descriptions, they are still owned and
+        # free'd by the components.
+        req_list = slurm_list_create(NULL)
+        try:
+            for desc in self.components:
+                slurm_list_append(req_list, desc.ptr)
+
+            with nogil:
+                rc = slurm_submit_batch_het_job(req_list, &resp)
+        finally:
+            slurm_list_destroy(req_list)
+
+        verify_rpc(rc)
+        het_job_id = resp.step_id.job_id
+        slurm_free_submit_response_response_msg(resp)
+
+        return het_job_id
+
+
+# Attributes which don't change when or where a Job would run.
+_WILL_RUN_IGNORED = frozenset((
+    "name",
+    "comment",
+    "admin_comment",
+    "extra",
+    "standard_in",
+    "standard_output",
+    "standard_error",
+    "log_files_open_mode",
+    "mail_user",
+    "mail_types",
+    "script",
+    "script_args",
+    "environment",
+    "get_user_environment",
+    "working_directory",
+))
+_WILL_RUN_CACHE_SIZE = 4096
+_will_run_cache = {}
+
+
+cdef _will_run_result(will_run_response_msg_t *resp):
+    cdef:
+        SlurmListItem item
+        list preempted = []
+
+    for item in SlurmList.wrap(resp.preemptee_job_id, owned=False):
+        preempted.append((<uint32_t*>item.data)[0])
+
+    return JobWillRunResult(
+        start_time=_raw_time(resp.start_time),
+        nodes=cstr.to_unicode(resp.node_list),
+        partition=cstr.to_unicode(resp.part_name),
+        cpus=u32_parse(resp.proc_cnt),
+        cluster=cstr.to_unicode(resp.cluster_name),
+        preempted_job_ids=preempted,
+    )
+
+
+def _will_run_single(JobSubmitDescription desc):
+    desc._create_job_submit_desc()
+    return desc._will_run()
+
+
+def _freeze(val):
+    if isinstance(val, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in val.items()))
+    elif isinstance(val, (list, tuple)):
+        return tuple(_freeze(v) for v in val)
+    elif isinstance(val, (set, frozenset)):
+        return tuple(sorted(_freeze(v) for v in val))
+    return val
+
+
+def _will_run_key(JobSubmitDescription desc):
+    key = tuple(
+        (attr, _freeze(getattr(desc, attr)))
+        for attr in _submit_attrs() if attr not in _WILL_RUN_IGNORED
+    )
+    try:
+        hash(key)
+    except TypeError:
+        # Can't be deduplicated or cached, so make it unique.
+        return (id(desc),), False
+
+    return key, True
+
+
+def _cache_will_run(key, result):
+    if len(_will_run_cache) >= _WILL_RUN_CACHE_SIZE:
+        # Entries are in insertion order, so drop the oldest.
+        del _will_run_cache[next(iter(_will_run_cache))]
+
+    _will_run_cache.pop(key, None)
+    _will_run_cache[key] = (monotonic(), result)
+
+
+_SUBMIT_ATTRS = None
+
+
+def _submit_attrs():
+    global _SUBMIT_ATTRS
+
+    if _SUBMIT_ATTRS is None:
+        _SUBMIT_ATTRS = [
+            attr for attr, val in vars(JobSubmitDescription).items()
+            if not attr.startswith("_") and not callable(val)
+        ]
+    return _SUBMIT_ATTRS
+
+
+def _shares_script(JobSubmitDescription desc,
+                   JobSubmitDescription template):
+    return (desc.script == template.script
+            and desc.script_args == template.script_args)
+
+
+def _shares_environment(JobSubmitDescription desc,
+                        JobSubmitDescription template):
+    return (desc.environment == template.environment
+            and desc.get_user_environment == template.get_user_environment)
+
+
+# Attributes which are only copied into a string of the job_desc_msg_t, and
+# don't influence any other part of it. Jobs from submit_many() which only
+# override these can be submitted from a copy of the template's descriptor.
+_STR_ONLY_ATTRS = frozenset((
+    "name",
+    "account",
+    "wckey",
+    "comment",
+    "admin_comment",
+    "extra",
+    "mail_user",
+    "qos",
+    "standard_in",
+    "standard_output",
+    "standard_error",
+    "working_directory",
+))
+
+
+cdef char **_str_field(job_desc_msg_t *ptr, attr):
+    if attr == "name":
+        return &ptr.name
+    elif attr == "account":
+        return &ptr.account
+    elif attr == "wckey":
+        return &ptr.wckey
+    elif attr == "comment":
+        return &ptr.comment
+    elif attr == "admin_comment":
+        return &ptr.admin_comment
+    elif attr == "extra":
+        return &ptr.extra
+    elif attr == "mail_user":
+        return &ptr.mail_user
+    elif attr == "qos":
+        return &ptr.qos
+    elif attr == "standard_in":
+        return &ptr.std_in
+    elif attr == "standard_output":
+        return &ptr.std_out
+    elif attr == "standard_error":
+        return &ptr.std_err
+    else:
+        return &ptr.work_dir
+
+
+def _submit_from_template(JobSubmitDescription template, changes):
+    cdef:
+        job_desc_msg_t *ptr = NULL
+        submit_response_msg_t *resp = NULL
+        char **field = NULL
+        list replaced = []
+        int rc
+
+    ptr = <job_desc_msg_t*>try_xmalloc(sizeof(job_desc_msg_t))
+    if not ptr:
+        raise MemoryError("xmalloc failed for job_desc_msg_t")
+
+    # Everything is borrowed from the template, except for the strings that
+    # are overridden.
+    memcpy(ptr, template.ptr, sizeof(job_desc_msg_t))
+    try:
+        for attr, val in changes.items():
+            if attr == "working_directory" and not val:
+                # Same default as _set_defaults() uses.
+                val = str(getcwd())
+
+            field = _str_field(ptr, attr)
+            field[0] = NULL
+            replaced.append(attr)
+            cstr.fmalloc(field, val)
+
+        with nogil:
+            rc = slurm_submit_batch_job(ptr, &resp)
+        verify_rpc(rc)
+
+        job_id = resp.step_id.job_id
+        slurm_free_submit_response_response_msg(resp)
+        return job_id
+    finally:
+        for attr in replaced:
+            field = _str_field(ptr, attr)
+            xfree(field[0])
+        xfree(ptr)
+
+
+def _submit_derived(JobSubmitDescription template, dict base, changes):
+    cdef JobSubmitDescription desc
+
+    if _STR_ONLY_ATTRS.issuperset(changes) and all(
+            val is None or isinstance(val, str) for val in changes.values()):
+        return _submit_from_template(template, changes)
+
+    desc = JobSubmitDescription(**base)
+
+    for attr, val in changes.items():
+        setattr(desc, attr, val)
+
+    try:
+        desc._create_job_submit_desc(template=template)
+        return desc._submit()
+    finally:
+        # The script and environment may be borrowed from the template, and
+        # must not be free'd together with this description.
+        if desc.ptr:
+            if desc.ptr.script == template.ptr.script:
+                desc.ptr.script = NULL
+            if desc.ptr.environment == template.ptr.environment:
+                desc.ptr.environment = NULL
+                desc.ptr.env_size = 0
+
+
+def _collect_submitted(done, dict pending, list job_ids, dict errors):
+    for fut in done:
+        idx = pending.pop(fut)
+        try:
+            job_ids[idx] = fut.result()
+        except Exception as e:
+            errors[idx] = e
+
+
 def _parse_dependencies(val):
     final = None
 
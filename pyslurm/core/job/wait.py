@@ -0,0 +1,203 @@
+#########################################################################
+# job/wait.py - wait for Jobs to reach specific states
+#########################################################################
+# Copyright (C) 2026 Toni Harzendorf <toni.harzendorf@gmail.com>
+#
+# This file is part of PySlurm
+#
+# PySlurm is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+
+# PySlurm is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with PySlurm; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+"""Waiting for Jobs to reach specific states"""
+
+import asyncio
+import random
+import time
+
+from pyslurm.core.job.job import Jobs
+
+
+FINISHED_STATES = frozenset({
+    "BOOT_FAIL",
+    "CANCELLED",
+    "COMPLETED",
+    "DEADLINE",
+    "FAILED",
+    "NODE_FAIL",
+    "OUT_OF_MEMORY",
+    "PREEMPTED",
+    "TIMEOUT",
+})
+"""The states in which a Job has finished and won't change anymore."""
+
+# asyncio.get_running_loop() is only available since Python 3.7
+_get_loop = getattr(asyncio, "get_running_loop", asyncio.get_event_loop)
+
+
+class _Waiter:
+
+    def __init__(self, job_ids, states, timeout, min_interval, max_interval):
+        self.pending = list(dict.fromkeys(int(job_id) for job_id in job_ids))
+        self.states = (frozenset(state.upper() for state in states)
+                       if states else FINISHED_STATES)
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+
+    def update(self, current_states):
+        done = []
+        pending = []
+        for job_id in self.pending:
+            # A Job that has finished, or is not known anymore because it
+            # has already been purged from the slurmctld, won't ever change
+            # its state again, even if it is not one of the wanted states.
+            state = current_states.get(job_id)
+            if (state is None or state in self.states
+                    or state in FINISHED_STATES):
+                done.append((job_id, state))
+            else:
+                pending.append(job_id)
+
+        self.pending = pending
+
+        # Poll more often again as soon as something happens, otherwise
+        # slowly back off to put less load on the slurmctld.
+        if done:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.interval * 1.5, self.max_interval)
+
+        return done
+
+    def next_delay(self):
+        # Add some jitter, so that many waiters started at the same time
+        # don't all poll the slurmctld at the same moment.
+        delay = self.interval * random.uniform(0.8, 1.2)
+        if self.deadline is not None:
+            remaining = self.deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError("Timed out waiting for Jobs: "
+                                   f"{', '.join(map(str, self.pending))}")
+            delay = min(delay, remaining)
+
+        return delay
+
+
+def wait_for(job_ids, states=None, timeout=None, min_interval=1.0,
+             max_interval=30.0):
+    """Wait for Jobs to reach specific states.
+
+    The state of all Jobs that are still waited for is retrieved with one
+    single [pyslurm.Jobs.load_states][] call per cycle. The time between two
+    cycles starts at `min_interval` and increases up to `max_interval` while
+    no Job changes to one of the wanted states. It is reset as soon as a Job
+    reaches one of the states.
+
+    This is a generator, which yields each Job as soon as it has reached one
+    of the states.
+
+    !!! note
+
+        Jobs that have finished are always considered done, even when they
+        never reached one of the wanted `states`. The state they finished
+        with is yielded, so it can be told apart from the wanted states.
+        Jobs that are not known to the slurmctld (anymore) are also
+        considered done, with a state of `None`.
+
+    Args:
+        job_ids (list[int]):
+            The IDs of the Jobs to wait for.
+        states (list[str], optional):
+            The states to wait for. By default, this waits until the Jobs have
+            finished, see `pyslurm.core.job.wait.FINISHED_STATES`.
+        timeout (float, optional):
+            Maximum amount of seconds to wait for all Jobs. By default, there
+            is no timeout.
+        min_interval (float, optional):
+            Minimum amount of seconds between two state queries.
+        max_interval (float, optional):
+            Maximum amount of seconds between two state queries.
+
+    Yields:
+        (tuple[int, str]): The Job-ID and the state of each Job, as soon as
+            it has reached one of the states, or has finished.
+
+    Raises:
+        (TimeoutError): When not all Jobs have reached one of the states
+            before the timeout.
+        (pyslurm.RPCError): When getting the state of the Jobs failed.
+
+    Examples:
+        >>> import pyslurm
+        >>> for job_id, state in pyslurm.wait_for([1, 2, 3], timeout=3600):
+        ...     print(f"Job {job_id} finished with state {state}")
+        >>>
+        >>> # Wait until all Jobs are running
+        >>> states = dict(pyslurm.wait_for([1, 2, 3], states=["RUNNING"]))
+    """
+    waiter = _Waiter(job_ids, states, timeout, min_interval, max_interval)
+    while waiter.pending:
+        yield from waiter.update(Jobs.load_states(waiter.pending))
+        if waiter.pending:
+            time.sleep(waiter.next_delay())
+
+
+async def wait_for_async(job_ids, states=None, timeout=None, min_interval=1.0,
+                         max_interval=30.0):
+    """Wait for Jobs to reach specific states, with asyncio.
+
+    Works the same as [pyslurm.wait_for][], but as an asynchronous
+    generator. The state queries are run in the default executor of the
+    event loop, so the event loop is never blocked.
+
+    Args:
+        job_ids (list[int]):
+            The IDs of the Jobs to wait for.
+        states (list[str], optional):
+            The states to wait for. By default, this waits until the Jobs have
+            finished.
+        timeout (float, optional):
+            Maximum amount of seconds to wait for all Jobs. By default, there
+            is no timeout.
+        min_interval (float, optional):
+            Minimum amount of seconds between two state queries.
+        max_interval (float, optional):
+            Maximum amount of seconds between two state queries.
+
+    Yields:
+        (tuple[int, str]): The Job-ID and the state of each Job, as soon as
+            it has reached one of the states, or has finished.
+
+    Raises:
+        (TimeoutError): When not all Jobs have reached one of the states
+            before the timeout.
+        (pyslurm.RPCError): When getting the state of the Jobs failed.
+
+    Examples:
+        >>> import pyslurm
+        >>> async def main():
+        ...     async for job_id, state in pyslurm.wait_for_async([1, 2]):
+        ...         print(f"Job {job_id} finished with state {state}")
+    """
+    loop = _get_loop()
+    waiter = _Waiter(job_ids, states, timeout, min_interval, max_interval)
+    while waiter.pending:
+        current_states = await loop.run_in_executor(
+            None, Jobs.load_states, list(waiter.pending))
+        for item in waiter.update(current_states):
+            yield item
+
+        if waiter.pending:
+            await asyncio.sleep(waiter.next_delay())
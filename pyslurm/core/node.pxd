@@ -24,12 +24,13 @@
 
 from libc.string cimport memcpy, memset
 from pyslurm cimport slurm
-from libc.stdint cimport uint8_t, uint16_t, uint32_t, uint64_t
+from libc.stdint cimport int32_t, uint8_t, uint16_t, uint32_t, uint64_t
 from pyslurm.slurm cimport (
     node_info_t,
     node_info_msg_t,
     update_node_msg_t,
     partition_info_msg_t,
+    partition_info_t,
     slurm_load_node,
     slurm_load_node_single,
     slurm_update_node,
@@ -92,6 +93,28 @@ cdef class Nodes(MultiClusterMap):
         node_info_msg_t *info
         partition_info_msg_t *part_info
         node_info_t tmp_info
+        time_t last_update
+        dict passwd
+        dict groups
+        object partitions
+        list names
+
+    cdef dict _load_data(self, time_t update_time, int flags)
+    cdef dict _load_data_single(self, int flags)
+    cdef _c_column(self, field, list items, np)
+    cdef bint _item_changed(self, old, new)
+
+
+cdef class _NodePartitions:
+    cdef:
+        list names
+        bint by_name
+        set wanted
+        dict by_node
+
+    cdef list get(self, name)
+    cdef resolve(self)
+    cdef _add(self, dict by_node, partition_info_t *part)
 
 
 cdef class Node:
@@ -227,6 +250,7 @@ cdef class Node:
         update_node_msg_t *umsg
         dict passwd
         dict groups
+        _NodePartitions _partition_src
 
     cdef readonly cluster
 
@@ -23,13 +23,18 @@
 # cython: language_level=3
 
 from typing import Union
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pyslurm.utils import cstr
 from pyslurm.utils import ctime
 from pyslurm.utils.uint import *
-from pyslurm.core.error import RPCError, verify_rpc
+from pyslurm.core.error import RPCError, verify_rpc, slurm_errno
 from pyslurm.utils.ctime import timestamp_to_date, _raw_time
 from pyslurm import settings
 from pyslurm import xcollections
+from pyslurm.xcollections cimport _uint_buffer, _uint_column
+from cpython cimport array as c_array
+from pyslurm.core.partition cimport Partitions, Partition
 from pyslurm.utils.helpers import (
     uid_to_name,
     gid_to_name,
@@ -43,6 +48,143 @@ from pyslurm.utils.helpers import (
     gres_from_tres_dict,
 )
 
+# Up to this amount of Nodes, Nodes.load(names=...) requests each Node
+# individually instead of loading all of them.
+_LOAD_SINGLE_MAX_NODES = 64
+_LOAD_SINGLE_MAX_WORKERS = 8
+
+# How the attributes of a Node parse their raw values, for to_columns().
+# See xcollections._uint_column for the meaning.
+_U16_SPEC = (slurm.NO_VAL16, slurm.INFINITE16, True, None, False)
+_U16_ZERO_SPEC = (slurm.NO_VAL16, slurm.INFINITE16, True, 0, False)
+_U32_SPEC = (slurm.NO_VAL, slurm.INFINITE, True, None, False)
+_U64_SPEC = (slurm.NO_VAL64, slurm.INFINITE64, True, None, False)
+_TIME_SPEC = (slurm.NO_VAL, slurm.INFINITE, True, None, True)
+
+# Fields of Nodes.to_columns() that are read directly from node_info_t.
+_NODE_COLUMNS = {
+    "real_memory": (0, _U64_SPEC),
+    "free_memory": (1, _U64_SPEC),
+    "allocated_memory": (2, (slurm.NO_VAL64, slurm.INFINITE64, True, 0,
+                             False)),
+    "temporary_disk": (3, _U32_SPEC),
+    "weight": (4, _U32_SPEC),
+    "effective_cpus": (5, _U16_ZERO_SPEC),
+    "total_cpus": (6, _U16_ZERO_SPEC),
+    "sockets": (7, _U16_ZERO_SPEC),
+    "allocated_cpus": (8, _U16_ZERO_SPEC),
+    "boards": (9, _U16_SPEC),
+    "cores_per_socket": (10, _U16_SPEC),
+    "threads_per_core": (11, _U16_SPEC),
+    "slurmd_port": (12, _U16_SPEC),
+    "boot_time": (13, _TIME_SPEC),
+    "slurmd_start_time": (14, _TIME_SPEC),
+    "last_busy_time": (15, _TIME_SPEC),
+    "reason_time": (16, _TIME_SPEC),
+}
+
+
+cdef uint64_t _node_column_value(node_info_t *info, int field):
+    if field == 0:
+        return info.real_memory
+    elif field == 1:
+        return info.free_mem
+    elif field == 2:
+        return info.alloc_memory
+    elif field == 3:
+        return info.tmp_disk
+    elif field == 4:
+        return info.weight
+    elif field == 5:
+        return info.cpus_efctv
+    elif field == 6:
+        return info.cpus
+    elif field == 7:
+        return info.sockets
+    elif field == 8:
+        return info.alloc_cpus
+    elif field == 9:
+        return info.boards
+    elif field == 10:
+        return info.cores
+    elif field == 11:
+        return info.threads
+    elif field == 12:
+        return info.port
+    elif field == 13:
+        return info.boot_time
+    elif field == 14:
+        return info.slurmd_start_time
+    elif field == 15:
+        return info.last_busy
+    else:
+        return info.reason_time
+
+
+cdef bint _node_info_changed(node_info_t *old, node_info_t *new):
+    # The partitions string is left out on purpose, since it is only filled
+    # in on demand, see Nodes.load().
+    if (old.node_state != new.node_state
+            or old.next_state != new.next_state
+            or old.alloc_cpus != new.alloc_cpus
+            or old.alloc_memory != new.alloc_memory
+            or old.free_mem != new.free_mem
+            or old.cpu_load != new.cpu_load
+            or old.cpus != new.cpus
+            or old.cpus_efctv != new.cpus_efctv
+            or old.boards != new.boards
+            or old.sockets != new.sockets
+            or old.cores != new.cores
+            or old.threads != new.threads
+            or old.core_spec_cnt != new.core_spec_cnt
+            or old.cpu_bind != new.cpu_bind
+            or old.real_memory != new.real_memory
+            or old.mem_spec_limit != new.mem_spec_limit
+            or old.tmp_disk != new.tmp_disk
+            or old.weight != new.weight
+            or old.owner != new.owner
+            or old.port != new.port
+            or old.res_cores_per_gpu != new.res_cores_per_gpu
+            or old.boot_time != new.boot_time
+            or old.slurmd_start_time != new.slurmd_start_time
+            or old.last_busy != new.last_busy
+            or old.reason_time != new.reason_time
+            or old.reason_uid != new.reason_uid
+            or old.resume_after != new.resume_after):
+        return True
+
+    if (not old.energy) != (not new.energy):
+        return True
+    elif old.energy and (
+            old.energy.current_watts != new.energy.current_watts
+            or old.energy.ave_watts != new.energy.ave_watts):
+        return True
+
+    return not (cstr.equal(old.reason, new.reason)
+                and cstr.equal(old.comment, new.comment)
+                and cstr.equal(old.extra, new.extra)
+                and cstr.equal(old.features, new.features)
+                and cstr.equal(old.features_act, new.features_act)
+                and cstr.equal(old.gres, new.gres)
+                and cstr.equal(old.gres_drain, new.gres_drain)
+                and cstr.equal(old.gres_used, new.gres_used)
+                and cstr.equal(old.alloc_tres_fmt_str, new.alloc_tres_fmt_str)
+                and cstr.equal(old.tres_fmt_str, new.tres_fmt_str)
+                and cstr.equal(old.resv_name, new.resv_name)
+                and cstr.equal(old.mcs_label, new.mcs_label)
+                and cstr.equal(old.node_addr, new.node_addr)
+                and cstr.equal(old.node_hostname, new.node_hostname)
+                and cstr.equal(old.bcast_address, new.bcast_address)
+                and cstr.equal(old.arch, new.arch)
+                and cstr.equal(old.os, new.os)
+                and cstr.equal(old.version, new.version)
+                and cstr.equal(old.cpu_spec_list, new.cpu_spec_list)
+                and cstr.equal(old.gpu_spec, new.gpu_spec)
+                and cstr.equal(old.instance_id, new.instance_id)
+                and cstr.equal(old.instance_type, new.instance_type)
+                and cstr.equal(old.topology_str, new.topology_str)
+                and cstr.equal(old.parameters, new.parameters))
+
 
 cdef class Nodes(MultiClusterMap):
 
@@ -53,6 +195,7 @@ cdef class Nodes(MultiClusterMap):
     def __cinit__(self):
         self.info = NULL
         self.part_info = NULL
+        self.last_update = 0
 
     def __init__(self, nodes=None):
         super().__init__(data=nodes,
@@ -62,7 +205,7 @@ cdef class Nodes(MultiClusterMap):
                          key_type=str)
 
     @staticmethod
-    def load(preload_passwd_info=False):
+    def load(preload_passwd_info=False, partitions=None, names=None):
         """Load all nodes in the system.
 
         Args:
@@ -73,6 +216,22 @@ cdef class Nodes(MultiClusterMap):
                 where a UID/GID is translated to a name.
                 If True, the information will fetched and stored in each of
                 the Node instances. The default is False.
+            partitions (Union[bool, pyslurm.Partitions], optional=None):
+                Controls how the `partitions` attribute of each Node is
+                filled. By default (`None`), the partition information is only
+                loaded once the attribute is accessed for the first time on
+                any Node of the collection. `True` loads the partitions
+                together with the nodes, `False` skips them entirely (the
+                attribute will be empty). Passing an already loaded
+                [pyslurm.Partitions][] collection resolves the membership from
+                it, without contacting the slurmctld again.
+            names (Union[list[str], str], optional=None):
+                Only load the Nodes with these names. A str may also contain a
+                range expression like `node[001-050]`. For a small number of
+                Nodes, each of them is requested individually and
+                concurrently. Otherwise, all Nodes are requested at once and
+                only the wanted ones are kept. Nodes that don't exist are not
+                included in the result.
 
         Returns:
             (pyslurm.Nodes): Collection of node objects.
@@ -80,53 +239,171 @@ cdef class Nodes(MultiClusterMap):
         Raises:
             (pyslurm.RPCError): When getting all the Nodes from the slurmctld
                 failed.
+
+        Examples:
+            >>> import pyslurm
+            >>> parts = pyslurm.Partitions.load()
+            >>> nodes = pyslurm.Nodes.load(partitions=parts)
+            >>>
+            >>> nodes = pyslurm.Nodes.load(names=["node001", "node002"])
         """
         cdef:
-            dict passwd = {}
-            dict groups = {}
             Nodes nodes = Nodes()
             int flags = slurm.SHOW_ALL | slurm.SHOW_DETAIL
-            Node node
 
-        verify_rpc(slurm_load_node(0, &nodes.info, flags))
-        verify_rpc(slurm_load_partitions(0, &nodes.part_info, flags))
-        slurm_populate_node_partitions(nodes.info, nodes.part_info)
+        nodes.partitions = partitions
+        if names is not None:
+            if isinstance(names, str):
+                names = nodelist_from_range_str(names) or []
+            # Remove duplicates, otherwise the same Nodes are requested twice.
+            nodes.names = list(dict.fromkeys(names))
 
         # If requested, preload the passwd and groups database to potentially
         # speedup lookups for an attribute in a node, e.g "owner".
         if preload_passwd_info:
-            passwd = _getpwall_to_dict()
-            groups = _getgrall_to_dict()
+            nodes.passwd = _getpwall_to_dict()
+            nodes.groups = _getgrall_to_dict()
+
+        nodes.data = nodes._load_data(0, flags)
+        return nodes
+
+    cdef dict _load_data(self, time_t update_time, int flags):
+        cdef:
+            node_info_msg_t *info = NULL
+            _NodePartitions part_src = None
+            set wanted = None
+            dict out = {}
+            Node node
+            int rc
+
+        if self.names is not None:
+            if len(self.names) <= _LOAD_SINGLE_MAX_NODES:
+                # There is no update_time for single Nodes, so they are
+                # always retrieved again.
+                return self._load_data_single(flags)
+            wanted = {name.encode() for name in self.names}
+
+        with nogil:
+            rc = slurm_load_node(update_time, &info, flags)
+        if rc != slurm.SLURM_SUCCESS:
+            # Nothing has changed since the update_time we passed in, so the
+            # Nodes we already have are still up to date.
+            if update_time and slurm_errno() == slurm.SLURM_NO_CHANGE_IN_DATA:
+                return None
+            verify_rpc(rc)
+
+        # Only release the previous response once we actually got new data.
+        slurm_free_node_info_msg(self.info)
+        self.info = info
+        self.last_update = info.last_update
+
+        partitions = self.partitions
+        if partitions is None or isinstance(partitions, Partitions):
+            part_src = _NodePartitions()
+        elif partitions:
+            slurm_free_partition_info_msg(self.part_info)
+            self.part_info = NULL
+            with nogil:
+                rc = slurm_load_partitions(0, &self.part_info, flags)
+            verify_rpc(rc)
+            slurm_populate_node_partitions(self.info, self.part_info)
+        else:
+            part_src = _NodePartitions()
+            part_src.by_node = {}
 
         # zero-out a dummy node_info_t
-        memset(&nodes.tmp_info, 0, sizeof(node_info_t))
+        memset(&self.tmp_info, 0, sizeof(node_info_t))
 
         # Put each node pointer into its own "Node" instance.
-        for cnt in range(nodes.info.record_count):
-            node = Node.from_ptr(&nodes.info.node_array[cnt])
+        for cnt in range(self.info.record_count):
+            if wanted is not None and (not self.info.node_array[cnt].name
+                    or <bytes>self.info.node_array[cnt].name not in wanted):
+                # Release Nodes that weren't asked for right away, without
+                # creating an instance for them.
+                slurm_free_node_info_members(&self.info.node_array[cnt])
+                self.info.node_array[cnt] = self.tmp_info
+                if part_src is not None:
+                    part_src.names.append(None)
+                continue
+
+            node = Node.from_ptr(&self.info.node_array[cnt])
 
             # Prevent double free if xmalloc fails mid-loop and a MemoryError
             # is raised by replacing it with a zeroed-out node_info_t.
-            nodes.info.node_array[cnt] = nodes.tmp_info
+            self.info.node_array[cnt] = self.tmp_info
 
             name = node.name
+            if part_src is not None:
+                # The node index of a partition refers to the position in the
+                # node table, so unnamed nodes must keep their slot as well.
+                part_src.names.append(name)
+
             if not name:
                 # Could be possible if there are nodes configured in
                 # slurm.conf that cannot be reached anymore.
                 continue
 
-            if preload_passwd_info:
-                node.passwd = passwd
-                node.groups = groups
+            if self.passwd is not None:
+                node.passwd = self.passwd
+                node.groups = self.groups
 
+            node._partition_src = part_src
             cluster = node.cluster
-            if cluster not in nodes.data:
-                nodes.data[cluster] = {}
-            nodes.data[cluster][name] = node
+            if cluster not in out:
+                out[cluster] = {}
+            out[cluster][name] = node
 
         # We have extracted all pointers
-        nodes.info.record_count = 0
-        return nodes
+        self.info.record_count = 0
+
+        if isinstance(partitions, Partitions):
+            part_src.by_node = _partitions_from_snapshot(part_src, partitions)
+        return out
+
+    cdef dict _load_data_single(self, int flags):
+        cdef:
+            _NodePartitions part_src = _NodePartitions()
+            dict out = {}
+            Node node
+
+        # slurm_load_node_single waits for the slurmctld without holding the
+        # GIL, so the requests for multiple Nodes can overlap.
+        workers = min(len(self.names), _LOAD_SINGLE_MAX_WORKERS)
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                loaded = list(executor.map(_load_node_single, self.names,
+                                           repeat(flags)))
+        else:
+            loaded = [_load_node_single(name, flags) for name in self.names]
+
+        part_src.by_name = True
+        for node in loaded:
+            # Nodes that don't exist are simply not part of the result.
+            if node is None or not node.name:
+                continue
+
+            if self.passwd is not None:
+                node.passwd = self.passwd
+                node.groups = self.groups
+
+            part_src.names.append(node.name)
+            node._partition_src = part_src
+            cluster = node.cluster
+            if cluster not in out:
+                out[cluster] = {}
+            out[cluster][node.name] = node
+
+        partitions = self.partitions
+        if partitions is None:
+            pass
+        elif isinstance(partitions, Partitions):
+            part_src.by_node = _partitions_from_snapshot(part_src, partitions)
+        elif partitions:
+            part_src.resolve()
+        else:
+            part_src.by_node = {}
+
+        return out
 
     def reload(self):
         """Reload the information for Nodes in a collection.
@@ -145,6 +422,55 @@ cdef class Nodes(MultiClusterMap):
         """
         return xcollections.multi_reload(self)
 
+    def refresh(self):
+        """Incrementally refresh the information for Nodes in a collection.
+
+        Unlike `reload()`, this remembers the time of the last update
+        received from the slurmctld and only asks for new data if something
+        has changed since then. If nothing has changed, no Node instances are
+        recreated and the collection stays as it is.
+
+        Just like with `reload()`, only Nodes which are already in the
+        collection are updated. A Node is only replaced by its new instance
+        if its information actually differs. Nodes that don't exist anymore
+        are removed from the collection.
+
+        !!! note
+
+            The `partitions` attribute is not considered when checking Nodes
+            for changes. Use `pyslurm.Partitions.refresh()` to find out about
+            changes to the Partitions.
+
+            If the collection was loaded with only a few `names`, the Nodes
+            are always retrieved again, because the slurmctld can't tell
+            whether single Nodes have changed.
+
+        Returns:
+            (list[str]): Names of the Nodes whose information has changed, or
+                which do not exist anymore and were removed. The list is
+                empty if nothing has changed.
+
+        Raises:
+            (pyslurm.RPCError): When getting the Nodes from the slurmctld
+                failed.
+
+        Examples:
+            >>> import pyslurm
+            >>> nodes = pyslurm.Nodes.load()
+            >>> changed = nodes.refresh()
+            >>> for name in changed:
+            ...     print(f"{name} is now {nodes[name].state}")
+        """
+        cdef:
+            int flags = slurm.SHOW_ALL | slurm.SHOW_DETAIL
+            dict data
+
+        data = self._load_data(self.last_update, flags)
+        if data is None:
+            return []
+
+        return xcollections.multi_refresh(self, data)
+
     def modify(self, Node changes):
         """Modify all Nodes in a collection.
 
@@ -166,11 +492,40 @@ cdef class Nodes(MultiClusterMap):
             >>> # Apply the changes to all the nodes
             >>> nodes.modify(changes)
         """
-        cdef Node n = <Node>changes
+        cdef:
+            Node n = <Node>changes
+            int rc
+
         node_str = nodelist_to_range_str(list(self.keys()))
         n._alloc_umsg()
         cstr.fmalloc(&n.umsg.node_names, node_str)
-        verify_rpc(slurm_update_node(n.umsg))
+        with nogil:
+            rc = slurm_update_node(n.umsg)
+        verify_rpc(rc)
+
+    cdef _c_column(self, field, list items, np):
+        cdef:
+            c_array.array vals
+            Node node
+            int field_id
+            Py_ssize_t i
+
+        column = _NODE_COLUMNS.get(field)
+        if column is None:
+            return None
+
+        field_id, spec = column
+        vals = _uint_buffer(len(items))
+        for i, item in enumerate(items):
+            if not isinstance(item, Node) or not (<Node>item).info:
+                return None
+            node = <Node>item
+            vals.data.as_ulonglongs[i] = _node_column_value(node.info, field_id)
+
+        return _uint_column(vals, spec, np)
+
+    cdef bint _item_changed(self, old, new):
+        return _node_info_changed((<Node>old).info, (<Node>new).info)
 
     @property
     def free_memory(self):
@@ -213,6 +568,109 @@ cdef class Nodes(MultiClusterMap):
         return xcollections.sum_property(self, Node.avg_watts)
 
 
+cdef class _NodePartitions:
+    """Partition membership for Nodes loaded together, resolved on demand."""
+
+    def __cinit__(self):
+        self.names = []
+        self.by_name = False
+        self.by_node = None
+
+    cdef list get(self, name):
+        if self.by_node is None:
+            self.resolve()
+        return list(self.by_node.get(name, []))
+
+    cdef resolve(self):
+        cdef:
+            partition_info_msg_t *part_info = NULL
+            dict by_node = {}
+            int rc
+
+        with nogil:
+            rc = slurm_load_partitions(0, &part_info, slurm.SHOW_ALL)
+
+        try:
+            verify_rpc(rc)
+            for cnt in range(part_info.record_count):
+                self._add(by_node, &part_info.partition_array[cnt])
+        finally:
+            slurm_free_partition_info_msg(part_info)
+
+        self.by_node = by_node
+
+    cdef _add(self, dict by_node, partition_info_t *part):
+        if self.by_name:
+            # The Nodes weren't loaded from the complete node table, so the
+            # node index of the partition can't be used.
+            if self.wanted is None:
+                self.wanted = set(self.names)
+            _add_partition_members(by_node, self.wanted, part)
+        else:
+            _add_partition_nodes(by_node, self.names, part)
+
+
+cdef _add_partition_nodes(dict by_node, list names, partition_info_t *part):
+    cdef:
+        int32_t *inx = part.node_inx
+        int cnt = len(names)
+        int i = 0
+        int j
+
+    if not inx or not part.name:
+        return
+
+    part_name = cstr.to_unicode(part.name)
+    while inx[i] >= 0:
+        for j in range(inx[i], min(inx[i+1] + 1, cnt)):
+            name = names[j]
+            if name:
+                by_node.setdefault(name, []).append(part_name)
+        i += 2
+
+
+cdef _add_partition_members(dict by_node, set names, partition_info_t *part):
+    if not part.nodes or not part.name:
+        return
+
+    part_name = cstr.to_unicode(part.name)
+    for name in nodelist_from_range_str(cstr.to_unicode(part.nodes)) or []:
+        if name in names:
+            by_node.setdefault(name, []).append(part_name)
+
+
+cdef dict _partitions_from_snapshot(_NodePartitions src, Partitions partitions):
+    cdef:
+        dict by_node = {}
+        Partition part
+
+    for part in partitions.data.get(settings.LOCAL_CLUSTER, {}).values():
+        src._add(by_node, part.ptr)
+
+    return by_node
+
+
+def _load_node_single(name, int flags):
+    cdef:
+        node_info_msg_t *info = NULL
+        char *node_name = name
+        Node wrap = None
+        int rc
+
+    try:
+        with nogil:
+            rc = slurm_load_node_single(&info, node_name, flags)
+        verify_rpc(rc)
+
+        if info and info.record_count:
+            wrap = Node.from_ptr(&info.node_array[0])
+            info.record_count = 0
+    finally:
+        slurm_free_node_info_msg(info)
+
+    return wrap
+
+
 cdef class Node:
 
     def __cinit__(self):
@@ -280,6 +738,8 @@ cdef class Node:
             tmp = dst.info
             dst.info = src.info
             src.info = tmp
+            dst._partition_src, src._partition_src = (src._partition_src,
+                                                      dst._partition_src)
 
     @staticmethod
     def load(name):
@@ -306,11 +766,18 @@ cdef class Node:
             node_info_msg_t      *node_info = NULL
             partition_info_msg_t *part_info = NULL
             Node wrap = None
+            char *node_name = name
+            int rc
 
         try:
-            verify_rpc(slurm_load_node_single(&node_info,
-                                              name, slurm.SHOW_ALL))
-            verify_rpc(slurm_load_partitions(0, &part_info, slurm.SHOW_ALL))
+            with nogil:
+                rc = slurm_load_node_single(&node_info, node_name,
+                                            slurm.SHOW_ALL)
+            verify_rpc(rc)
+
+            with nogil:
+                rc = slurm_load_partitions(0, &part_info, slurm.SHOW_ALL)
+            verify_rpc(rc)
             slurm_populate_node_partitions(node_info, part_info)
 
             if node_info and node_info.record_count:
@@ -380,10 +847,15 @@ cdef class Node:
             >>> # Modify it
             >>> mynode.modify(changes)
         """
-        cdef Node n = <Node>changes
+        cdef:
+            Node n = <Node>changes
+            int rc
+
         n._alloc_umsg()
         cstr.fmalloc(&n.umsg.node_names, self.name)
-        verify_rpc(slurm_update_node(n.umsg))
+        with nogil:
+            rc = slurm_update_node(n.umsg)
+        verify_rpc(rc)
 
     def delete(self):
         """Delete a node.
@@ -403,9 +875,17 @@ cdef class Node:
     def as_dict(self):
         return self.to_dict()
 
-    def to_dict(self, recursive = False):
+    def to_dict(self, recursive = False, fields=None):
         """Node information formatted as a dictionary.
 
+        Args:
+            recursive (bool, optional):
+                Whether nested objects should also be converted to dicts.
+                The default is `False`.
+            fields (list[str], optional):
+                Only include these attributes, in the given order. By
+                default, all attributes are included.
+
         Returns:
             (dict): Node information as dict
 
@@ -414,7 +894,7 @@ cdef class Node:
             >>> mynode = pyslurm.Node.load("mynode")
             >>> mynode_dict = mynode.to_dict()
         """
-        return instance_to_dict(self, recursive)
+        return instance_to_dict(self, recursive, fields)
 
     @property
     def name(self):
@@ -584,6 +1064,8 @@ cdef class Node:
 
     @property
     def partitions(self):
+        if self._partition_src is not None and not self.info.partitions:
+            return self._partition_src.get(self.name)
         return cstr.to_list(self.info.partitions)
 
     @property
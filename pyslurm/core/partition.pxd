@@ -75,6 +75,11 @@ cdef class Partitions(MultiClusterMap):
     cdef:
         partition_info_msg_t *info
         partition_info_t tmp_info
+        time_t last_update
+        slurm_conf
+
+    cdef dict _load_data(self, time_t update_time, int flags)
+    cdef bint _item_changed(self, old, new)
 
 
 cdef class Partition:
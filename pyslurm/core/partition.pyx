@@ -27,7 +27,7 @@ from typing import Union, Any
 from pyslurm.utils import cstr
 from pyslurm.utils import ctime
 from pyslurm.utils.uint import *
-from pyslurm.core.error import RPCError, verify_rpc
+from pyslurm.core.error import RPCError, verify_rpc, slurm_errno
 from pyslurm.utils.ctime import timestamp_to_date, _raw_time
 from pyslurm.constants import UNLIMITED
 from pyslurm import settings
@@ -56,6 +56,7 @@ cdef class Partitions(MultiClusterMap):
 
     def __cinit__(self):
         self.info = NULL
+        self.last_update = 0
 
     def __init__(self, partitions=None):
         super().__init__(data=partitions,
@@ -75,40 +76,63 @@ cdef class Partitions(MultiClusterMap):
             (pyslurm.RPCError): When getting all the Partitions from the
                 slurmctld failed.
         """
+        cdef Partitions partitions = Partitions()
+        partitions.data = partitions._load_data(0, slurm.SHOW_ALL)
+        return partitions
+
+    cdef dict _load_data(self, time_t update_time, int flags):
         cdef:
-            Partitions partitions = Partitions()
-            int flags = slurm.SHOW_ALL
+            partition_info_msg_t *info = NULL
             Partition partition
             int power_save_enabled = 0
-
-        verify_rpc(slurm_load_partitions(0, &partitions.info, flags))
-        slurm_conf = slurmctld.Config.load()
+            dict out = {}
+            int rc
+
+        with nogil:
+            rc = slurm_load_partitions(update_time, &info, flags)
+        if rc != slurm.SLURM_SUCCESS:
+            # Nothing has changed since the update_time we passed in, so the
+            # Partitions we already have are still up to date.
+            if update_time and slurm_errno() == slurm.SLURM_NO_CHANGE_IN_DATA:
+                return None
+            verify_rpc(rc)
+
+        # Only release the previous response once we actually got new data.
+        slurm_free_partition_info_msg(self.info)
+        self.info = info
+        self.last_update = info.last_update
+        # The config is only needed to interpret some of the partition
+        # values, so it is loaded once per collection and not again on
+        # each refresh().
+        if self.slurm_conf is None:
+            self.slurm_conf = slurmctld.Config.load()
+        slurm_conf = self.slurm_conf
 
         # zero-out a dummy partition_info_t
-        memset(&partitions.tmp_info, 0, sizeof(partition_info_t))
+        memset(&self.tmp_info, 0, sizeof(partition_info_t))
 
         if slurm_conf.suspend_program and slurm_conf.resume_program:
             power_save_enabled = 1
 
         # Put each pointer into its own instance.
-        for cnt in range(partitions.info.record_count):
-            partition = Partition.from_ptr(&partitions.info.partition_array[cnt])
+        for cnt in range(self.info.record_count):
+            partition = Partition.from_ptr(&self.info.partition_array[cnt])
 
             # Prevent double free if xmalloc fails mid-loop and a MemoryError
             # is raised by replacing it with a zeroed-out partition_info_t.
-            partitions.info.partition_array[cnt] = partitions.tmp_info
+            self.info.partition_array[cnt] = self.tmp_info
 
             cluster = partition.cluster
-            if cluster not in partitions.data:
-                partitions.data[cluster] = {}
+            if cluster not in out:
+                out[cluster] = {}
 
             partition.power_save_enabled = power_save_enabled
             partition.slurm_conf = slurm_conf
-            partitions.data[cluster][partition.name] = partition
+            out[cluster][partition.name] = partition
 
         # We have extracted all pointers
-        partitions.info.record_count = 0
-        return partitions
+        self.info.record_count = 0
+        return out
 
     def reload(self):
         """Reload the information for Partitions in a collection.
@@ -127,6 +151,44 @@ cdef class Partitions(MultiClusterMap):
         """
         return xcollections.multi_reload(self)
 
+    def refresh(self):
+        """Incrementally refresh the information for Partitions in a collection.
+
+        Unlike `reload()`, this remembers the time of the last update
+        received from the slurmctld and only asks for new data if something
+        has changed since then. If nothing has changed, no Partition
+        instances are recreated and the collection stays as it is.
+
+        Just like with `reload()`, only Partitions which are already in the
+        collection are updated. A Partition is only replaced by its new
+        instance if its information actually differs. Partitions that don't
+        exist anymore are removed from the collection.
+
+        Returns:
+            (list[str]): Names of the Partitions whose information has
+                changed, or which do not exist anymore and were removed. The
+                list is empty if nothing has changed.
+
+        Raises:
+            (pyslurm.RPCError): When getting the Partitions from the slurmctld
+                failed.
+
+        Examples:
+            >>> import pyslurm
+            >>> parts = pyslurm.Partitions.load()
+            >>> if parts.refresh():
+            ...     print("Partitions have changed")
+        """
+        cdef dict data = self._load_data(self.last_update, slurm.SHOW_ALL)
+        if data is None:
+            return []
+
+        return xcollections.multi_refresh(self, data)
+
+    cdef bint _item_changed(self, old, new):
+        return _partition_info_changed((<Partition>old).ptr,
+                                       (<Partition>new).ptr)
+
     def modify(self, changes):
         """Modify all Partitions in a Collection.
 
@@ -160,6 +222,52 @@ cdef class Partitions(MultiClusterMap):
         return xcollections.sum_property(self, Partition.total_nodes)
 
 
+cdef bint _partition_info_changed(partition_info_t *old,
+                                 partition_info_t *new):
+    # node_inx and job_defaults_list are only derived from the nodes and
+    # job_defaults_str strings, so comparing those is enough.
+    if (old.state_up != new.state_up
+            or old.flags != new.flags
+            or old.total_cpus != new.total_cpus
+            or old.total_nodes != new.total_nodes
+            or old.cr_type != new.cr_type
+            or old.cpu_bind != new.cpu_bind
+            or old.def_mem_per_cpu != new.def_mem_per_cpu
+            or old.default_time != new.default_time
+            or old.grace_time != new.grace_time
+            or old.max_cpus_per_node != new.max_cpus_per_node
+            or old.max_cpus_per_socket != new.max_cpus_per_socket
+            or old.max_mem_per_cpu != new.max_mem_per_cpu
+            or old.max_nodes != new.max_nodes
+            or old.max_share != new.max_share
+            or old.max_time != new.max_time
+            or old.min_nodes != new.min_nodes
+            or old.over_time_limit != new.over_time_limit
+            or old.preempt_mode != new.preempt_mode
+            or old.priority_job_factor != new.priority_job_factor
+            or old.priority_tier != new.priority_tier
+            or old.resume_timeout != new.resume_timeout
+            or old.suspend_time != new.suspend_time
+            or old.suspend_timeout != new.suspend_timeout):
+        return True
+
+    return not (cstr.equal(old.nodes, new.nodes)
+                and cstr.equal(old.nodesets, new.nodesets)
+                and cstr.equal(old.allow_alloc_nodes, new.allow_alloc_nodes)
+                and cstr.equal(old.allow_accounts, new.allow_accounts)
+                and cstr.equal(old.allow_groups, new.allow_groups)
+                and cstr.equal(old.allow_qos, new.allow_qos)
+                and cstr.equal(old.deny_accounts, new.deny_accounts)
+                and cstr.equal(old.deny_qos, new.deny_qos)
+                and cstr.equal(old.alternate, new.alternate)
+                and cstr.equal(old.billing_weights_str,
+                               new.billing_weights_str)
+                and cstr.equal(old.job_defaults_str, new.job_defaults_str)
+                and cstr.equal(old.qos_char, new.qos_char)
+                and cstr.equal(old.topology_name, new.topology_name)
+                and cstr.equal(old.tres_fmt_str, new.tres_fmt_str))
+
+
 cdef class Partition:
 
     def __cinit__(self):
@@ -207,9 +315,17 @@ cdef class Partition:
     def as_dict(self):
         return self.to_dict()
 
-    def to_dict(self, recursive = False):
+    def to_dict(self, recursive = False, fields=None):
         """Partition information formatted as a dictionary.
 
+        Args:
+            recursive (bool, optional):
+                Whether nested objects should also be converted to dicts.
+                The default is `False`.
+            fields (list[str], optional):
+                Only include these attributes, in the given order. By
+                default, all attributes are included.
+
         Returns:
             (dict): Partition information as dict
 
@@ -218,7 +334,7 @@ cdef class Partition:
             >>> mypart = pyslurm.Partition.load("mypart")
             >>> mypart_dict = mypart.to_dict()
         """
-        return instance_to_dict(self, recursive)
+        return instance_to_dict(self, recursive, fields)
 
     @staticmethod
     def load(name):
@@ -288,9 +404,14 @@ cdef class Partition:
             >>> # Apply the changes to the "normal" Partition
             >>> part.modify(changes)
         """
-        cdef Partition part = <Partition>changes
+        cdef:
+            Partition part = <Partition>changes
+            int rc
+
         part.name = self._error_or_name()
-        verify_rpc(slurm_update_partition(part.ptr))
+        with nogil:
+            rc = slurm_update_partition(part.ptr)
+        verify_rpc(rc)
 
     def delete(self):
         """Delete a Partition.
@@ -77,8 +77,11 @@ cdef class Reservations(MultiClusterMap):
         cdef:
             Reservations reservations = Reservations()
             Reservation reservation
+            int rc
 
-        verify_rpc(slurm_load_reservations(0, &reservations.info))
+        with nogil:
+            rc = slurm_load_reservations(0, &reservations.info)
+        verify_rpc(rc)
 
         memset(&reservations.tmp_info, 0, sizeof(reserve_info_t))
         for cnt in range(reservations.info.record_count):
@@ -177,9 +180,17 @@ cdef class Reservation:
                            "Reservation instance?")
         return self.name
 
-    def to_dict(self, recursive = False):
+    def to_dict(self, recursive = False, fields=None):
         """Reservation information formatted as a dictionary.
 
+        Args:
+            recursive (bool, optional):
+                Whether nested objects should also be converted to dicts.
+                The default is `False`.
+            fields (list[str], optional):
+                Only include these attributes, in the given order. By
+                default, all attributes are included.
+
         Returns:
             (dict): Reservation information as dict
 
@@ -189,7 +200,7 @@ cdef class Reservation:
             >>> resv_dict = resv.to_dict()
             >>> print(resv_dict)
         """
-        return instance_to_dict(self, recursive)
+        return instance_to_dict(self, recursive, fields)
 
     @staticmethod
     def load(name):
@@ -283,13 +294,18 @@ cdef class Reservation:
             >>> # Now send the changes to the Controller:
             >>> resv.modify()
         """
-        cdef Reservation updates = changes if changes is not None else self
+        cdef:
+            Reservation updates = changes if changes is not None else self
+            int rc
+
         if not updates.umsg:
             return
 
         self._error_or_name()
         cstr.fmalloc(&updates.umsg.name, self.info.name)
-        verify_rpc(slurm_update_reservation(updates.umsg))
+        with nogil:
+            rc = slurm_update_reservation(updates.umsg)
+        verify_rpc(rc)
 
         # Make sure we clean the object from any previous changes.
         updates._dealloc_umsg()
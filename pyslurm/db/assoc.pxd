@@ -31,6 +31,7 @@ from pyslurm.slurm cimport (
     slurmdb_destroy_assoc_cond,
     slurmdb_init_assoc_rec,
     slurmdb_associations_modify,
+    list_t,
     try_xmalloc,
 )
 from pyslurm.db.util cimport (
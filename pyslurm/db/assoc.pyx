@@ -53,6 +53,7 @@ cdef class Associations(MultiClusterMap):
             Connection conn
             QualitiesOfService qos_data
             TrackableResources tres_data
+            list_t *assoc_list = NULL
 
         # Prepare SQL Filter
         if not db_filter:
@@ -63,8 +64,9 @@ cdef class Associations(MultiClusterMap):
         conn = _open_conn_or_error(db_connection)
 
         # Fetch Assoc Data
-        assoc_data = SlurmList.wrap(slurmdb_associations_get(
-            conn.ptr, cond.ptr))
+        with nogil:
+            assoc_list = slurmdb_associations_get(conn.ptr, cond.ptr)
+        assoc_data = SlurmList.wrap(assoc_list)
 
         if assoc_data.is_null:
             raise RPCError(msg="Failed to get Association data from slurmdbd")
@@ -41,6 +41,7 @@ from pyslurm.slurm cimport (
     slurm_job_state_reason_string,
     slurmdb_create_job_rec,
     slurmdb_job_modify,
+    list_t,
     xfree,
 )
 from pyslurm.db.util cimport (
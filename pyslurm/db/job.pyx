@@ -250,6 +250,7 @@ cdef class Jobs(MultiClusterMap):
             Connection conn
             QualitiesOfService qos_data
             TrackableResources tres_data
+            list_t *job_list = NULL
 
         # Prepare SQL Filter
         if not db_filter:
@@ -260,7 +261,9 @@ cdef class Jobs(MultiClusterMap):
         conn = _open_conn_or_error(db_connection)
 
         # Fetch Job data
-        job_data = SlurmList.wrap(slurmdb_jobs_get(conn.ptr, cond.ptr))
+        with nogil:
+            job_list = slurmdb_jobs_get(conn.ptr, cond.ptr)
+        job_data = SlurmList.wrap(job_list)
         if job_data.is_null:
             raise RPCError(msg="Failed to get Jobs from slurmdbd")
 
@@ -390,6 +393,7 @@ cdef class Jobs(MultiClusterMap):
             Connection conn
             SlurmList response
             SlurmListItem response_ptr
+            list_t *response_list = NULL
             list out = []
 
         # Prepare SQL Filter
@@ -406,8 +410,10 @@ cdef class Jobs(MultiClusterMap):
         # Modify Jobs, get the result
         # This returns a List of char* with the Jobs ids that were
         # modified
-        response = SlurmList.wrap(
-                slurmdb_job_modify(conn.ptr, cond.ptr, changes.ptr))
+        with nogil:
+            response_list = slurmdb_job_modify(conn.ptr, cond.ptr,
+                                               changes.ptr)
+        response = SlurmList.wrap(response_list)
 
         if not response.is_null and response.cnt:
             for response_ptr in response:
@@ -535,9 +541,17 @@ cdef class Job:
     def as_dict(self):
         return self.to_dict()
 
-    def to_dict(self, recursive = False):
+    def to_dict(self, recursive = False, fields=None):
         """Convert Database Job information to a dictionary.
 
+        Args:
+            recursive (bool, optional):
+                Whether nested objects should also be converted to dicts.
+                The default is `False`.
+            fields (list[str], optional):
+                Only include these attributes, in the given order. By
+                default, all attributes are included.
+
         Returns:
             (dict): Database Job information as dict
 
@@ -546,7 +560,7 @@ cdef class Job:
             >>> myjob = pyslurm.db.Job.load(10000)
             >>> myjob_dict = myjob.to_dict()
         """
-        return instance_to_dict(self, recursive)
+        return instance_to_dict(self, recursive, fields)
 
     def __repr__(self):
         return f'pyslurm.db.{self.__class__.__name__}({self.id})'
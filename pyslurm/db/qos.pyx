@@ -50,6 +50,7 @@ cdef class QualitiesOfService(dict):
             SlurmList qos_data
             SlurmListItem qos_ptr
             Connection conn
+            list_t *qos_list = NULL
 
         # Prepare SQL Filter
         if not db_filter:
@@ -60,7 +61,9 @@ cdef class QualitiesOfService(dict):
         conn = _open_conn_or_error(db_connection)
 
         # Fetch QoS Data
-        qos_data = SlurmList.wrap(slurmdb_qos_get(conn.ptr, cond.ptr))
+        with nogil:
+            qos_list = slurmdb_qos_get(conn.ptr, cond.ptr)
+        qos_data = SlurmList.wrap(qos_list)
 
         if qos_data.is_null:
             raise RPCError(msg="Failed to get QoS data from slurmdbd")
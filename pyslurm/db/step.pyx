@@ -68,13 +68,21 @@ cdef class JobStep:
         wrap.stats = JobStepStatistics.from_step(wrap)
         return wrap
 
-    def to_dict(self, recursive = False):
+    def to_dict(self, recursive = False, fields=None):
         """Convert Database JobStep information to a dictionary.
 
+        Args:
+            recursive (bool, optional):
+                Whether nested objects should also be converted to dicts.
+                The default is `False`.
+            fields (list[str], optional):
+                Only include these attributes, in the given order. By
+                default, all attributes are included.
+
         Returns:
             (dict): Database JobStep information as dict
         """
-        return instance_to_dict(self, recursive)
+        return instance_to_dict(self, recursive, fields)
 
     def __repr__(self):
         return f'pyslurm.db.{self.__class__.__name__}({self.id})'
@@ -31,6 +31,7 @@ from pyslurm.slurm cimport (
     slurmdb_destroy_tres_rec,
     slurmdb_find_tres_count_in_string,
     slurmdb_tres_get,
+    list_t,
     try_xmalloc,
 )
 from pyslurm.db.util cimport (
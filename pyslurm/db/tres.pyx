@@ -305,6 +305,7 @@ cdef class TrackableResources:
             SlurmList tres_data
             SlurmListItem tres_ptr
             TrackableResourceFilter db_filter = TrackableResourceFilter()
+            list_t *tres_list = NULL
 
         # Prepare SQL Filter
         db_filter._create()
@@ -313,7 +314,9 @@ cdef class TrackableResources:
         conn = _open_conn_or_error(db_connection)
 
         # Fetch TRES data
-        tres_data = SlurmList.wrap(slurmdb_tres_get(conn.ptr, db_filter.ptr))
+        with nogil:
+            tres_list = slurmdb_tres_get(conn.ptr, db_filter.ptr)
+        tres_data = SlurmList.wrap(tres_list)
 
         if tres_data.is_null:
             raise RPCError(msg="Failed to get TRES data from slurmdbd")
@@ -136,7 +136,7 @@ cdef extern void slurm_free_return_code_msg(return_code_msg_t *msg)
 # https://github.com/SchedMD/slurm/blob/2354049372e503af3217f94d65753abc440fa178/src/common/slurm_protocol_api.h#L440
 cdef extern int slurm_send_recv_controller_msg(slurm_msg_t *request_msg,
                                         slurm_msg_t *response_msg,
-                                        slurmdb_cluster_rec_t *comm_cluster_rec)
+                                        slurmdb_cluster_rec_t *comm_cluster_rec) nogil
 
 # https://github.com/SchedMD/slurm/blob/fe82218def7b57f5ecda9222e80662ebbb6415f8/src/common/slurm_protocol_defs.c#L168
 cdef extern void slurm_msg_t_init(slurm_msg_t *msg)
@@ -220,14 +220,16 @@ cdef extern time_t slurm_parse_time(char *time_str, int past)
 #
 
 cdef extern void slurm_free_job_desc_msg(job_desc_msg_t *msg)
+cdef extern void slurm_free_will_run_response_msg(will_run_response_msg_t *msg)
 cdef extern void slurm_free_job_info(job_info_t *job)
 cdef extern void slurm_free_job_info_members(job_info_t *job)
-cdef extern void slurm_free_job_step_info_response_msg(job_step_info_response_msg_t *msg)
+cdef extern void slurm_free_job_step_info_response_msg(job_step_info_response_msg_t *msg) nogil
 cdef extern void slurm_free_job_step_info_members(job_step_info_t *msg)
 cdef extern char *slurm_job_state_string(uint16_t inx)
 cdef extern char *slurm_job_state_reason_string(int inx)
 cdef extern char *slurm_job_share_string(uint16_t shared)
 cdef extern void slurm_free_update_step_msg(step_update_request_msg_t *msg)
+cdef extern void slurm_free_kill_jobs_response_msg(kill_jobs_resp_msg_t *msg)
 
 #
 # Slurm Node functions
@@ -293,8 +295,8 @@ cdef extern char *slurm_hostlist_deranged_string_xmalloc(hostlist_t *hl)
 cdef extern void slurmdb_job_cond_def_start_end(slurmdb_job_cond_t *job_cond)
 cdef extern uint64_t slurmdb_find_tres_count_in_string(char *tres_str_in, int id)
 cdef extern slurmdb_job_rec_t *slurmdb_create_job_rec()
-cdef extern void slurmdb_init_assoc_rec(slurmdb_assoc_rec_t *assoc, bool free_it)
-cdef extern void slurmdb_init_tres_cond(slurmdb_tres_cond_t *tres, bool free_it)
+cdef extern void slurmdb_init_assoc_rec(slurmdb_assoc_rec_t *assoc, bool free_it) nogil
+cdef extern void slurmdb_init_tres_cond(slurmdb_tres_cond_t *tres, bool free_it) nogil
 
 #
 # Slurm Partition functions
@@ -8,6 +8,8 @@
 # <name>" is converted to "ctypedef struct <name>"
 # * C-Macros are listed with their appropriate uint type
 # * Any definitions that cannot be translated are not included in this file
+# * All definitions are declared as nogil, so the GIL can be released when
+# calling into the Slurm API
 #
 # Generated on 2026-02-12T20:29:47.128029
 #
@@ -51,7 +53,7 @@
 # with PySlurm; if not, write to the Free Software Foundation, Inc.,
 # 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 
-cdef extern from "slurm/slurm.h":
+cdef extern from "slurm/slurm.h" nogil:
 
     uint8_t HOST_NAME_MAX
     uint8_t INFINITE8
@@ -532,7 +534,7 @@ cdef extern from "slurm/slurm.h":
     uint8_t BB_STATE_TEARDOWN_FAIL
     uint8_t BB_STATE_COMPLETE
 
-cdef extern from "slurm/slurm.h":
+cdef extern from "slurm/slurm.h" nogil:
 
     ctypedef uint64_t sluid_t
 
@@ -8,6 +8,8 @@
 # <name>" is converted to "ctypedef struct <name>"
 # * C-Macros are listed with their appropriate uint type
 # * Any definitions that cannot be translated are not included in this file
+# * All definitions are declared as nogil, so the GIL can be released when
+# calling into the Slurm API
 #
 # Generated on 2026-02-12T20:29:47.283339
 #
@@ -47,7 +49,7 @@
 # with PySlurm; if not, write to the Free Software Foundation, Inc.,
 # 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 
-cdef extern from "slurm/slurmdb.h":
+cdef extern from "slurm/slurmdb.h" nogil:
 
     uint8_t QOS_COND_FLAG_WITH_DELETED
     uint32_t SLURMDB_RES_FLAG_BASE
@@ -107,7 +109,7 @@ cdef extern from "slurm/slurmdb.h":
     uint8_t COORD_SET_DIRECT
     uint8_t COORD_SET_BY_ACCT
 
-cdef extern from "slurm/slurmdb.h":
+cdef extern from "slurm/slurmdb.h" nogil:
 
     ctypedef enum slurmdb_admin_level_t:
         SLURMDB_ADMIN_NOTSET
@@ -41,4 +41,6 @@ from .helpers import (
     dehumanize,
     nodelist_from_range_str,
     nodelist_to_range_str,
+    set_name_cache,
+    clear_name_cache,
 )
@@ -24,10 +24,11 @@
 
 from pyslurm cimport slurm
 from pyslurm.slurm cimport xfree, try_xmalloc, xmalloc
-from libc.string cimport memcpy, strlen
+from libc.string cimport memcpy, strlen, strcmp
 
 cdef char *from_unicode(s)
 cdef to_unicode(char *s, default=*)
+cdef bint equal(char *s1, char *s2)
 cdef fmalloc(char **old, val)
 cdef fmalloc2(char **p1, char **p2, val)
 cdef free_array(char **arr, count)
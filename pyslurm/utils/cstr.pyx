@@ -53,6 +53,19 @@ cdef to_unicode(char *_str, default=None):
         return default
 
 
+cdef bint equal(char *s1, char *s2):
+    """Check whether two char* hold the same string, without converting them.
+
+    NULL is only equal to NULL.
+    """
+    if <void*>s1 == <void*>s2:
+        return True
+    elif not s1 or not s2:
+        return False
+
+    return strcmp(s1, s2) == 0
+
+
 cdef fmalloc2(char **p1, char **p2, val):
     """Like fmalloc, but copies the value to 2 char pointers."""
     fmalloc(p1, val)
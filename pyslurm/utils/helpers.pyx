@@ -27,6 +27,7 @@ from grp import getgrgid, getgrnam, getgrall
 from pwd import getpwuid, getpwnam, getpwall
 from os import getuid, getgid
 from itertools import chain
+from time import monotonic
 import re
 import signal
 from pyslurm.constants import UNLIMITED
@@ -43,6 +44,99 @@ MEMORY_UNITS = {
 }
 
 
+cdef class _NameCache:
+    """Bounded cache for UID/GID to name translations, with a TTL."""
+    cdef:
+        dict entries
+        Py_ssize_t maxsize
+        double ttl
+        resolve
+
+    def __init__(self, resolve, maxsize, ttl):
+        self.entries = {}
+        self.resolve = resolve
+        self.configure(maxsize, ttl)
+
+    def configure(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = float("inf") if ttl is None else ttl
+        self.entries.clear()
+
+    cdef get(self, uint32_t key):
+        cdef double now = monotonic()
+
+        entry = self.entries.get(key)
+        if entry is not None and entry[1] > now:
+            return entry[0]
+
+        # Names that don't exist are cached as None too, so unknown IDs don't
+        # cause a query to the passwd/group database on every access.
+        name = self.resolve(key)
+        if self.maxsize > 0:
+            self.entries.pop(key, None)
+            if len(self.entries) >= self.maxsize:
+                # Dicts are ordered, so this is the oldest entry.
+                self.entries.pop(next(iter(self.entries)), None)
+            self.entries[key] = (name, now + self.ttl)
+
+        return name
+
+
+def _getpwuid_name(uid):
+    try:
+        return getpwuid(uid).pw_name
+    except KeyError:
+        return None
+
+
+def _getgrgid_name(gid):
+    try:
+        return getgrgid(gid).gr_name
+    except KeyError:
+        return None
+
+
+cdef _NameCache _user_names = _NameCache(_getpwuid_name, 8192, 300)
+cdef _NameCache _group_names = _NameCache(_getgrgid_name, 8192, 300)
+
+
+def set_name_cache(maxsize=8192, ttl=300):
+    """Configure the cache for translating UIDs and GIDs to names.
+
+    Whenever the name for a UID or GID is needed, e.g. for the `user_name`
+    attribute of a [pyslurm.Job][], it is looked up in the passwd or group
+    database only once and then cached for the whole process. Both found and
+    unknown IDs are cached. There is one cache for users and one for groups.
+
+    Calling this function also clears the caches.
+
+    Args:
+        maxsize (int, optional):
+            Maximum amount of entries in each cache. When the cache is full,
+            the oldest entry is removed. A value of 0 disables the cache.
+        ttl (float, optional):
+            Amount of seconds after which an entry is looked up again. If
+            `None`, entries never expire.
+
+    Examples:
+        >>> import pyslurm
+        >>> pyslurm.utils.set_name_cache(maxsize=100000, ttl=3600)
+    """
+    _user_names.configure(maxsize, ttl)
+    _group_names.configure(maxsize, ttl)
+
+
+def clear_name_cache():
+    """Remove all entries from the UID and GID name caches.
+
+    Examples:
+        >>> import pyslurm
+        >>> pyslurm.utils.clear_name_cache()
+    """
+    _user_names.entries.clear()
+    _group_names.entries.clear()
+
+
 cpdef uid_to_name(uint32_t uid, err_on_invalid=False, dict lookup={}):
     """Translate UID to a User-Name."""
     if uid == slurm.NO_VAL or uid == slurm.INFINITE:
@@ -56,12 +150,11 @@ cpdef uid_to_name(uint32_t uid, err_on_invalid=False, dict lookup={}):
             if err_on_invalid:
                 raise e
     else:
-        try:
-            name = getpwuid(uid).pw_name
+        name = _user_names.get(uid)
+        if name is not None:
             return name
-        except KeyError as e:
-            if err_on_invalid:
-                raise e
+        elif err_on_invalid:
+            raise KeyError(f"getpwuid(): uid not found: {uid}")
 
     return str(uid)
 
@@ -79,12 +172,11 @@ cpdef gid_to_name(uint32_t gid, err_on_invalid=False, dict lookup={}):
             if err_on_invalid:
                 raise e
     else:
-        try:
-            name = getgrgid(gid).gr_name
+        name = _group_names.get(gid)
+        if name is not None:
             return name
-        except KeyError as e:
-            if err_on_invalid:
-                raise e
+        elif err_on_invalid:
+            raise KeyError(f"getgrgid(): gid not found: {gid}")
 
     return str(gid)
 
@@ -329,9 +421,79 @@ def cpubind_to_num(cpu_bind):
     return flags
 
 
-def instance_to_dict(inst, recursive=False):
+# Per class list of (name, getter) for the public attributes, so the
+# attributes don't have to be looked up with dir() for every instance.
+cdef dict _dict_fields = {}
+
+
+def _get_dict_fields(cls):
+    fields = _dict_fields.get(cls)
+    if fields is not None:
+        return fields
+
+    cdef list getters = []
+    cdef dict by_name = {}
+    # Attributes that describe the instance itself instead of the data it
+    # holds, which are only included when asked for explicitly.
+    exclude = getattr(cls, "_dict_exclude", ())
+
+    for attr in dir(cls):
+        if attr.startswith("_"):
+            continue
+
+        val = getattr(cls, attr)
+        if hasattr(val, "__get__") and hasattr(val, "__set__"):
+            # A property, or an attribute defined in a .pxd
+            getter = val.__get__
+        elif not hasattr(val, "__get__") and not callable(val):
+            # A plain class attribute
+            getter = lambda inst, attr=attr: getattr(inst, attr)
+        else:
+            continue
+
+        by_name[attr] = getter
+        if attr not in exclude:
+            getters.append((attr, getter))
+
+    fields = (getters, by_name)
+    _dict_fields[cls] = fields
+    return fields
+
+
+def instance_to_dict(inst, recursive=False, fields=None):
+    cdef:
+        dict out = {}
+        list getters
+
+    if hasattr(inst, "__dict__"):
+        # Attributes can be set on the instance itself, so they are not
+        # known from the class alone.
+        return _instance_to_dict_slow(inst, recursive, fields)
+
+    getters, by_name = _get_dict_fields(type(inst))
+    if fields is not None:
+        try:
+            getters = [(field, by_name[field]) for field in fields]
+        except KeyError as e:
+            raise ValueError(f"Invalid field: {e.args[0]}") from None
+
+    for attr, getter in getters:
+        val = getter(inst)
+        if recursive and hasattr(val, "to_dict"):
+            val = val.to_dict(recursive=recursive)
+        elif callable(val):
+            continue
+
+        out[attr] = val
+    return out
+
+
+def _instance_to_dict_slow(inst, recursive=False, fields=None):
     cdef dict out = {}
-    for attr in dir(inst):
+    for attr in dir(inst) if fields is None else fields:
+        if fields is not None and not hasattr(inst, attr):
+            raise ValueError(f"Invalid field: {attr}")
+
         val = getattr(inst, attr)
         private_attr = attr.startswith("_")
 
@@ -22,6 +22,9 @@
 # cython: c_string_type=unicode, c_string_encoding=default
 # cython: language_level=3
 
+from cpython cimport array as c_array
+from libc.stdint cimport uint64_t
+
 
 cdef class MultiClusterMap:
     """Mapping of Multi-Cluster Data for a Collection.
@@ -96,3 +99,13 @@ cdef class MultiClusterMap:
         _val_type
         _id_attr
         _cluster
+        dict _indexes
+        _indexed_data
+        Py_ssize_t _indexed_len
+
+    cdef _c_column(self, field, list items, np)
+    cdef bint _item_changed(self, old, new)
+
+
+cdef c_array.array _uint_buffer(Py_ssize_t n)
+cdef _uint_column(c_array.array vals, tuple spec, np)
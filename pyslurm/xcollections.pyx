@@ -24,8 +24,39 @@
 """Custom Collection utilities"""
 
 from pyslurm import settings
+from libc.math cimport NAN
 import json
-from typing import Union, Any
+import inspect
+from array import array
+from typing import Union, Any, NamedTuple
+
+
+class CategoricalColumn(NamedTuple):
+    """A column of strings, encoded as integer codes.
+
+    Each distinct string in the column is stored only once in `categories`.
+    The value for each row is the index into `categories`, or `-1` if the
+    value was not set.
+
+    This maps directly to `pandas.Categorical.from_codes(codes, categories)`.
+
+    Attributes:
+        codes (Union[numpy.ndarray, array.array]):
+            The code for each row, as 32-bit integers.
+        categories (list[str]):
+            The distinct strings, in the order they were first seen.
+    """
+    codes: Any
+    categories: list
+
+    def decode(self):
+        """Return the original values of the column as a list.
+
+        Returns:
+            (list[str]): The decoded values, with `None` for unset values.
+        """
+        cats = self.categories
+        return [cats[code] if code >= 0 else None for code in self.codes]
 
 
 class BaseView:
@@ -194,6 +225,7 @@ cdef class MultiClusterMap:
         self._val_type = val_type
         self._id_attr = id_attr
         self._cluster = settings.LOCAL_CLUSTER
+        self._indexes = None
         if init_data:
             self._init_data(data)
 
@@ -252,6 +284,46 @@ cdef class MultiClusterMap:
     def _item_id(self, item):
         return self._id_attr.__get__(item)
 
+    def _field_getter(self, field):
+        attr = getattr(self._val_type, field, None)
+        if not inspect.isdatadescriptor(attr):
+            raise ValueError(f"Invalid field for {self._typ}: {field}")
+        return attr.__get__
+
+    def _clear_indexes(self):
+        self._indexes = None
+
+    def _get_index(self, field):
+        # Besides being cleared by the methods that modify the collection,
+        # the indexes are also thrown away when the data was modified
+        # directly, as far as that can be cheaply detected.
+        if (self._indexes is None or self._indexed_data is not self.data
+                or self._indexed_len != len(self)):
+            self._indexes = {}
+            self._indexed_data = self.data
+            self._indexed_len = len(self)
+
+        index = self._indexes.get(field)
+        if index is not None:
+            return index
+
+        getter = self._field_getter(field)
+        index = {}
+        for cluster, key, item in self.items().with_cluster():
+            val = getter(item)
+            if isinstance(val, (list, tuple, set, frozenset)):
+                vals = dict.fromkeys(val)
+            else:
+                vals = (val,)
+
+            for val in vals:
+                if val not in index:
+                    index[val] = []
+                index[val].append((cluster, key))
+
+        self._indexes[field] = index
+        return index
+
     def _iter_clusters_dict(self, other):
         for key in other:
             try:
@@ -285,6 +357,7 @@ cdef class MultiClusterMap:
         return self.data[cluster][key]
 
     def __setitem__(self, where, item):
+        self._clear_indexes()
         if where in self.data:
             self.data[where] = item
         else:
@@ -292,6 +365,7 @@ cdef class MultiClusterMap:
             self.data[cluster][key] = item
 
     def __delitem__(self, item):
+        self._clear_indexes()
         if item in self.data:
             del self.data[item]
         else:
@@ -359,6 +433,7 @@ cdef class MultiClusterMap:
         return NotImplemented
 
     def __ior__(self, other):
+        self._clear_indexes()
         if isinstance(other, MultiClusterMap):
             for cluster in other.clusters():
                 if not cluster in self.data:
@@ -440,6 +515,7 @@ cdef class MultiClusterMap:
             self.data[item.cluster] = {}
 
         self._check_val_type(item)
+        self._clear_indexes()
         self.data[item.cluster][self._item_id(item)] = item
 
     def to_json(self, multi_cluster=False):
@@ -453,11 +529,269 @@ cdef class MultiClusterMap:
 
         return json.dumps(self.to_dict(multi_cluster=multi_cluster, recursive=True))
 
-    def to_dict(self, multi_cluster=False, recursive=False):
+    def to_columns(self, fields):
+        """Convert the collection into columns of typed arrays.
+
+        For each field, the values of all items in the collection are put
+        into a single array, in the same order as iterating over `values()`.
+        If [NumPy](https://numpy.org) is installed, the columns are
+        `numpy.ndarray` objects, otherwise `array.array` is used.
+
+        The type of a column depends on the values of the field:
+
+        * Integers become 64-bit integer columns. If some values are not set,
+          a 64-bit float column is used instead, with `NaN` for unset values.
+        * Floats become 64-bit float columns, with `NaN` for unset values.
+        * Booleans become boolean columns (`int8` with `array.array`).
+        * Strings become a [pyslurm.xcollections.CategoricalColumn][], where
+          each distinct string is only stored once.
+        * Anything else, like lists or dicts, is returned as a plain `list`.
+
+        For [pyslurm.Jobs][] and [pyslurm.Nodes][], common numeric fields like
+        `cpus`, `submit_time` or `real_memory` are read directly from the
+        underlying C structures, without accessing the attributes of each
+        item. All other fields are retrieved through the attributes.
+
+        Args:
+            fields (list[str]):
+                Names of the attributes to export, for example `cpus` or
+                `user_name` for [pyslurm.Jobs][].
+
+        Returns:
+            (dict[str, Any]): A dict with the field names as keys and the
+                columns as values.
+
+        Raises:
+            (ValueError): When a field is not an attribute of the items in
+                this collection.
+
+        Examples:
+            >>> import pyslurm
+            >>> jobs = pyslurm.Jobs.load()
+            >>> cols = jobs.to_columns(["cpus", "memory", "user_name"])
+            >>> print(cols["cpus"].sum())
+            >>>
+            >>> # Get the amount of CPUs requested per User with pandas
+            >>> import pandas as pd
+            >>> users = cols["user_name"]
+            >>> df = pd.DataFrame({
+            ...     "cpus": cols["cpus"],
+            ...     "user": pd.Categorical.from_codes(users.codes,
+            ...                                       users.categories),
+            ... })
+            >>> print(df.groupby("user").cpus.sum())
+        """
+        cdef:
+            list items = list(self.values())
+            list generic = []
+            list getters = []
+            list values = []
+            dict out = {}
+
+        np = _import_numpy()
+        for field in fields:
+            getter = self._field_getter(field)
+            # Common numeric fields are read straight from the C structs of
+            # the items, without going through the Python attributes.
+            col = self._c_column(field, items, np)
+            if col is not None:
+                out[field] = col
+            else:
+                generic.append(field)
+                getters.append(getter)
+                values.append([])
+
+        for item in items:
+            for getter, col in zip(getters, values):
+                col.append(getter(item))
+
+        for field, col in zip(generic, values):
+            out[field] = _to_column(col, np)
+
+        return {field: out[field] for field in fields}
+
+    cdef _c_column(self, field, list items, np):
+        return None
+
+    cdef bint _item_changed(self, old, new):
+        # Collections can override this to compare the underlying C structs
+        # directly, which is much cheaper.
+        return old.to_dict() != new.to_dict()
+
+    def write_json(self, fp, ndjson=True, fields=None, multi_cluster=False):
+        """Write the collection as JSON to a file-like object.
+
+        Unlike `to_json()`, the whole collection is never converted to one
+        big `dict` first. Each item is converted and written on its own, which
+        keeps the memory usage low even for very large collections.
+
+        Args:
+            fp (io.TextIOBase):
+                A file-like object opened in text mode, which has a `write()`
+                method.
+            ndjson (bool, optional):
+                Write one JSON object per line for each item (Newline
+                Delimited JSON), which is the default. If `False`, a single
+                JSON object is written, in the same format as `to_json()`.
+            fields (list[str], optional):
+                Only write these attributes of each item. By default, all
+                attributes are written.
+            multi_cluster (bool, optional):
+                Only used when `ndjson` is `False`. Has the same meaning as
+                in `to_json()`. With `ndjson`, the items from all Clusters
+                are always written.
+
+        Returns:
+            (int): The amount of items written.
+
+        Raises:
+            (ValueError): When a field is not an attribute of the items in
+                this collection.
+
+        Examples:
+            >>> import pyslurm
+            >>> jobs = pyslurm.Jobs.load()
+            >>> with open("jobs.ndjson", "w") as fp:
+            ...     jobs.write_json(fp, fields=["id", "user_name", "state"])
+        """
+        cdef:
+            list getters = None
+            int count = 0
+
+        if fields is not None:
+            getters = [(field, self._field_getter(field)) for field in fields]
+
+        if ndjson:
+            for item in self.values():
+                fp.write(json.dumps(_item_to_dict(item, getters)))
+                fp.write("\n")
+                count += 1
+            return count
+
+        if not self.data:
+            clusters = {}
+        elif multi_cluster:
+            clusters = self.data
+        else:
+            cluster = self._get_cluster()
+            clusters = {cluster: self.data[cluster]}
+
+        fp.write("{")
+        for cluster_cnt, (cluster, data) in enumerate(clusters.items()):
+            if multi_cluster:
+                if cluster_cnt:
+                    fp.write(", ")
+                fp.write(f"{json.dumps(str(cluster))}: {{")
+
+            for item_cnt, (key, item) in enumerate(data.items()):
+                if item_cnt:
+                    fp.write(", ")
+                fp.write(json.dumps(str(key)))
+                fp.write(": ")
+                fp.write(json.dumps(_item_to_dict(item, getters)))
+                count += 1
+
+            if multi_cluster:
+                fp.write("}")
+        fp.write("}")
+
+        return count
+
+    def by(self, field=None, value=None, **fields):
+        """Get all items which have specific values for their attributes.
+
+        On the first lookup for a field, an index is built for it, which maps
+        each value of the field to the matching items. Subsequent lookups for
+        the same field are then answered from the index, instead of looking
+        at every item again. The indexes are thrown away when the collection
+        is modified with its own methods, for example `add()`, `pop()`,
+        `update()` or `reload()`.
+
+        If the value of a field is a list, the item can be found by each of
+        the elements in the list.
+
+        !!! note
+
+            Modifying the `dict` of a single Cluster directly, e.g.
+            `collection["cluster"][1] = item`, is not always detected. Use
+            the methods of the collection instead.
+
+        Args:
+            field (str, optional):
+                Name of the attribute to look up.
+            value (Any, optional):
+                The value the attribute must have.
+            **fields (Any):
+                More attributes and their values. An item must match all the
+                given values to be included.
+
+        Returns:
+            (MultiClusterMap): A new collection of the same type, containing
+                the matching items, in the same order as in this collection.
+
+        Raises:
+            (ValueError): When no field was given, or a field is not an
+                attribute of the items in this collection.
+
+        Examples:
+            >>> import pyslurm
+            >>> jobs = pyslurm.Jobs.load()
+            >>> alice_jobs = jobs.by("user_name", "alice")
+            >>>
+            >>> # Combine multiple attributes
+            >>> pending = jobs.by(user_name="alice", state="PENDING",
+            ...                   partition="debug")
+        """
+        cdef list matches = None
+
+        if field is not None:
+            fields[field] = value
+
+        if not fields:
+            raise ValueError("No field to look up was specified")
+
+        for name, val in fields.items():
+            found = self._get_index(name).get(val, [])
+            if matches is None:
+                matches = found
+            else:
+                keep = set(found)
+                matches = [match for match in matches if match in keep]
+
+        out = self.__class__()
+        for cluster, key in matches:
+            if cluster not in out.data:
+                out.data[cluster] = {}
+            out.data[cluster][key] = self.data[cluster][key]
+
+        return out
+
+    def to_dict(self, multi_cluster=False, recursive=False, fields=None):
+        """Convert the collection to a dictionary.
+
+        Args:
+            multi_cluster (bool, optional):
+                Whether the data of all Clusters should be returned, keyed by
+                the Cluster name. The default is `False`, which only returns
+                the data of the local Cluster.
+            recursive (bool, optional):
+                Whether nested objects should also be converted to dicts.
+            fields (list[str], optional):
+                Only include these attributes of each item. By default, all
+                attributes are included.
+
+        Returns:
+            (dict): The items, converted to dicts, by their ID.
+
+        Examples:
+            >>> import pyslurm
+            >>> jobs = pyslurm.Jobs.load()
+            >>> data = jobs.to_dict(fields=["name", "state", "user_name"])
+        """
         if not self.data:
             return {}
 
-        data = multi_dict_recursive(self, recursive)
+        data = multi_dict_recursive(self, recursive, fields)
         if multi_cluster:
             return data
         else:
@@ -540,11 +874,13 @@ cdef class MultiClusterMap:
             raise KeyError from None
 
         key = self._item_id(item)
+        self._clear_indexes()
         del self.data[item.cluster][key]
         return (key, item)
 
     def clear(self):
         """Clear the collection"""
+        self._clear_indexes()
         self.data.clear()
 
     def pop(self, key, default=None):
@@ -564,7 +900,10 @@ cdef class MultiClusterMap:
         if item is default or item == default:
             return default
 
-        cluster = item.cluster
+        # The key might be given as a (cluster, key) tuple, so delete the
+        # item by its actual key.
+        cluster, key = item.cluster, self._item_id(item)
+        self._clear_indexes()
         del self.data[cluster][key]
         if not self.data[cluster]:
             del self.data[cluster]
@@ -576,6 +915,7 @@ cdef class MultiClusterMap:
 
         This functions like `dict`'s `update` method.
         """
+        self._clear_indexes()
         for cluster, data in self._iter_clusters_dict(data):
             self.data[cluster].update(data)
 
@@ -583,11 +923,11 @@ cdef class MultiClusterMap:
             self.data[cluster].update(data)
 
 
-def multi_reload(cur, frozen=True):
+def multi_reload(cur, frozen=True, **load_kwargs):
     if not cur:
         return cur
 
-    new = cur.__class__.load()
+    new = cur.__class__.load(**load_kwargs)
     for cluster, item in list(cur.keys().with_cluster()):
         if (cluster, item) in new.keys().with_cluster():
             cur[cluster][item] = new.pop(item, cluster)
@@ -599,14 +939,156 @@ def multi_reload(cur, frozen=True):
             if (cluster, item) not in cur.keys().with_cluster():
                 cur[cluster][item] = new[cluster][item]
 
+    cur._clear_indexes()
     return cur
 
 
+def multi_refresh(MultiClusterMap cur, dict new_data):
+    cdef list changed = []
+
+    # Only the items already in the collection are updated, just like
+    # multi_reload() does it for frozen collections.
+    for cluster, key in list(cur.keys().with_cluster()):
+        new = new_data.get(cluster, {}).get(key)
+        if new is None:
+            # Gone from the slurmctld, so it must not be kept with stale data.
+            del cur.data[cluster][key]
+            if not cur.data[cluster]:
+                del cur.data[cluster]
+            changed.append(key)
+            continue
+
+        if cur._item_changed(cur.data[cluster][key], new):
+            cur.data[cluster][key] = new
+            changed.append(key)
+
+    if changed:
+        cur._clear_indexes()
+    return changed
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _typed_array(values, typecode, np):
+    if np is not None:
+        return np.array(values, dtype="?" if typecode == "b" else typecode)
+    return array(typecode, values)
+
+
+# Template for new buffers of raw unsigned values.
+cdef c_array.array _UINT64 = array("Q")
+cdef c_array.array _INT64 = array("q")
+cdef c_array.array _FLOAT64 = array("d")
+
+
+cdef c_array.array _uint_buffer(Py_ssize_t n):
+    return c_array.clone(_UINT64, n, zero=False)
+
+
+cdef _uint_column(c_array.array vals, tuple spec, np):
+    # Turns raw values into the same column that _to_column() creates for
+    # the parsed values. spec describes how the attribute parses the value:
+    # (noval, inf, zero_is_noval, on_noval, inf_is_null). Returns None if
+    # the column can't be represented as numbers, e.g. with "UNLIMITED".
+    cdef:
+        uint64_t *raw = vals.data.as_ulonglongs
+        Py_ssize_t n = len(vals)
+        uint64_t noval = spec[0]
+        uint64_t inf = spec[1]
+        bint zero_is_noval = spec[2]
+        bint noval_is_null = spec[3] is None
+        uint64_t on_noval = 0 if noval_is_null else spec[3]
+        bint inf_is_null = spec[4]
+        # Empty columns are float columns, just like in _to_column()
+        bint has_null = n == 0
+        c_array.array col
+        Py_ssize_t i
+
+    for i in range(n):
+        if raw[i] == noval or (raw[i] == 0 and zero_is_noval):
+            if noval_is_null:
+                has_null = True
+            else:
+                raw[i] = on_noval
+        elif raw[i] == inf:
+            if not inf_is_null:
+                return None
+            has_null = True
+
+    if not has_null:
+        col = c_array.clone(_INT64, n, zero=False)
+        for i in range(n):
+            col.data.as_longlongs[i] = <long long>raw[i]
+        typecode = "q"
+    else:
+        col = c_array.clone(_FLOAT64, n, zero=False)
+        for i in range(n):
+            if (raw[i] == inf or (noval_is_null and (raw[i] == noval
+                    or (raw[i] == 0 and zero_is_noval)))):
+                col.data.as_doubles[i] = NAN
+            else:
+                col.data.as_doubles[i] = <double>raw[i]
+        typecode = "d"
+
+    return col if np is None else _typed_array(col, typecode, np)
+
+
+def _to_column(list values, np):
+    cdef list non_null = [val for val in values if val is not None]
+    cdef bint has_null = len(non_null) != len(values)
+    cdef dict lookup
+
+    if non_null and all(isinstance(val, str) for val in non_null):
+        lookup = {}
+        codes = [-1 if val is None else lookup.setdefault(val, len(lookup))
+                 for val in values]
+        return CategoricalColumn(_typed_array(codes, "i", np), list(lookup))
+
+    if not has_null and non_null:
+        if all(type(val) is bool for val in non_null):
+            return _typed_array(values, "b", np)
+
+        if all(type(val) is int for val in non_null):
+            try:
+                return _typed_array(values, "q", np)
+            except OverflowError:
+                return _typed_array(values, "Q", np)
+
+    if all(isinstance(val, (int, float)) and type(val) is not bool
+           for val in non_null):
+        return _typed_array([float("nan") if val is None else val
+                             for val in values], "d", np)
+
+    return values
+
+
+def _item_to_dict(item, list getters):
+    if getters is None:
+        return item.to_dict(recursive=True)
+
+    cdef dict out = {}
+    for field, getter in getters:
+        val = getter(item)
+        if hasattr(val, "to_dict"):
+            val = val.to_dict(recursive=True)
+        out[field] = val
+
+    return out
+
+
 # TODO: fix this function name to be less bad
-def dict_recursive(collection, recursive = False):
+def dict_recursive(collection, recursive = False, fields=None):
     cdef dict out = {}
     for item_id, item in collection.items():
-        if hasattr(item, "to_dict"):
+        if fields is not None:
+            out[item_id] = item.to_dict(recursive=recursive, fields=fields)
+        elif hasattr(item, "to_dict"):
             out[item_id] = item.to_dict(recursive=recursive)
     return out
 
@@ -616,10 +1098,10 @@ def to_json(collection):
 
 
 # TODO: fix this function name to be less bad
-def multi_dict_recursive(collection, recursive = False):
+def multi_dict_recursive(collection, recursive = False, fields=None):
     cdef dict out = collection.data.copy()
     for cluster, data in collection.data.items():
-        out[cluster] = dict_recursive(data, recursive)
+        out[cluster] = dict_recursive(data, recursive, fields)
     return out
 
 
@@ -129,6 +129,8 @@ def translate_slurm_header(hdr_dir, hdr):
 # <name>" is converted to "ctypedef struct <name>"
 # * C-Macros are listed with their appropriate uint type
 # * Any definitions that cannot be translated are not included in this file
+# * All definitions are declared as nogil, so the GIL can be released when
+# calling into the Slurm API
 #
 # Generated on {datetime.now().isoformat()}
 #
@@ -167,6 +169,8 @@ def translate_slurm_header(hdr_dir, hdr):
     c = click.get_current_context()
     code = disclaimer + pyslurm_copyright + macros + "\n" + str(codegen)
     code = code.replace("cpdef", "cdef")
+    code = code.replace(f'cdef extern from "slurm/{hdr}":',
+                        f'cdef extern from "slurm/{hdr}" nogil:')
     if c.params["stdout"]:
         print(code)
     else:
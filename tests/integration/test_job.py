@@ -88,6 +88,30 @@ def test_send_signal(submit_job):
     util.wait_for_job_state(job.id, "CANCELLED", timeout=30)
 
 
+def test_cancel_many(submit_job):
+    submitted = [submit_job(priority=0) for i in range(3)]
+    jobs = Jobs([job.id for job in submitted])
+
+    results = jobs.cancel()
+    assert results == {job.id: 0 for job in submitted}
+    for job in submitted:
+        util.wait_for_job_state(job.id, "CANCELLED")
+
+
+def test_cancel_matching(submit_job):
+    import os
+    submitted = [submit_job(priority=0) for i in range(2)]
+
+    with pytest.raises(ValueError):
+        Jobs.cancel_matching()
+
+    results = Jobs.cancel_matching(user=os.getuid(), state="PENDING",
+                                   name="test_job")
+    for job in submitted:
+        assert results[job.id] == 0
+        util.wait_for_job_state(job.id, "CANCELLED")
+
+
 def test_suspend_unsuspend(submit_job):
     job = submit_job()
 
@@ -159,6 +183,179 @@ def test_get_job_queue(submit_job):
         assert isinstance(jobs[job.id], Job)
 
 
+def test_load_by_user(submit_job):
+    import os
+    submitted = [submit_job() for i in range(2)]
+
+    jobs = Jobs.load(user=os.getuid())
+    for job in submitted:
+        assert job.id in jobs
+    assert all(job.user_id == os.getuid() for job in jobs.values())
+
+    user_name = jobs[submitted[0].id].user_name
+    jobs = Jobs.load(user=[user_name, os.getuid()])
+    for job in submitted:
+        assert job.id in jobs
+
+    jobs.reload()
+    for job in submitted:
+        assert job.id in jobs
+    assert jobs.refresh()
+
+
+def test_load_lazy(submit_job):
+    submitted = [submit_job() for i in range(3)]
+
+    jobs = Jobs.load()
+    lazy_jobs = Jobs.load(lazy=True)
+    assert lazy_jobs.lazy
+    assert list(lazy_jobs.keys()) == list(jobs.keys())
+
+    job = lazy_jobs[submitted[0].id]
+    assert isinstance(job, Job)
+    assert job.id == submitted[0].id
+    assert lazy_jobs[submitted[0].id] is job
+    assert lazy_jobs.get(submitted[1].id).id == submitted[1].id
+
+    for job in lazy_jobs.values():
+        assert isinstance(job, Job)
+    assert list(lazy_jobs.keys()) == list(jobs.keys())
+
+    lazy_jobs.reload()
+    assert lazy_jobs.lazy
+    for job in submitted:
+        assert isinstance(lazy_jobs[job.id], Job)
+
+
+def test_resource_layouts(submit_job):
+    job = submit_job()
+    util.wait_for_job_running(job.id)
+
+    jobs = Jobs.load()
+    nodes = pyslurm.Nodes.load()
+    layouts = jobs.resource_layouts()
+    assert layouts == jobs.resource_layouts(nodes=nodes)
+
+    single = jobs[job.id].get_resource_layout_per_node(nodes=nodes)
+    assert set(layouts[job.id]) == set(single)
+    assert jobs[job.id].get_resource_layout_per_node() == single
+    for node, cpu_ids in layouts[job.id].items():
+        threads = nodes[node].threads_per_core or 1
+        assert len(cpu_ids) >= threads
+        assert len(cpu_ids) % threads == 0
+
+
+def test_load_view(submit_job):
+    submitted = [submit_job() for i in range(3)]
+
+    jobs = Jobs.load(view=True)
+    assert jobs.view
+    for job in submitted:
+        assert jobs[job.id].is_view
+        assert jobs[job.id].name == job.name
+
+    job = jobs[submitted[0].id]
+    data = job.to_dict()
+    assert job.detach() is job
+    assert not job.is_view
+
+    # The detached Job stays valid after the shared response is gone.
+    del jobs
+    assert job.name == data["name"]
+    assert job.user_name == data["user_name"]
+
+    lazy_views = Jobs.load(lazy=True, view=True)
+    assert lazy_views[submitted[1].id].is_view
+
+    jobs = Jobs.load(view=True)
+    jobs.reload()
+    assert jobs.view
+    assert jobs[submitted[2].id].is_view
+
+
+def test_jobs_by_node(submit_job):
+    from pyslurm.utils.helpers import nodelist_from_range_str
+    job = submit_job()
+    pending = submit_job(priority=0)
+    util.wait_for_job_running(job.id)
+
+    jobs = Jobs.load()
+    by_node = jobs.jobs_by_node()
+    nodes = nodelist_from_range_str(jobs[job.id].allocated_nodes)
+    assert nodes
+
+    for node in nodes:
+        assert job.id in [j.id for j in by_node[node]]
+
+    for node_jobs in by_node.values():
+        assert pending.id not in [j.id for j in node_jobs]
+
+
+def test_load_states(submit_job):
+    running = submit_job()
+    pending = submit_job(priority=0)
+    util.wait_for_job_running(running.id)
+
+    states = Jobs.load_states([running.id, pending.id])
+    assert states == {running.id: "RUNNING", pending.id: "PENDING"}
+
+    states = Jobs.load_states()
+    assert states[running.id] == "RUNNING"
+    assert states[pending.id] == "PENDING"
+
+    assert Jobs.load_states([]) == {}
+
+
+def test_wait_for(submit_job):
+    submitted = [submit_job(script="#!/bin/bash\nsleep 1\n") for i in range(2)]
+    job_ids = [job.id for job in submitted]
+
+    done = dict(pyslurm.wait_for(job_ids, timeout=120, min_interval=0.5))
+    assert done == {job_id: "COMPLETED" for job_id in job_ids}
+
+    held = submit_job(priority=0)
+    with pytest.raises(TimeoutError):
+        list(pyslurm.wait_for([held.id], timeout=2, min_interval=0.5))
+
+
+def test_refresh(submit_job):
+    jobs = Jobs.load()
+    job = submit_job(priority=0)
+
+    assert job.id not in jobs
+    assert jobs.refresh()
+    assert job.id in jobs
+
+    # Nothing has changed since the last refresh, so the same instance must
+    # still be in the collection.
+    jobs.refresh()
+    cached = jobs[job.id]
+    assert not jobs.refresh()
+    assert jobs[job.id] is cached
+
+
+def test_refresh_frozen(submit_job):
+    job = submit_job(priority=0)
+    jobs = Jobs.load(frozen=True)
+    new_job = submit_job(priority=0)
+
+    assert jobs.refresh()
+    assert job.id in jobs
+    assert new_job.id not in jobs
+
+
+def test_load_threaded(submit_job):
+    from concurrent.futures import ThreadPoolExecutor
+
+    job = submit_job(priority=0)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(Jobs.load) for i in range(8)]
+        results = [f.result() for f in futures]
+
+    for jobs in results:
+        assert job.id in jobs
+
+
 def test_load_steps(submit_job):
     submitted = submit_job()
     util.wait_for_job_running(submitted.id)
@@ -221,6 +418,45 @@ sleep 60
         assert step.stats.elapsed_cpu_time > 0
 
 
+def test_load_stats_concurrent(submit_job):
+    submitted = [submit_job() for i in range(3)]
+    for job in submitted:
+        util.wait_for_job_running(job.id)
+
+    jobs = Jobs.load()
+    stats = jobs.load_stats(max_workers=4, timeout=30)
+    assert isinstance(stats, JobStatistics)
+
+    for job in submitted:
+        job = jobs[job.id]
+        assert job.steps
+        assert job.pids
+        for step in job.steps.values():
+            assert isinstance(step.stats, JobStepStatistics)
+            assert step.pids
+
+    job = Job.load(submitted[0].id)
+    job_stats = job.load_stats(max_workers=2)
+    assert isinstance(job_stats, JobStatistics)
+    assert job.pids
+
+
+def test_load_priority_factors(submit_job):
+    _ = [submit_job(begin_time="now+1hour") for i in range(2)]
+
+    factors = pyslurm.JobPriorityFactors.load()
+    assert isinstance(factors, pyslurm.JobPriorityFactors)
+    for factor in factors.values():
+        assert factor.job_id
+        assert factor.priority >= 1
+        assert factor.to_dict()
+
+    columns = factors.to_columns(["job_id", "age", "fairshare", "priority"])
+    assert len(columns["job_id"]) == len(factors)
+    for col in factors.tres_to_columns().values():
+        assert len(col) == len(factors)
+
+
 def test_to_json(submit_job):
     _ = [submit_job(priority=0) for i in range(3)]
 
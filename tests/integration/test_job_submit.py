@@ -22,7 +22,9 @@
 
 from util import create_job_script
 from pyslurm import (
+    Job,
     JobSubmitDescription,
+    HeterogeneousJobSubmitDescription,
 )
 
 
@@ -47,3 +49,57 @@ def test_submit_example1():
     desc.is_requeueable = True
     desc.kill_on_node_fail = True
     desc.submit()
+
+
+def test_submit_many():
+    template = job_desc(time_limit=10)
+    overrides = [
+        {"name": "many1"},
+        {"name": "many2", "environment": {"PYSLURM_TEST": "1"}},
+        {"name": "many3", "memory_per_node": "1M", "memory_per_cpu": "1M"},
+    ]
+    job_ids, errors = template.submit_many(iter(overrides), max_workers=2)
+
+    assert len(job_ids) == 3
+    assert job_ids[2] is None
+    assert list(errors) == [2]
+    assert isinstance(errors[2], ValueError)
+
+    for job_id, changes in zip(job_ids[:2], overrides):
+        job = Job.load(job_id)
+        assert job.name == changes["name"]
+        job.cancel()
+
+
+def test_submit_het_job():
+    desc = HeterogeneousJobSubmitDescription([
+        job_desc(name="het", time_limit=10),
+        JobSubmitDescription(ntasks=1, time_limit=10),
+    ])
+    het_job_id = desc.submit()
+
+    for offset in range(len(desc.components)):
+        job = Job.load(het_job_id + offset)
+        assert job.heterogeneous_id == het_job_id
+        assert job.heterogeneous_offset == offset
+
+    Job(het_job_id).cancel()
+
+
+def test_will_run():
+    result = job_desc(time_limit=10).will_run()
+    assert result.start_time
+    assert result.nodes
+    assert isinstance(result.preempted_job_ids, list)
+
+
+def test_will_run_many():
+    descs = [job_desc(time_limit=10, name=f"candidate{i}") for i in range(3)]
+    descs.append(job_desc(time_limit=10, ntasks=100000))
+    results, errors = JobSubmitDescription.will_run_many(descs)
+
+    assert len(results) == 4
+    # Only the name differs, so all three share the same result.
+    assert results[0] is results[1] is results[2]
+    assert results[3] is None
+    assert list(errors) == [3]
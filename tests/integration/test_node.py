@@ -22,7 +22,7 @@
 
 import pytest
 import json
-from pyslurm import Node, Nodes, RPCError
+from pyslurm import Node, Nodes, Partitions, RPCError
 
 
 def test_load():
@@ -51,6 +51,43 @@ def test_modify():
     assert Node.load(node.name).weight == 5000
 
 
+def test_load_partitions():
+    eager = Nodes.load(partitions=True)
+    lazy = Nodes.load()
+    snapshot = Nodes.load(partitions=Partitions.load())
+    skipped = Nodes.load(partitions=False)
+
+    for name, node in eager.items():
+        assert lazy[name].partitions == node.partitions
+        assert snapshot[name].partitions == node.partitions
+        assert skipped[name].partitions == []
+
+
+def test_load_names():
+    all_nodes = Nodes.load()
+    names = list(all_nodes.keys())[:2]
+
+    nodes = Nodes.load(names=names + ["nonexistent"])
+    assert sorted(nodes.keys()) == sorted(names)
+    for name in names:
+        assert nodes[name].partitions == all_nodes[name].partitions
+
+    assert not Nodes.load(names=[])
+
+
+def test_refresh():
+    nodes = Nodes.load()
+    name, node = next(iter(nodes.items()))
+    weight = node.weight
+
+    node.modify(Node(weight=12345))
+    try:
+        assert name in nodes.refresh()
+        assert nodes[name].weight == 12345
+    finally:
+        node.modify(Node(weight=weight))
+
+
 def test_parse_all():
     _, node = Nodes.load().popitem()
     assert node.to_dict()
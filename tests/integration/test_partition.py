@@ -97,3 +97,18 @@ def test_reload():
 
     for part in _tmp_parts.values():
         part.delete()
+
+
+def test_refresh():
+    parts = Partitions.load()
+    name, part = next(iter(parts.items()))
+    assert parts.refresh() == []
+    assert parts[name] is part
+    default_time = part.default_time or "UNLIMITED"
+
+    part.modify(Partition(default_time=120))
+    try:
+        assert name in parts.refresh()
+        assert parts[name].default_time == 120
+    finally:
+        part.modify(Partition(default_time=default_time))
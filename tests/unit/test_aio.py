@@ -0,0 +1,127 @@
+#########################################################################
+# test_aio.py - asyncio front-end unit tests
+#########################################################################
+# Copyright (C) 2026 Toni Harzendorf <toni.harzendorf@gmail.com>
+#
+# This file is part of PySlurm
+#
+# PySlurm is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+
+# PySlurm is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with PySlurm; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""test_aio.py - Test the asyncio front-end."""
+
+import asyncio
+import threading
+import pytest
+from pyslurm import aio
+
+
+def run_coro(coro):
+    # asyncio.run() is only available since Python 3.7
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class FakeCall:
+    def __init__(self):
+        self.calls = 0
+        self.release = threading.Event()
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        self.release.wait(5)
+        return object()
+
+
+def test_run():
+    def add(a, b=0):
+        return a + b
+
+    assert run_coro(aio.run(add, 1, b=2)) == 3
+
+
+def test_run_coalesce():
+    fake = FakeCall()
+
+    async def main():
+        tasks = [asyncio.ensure_future(aio.run(fake, 1, coalesce=True))
+                 for _ in range(5)]
+        other = asyncio.ensure_future(aio.run(fake, 2, coalesce=True))
+        await asyncio.sleep(0.1)
+        fake.release.set()
+        return await asyncio.gather(*tasks), await other
+
+    results, other = run_coro(main())
+    assert fake.calls == 2
+    assert all(r is results[0] for r in results)
+    assert other is not results[0]
+    assert not aio._inflight
+
+
+def test_run_no_coalesce():
+    fake = FakeCall()
+    fake.release.set()
+
+    async def main():
+        return await asyncio.gather(*[aio.run(fake, 1) for _ in range(3)])
+
+    run_coro(main())
+    assert fake.calls == 3
+
+
+def test_run_timeout():
+    fake = FakeCall()
+
+    async def main():
+        waiting = asyncio.ensure_future(aio.run(fake, coalesce=True))
+        with pytest.raises(asyncio.TimeoutError):
+            await aio.run(fake, coalesce=True, timeout=0.1)
+
+        # The shared call is not cancelled by the timeout of one caller.
+        fake.release.set()
+        return await waiting
+
+    assert run_coro(main()) is not None
+    assert fake.calls == 1
+
+
+def test_run_cancel():
+    fake = FakeCall()
+
+    async def main():
+        task = asyncio.ensure_future(aio.run(fake))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        fake.release.set()
+
+    run_coro(main())
+
+
+def test_run_error():
+    def fail():
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError):
+        run_coro(aio.run(fail, coalesce=True))
+    assert not aio._inflight
+
+
+def test_set_max_workers():
+    aio.set_max_workers(2)
+    assert aio._get_executor()._max_workers == 2
+    aio.set_max_workers(8)
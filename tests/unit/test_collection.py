@@ -285,6 +285,12 @@ class TestMultiClusterMap:
         item = col.pop(999, default="def")
         assert item == "def"
 
+        item = col.pop((OTHER_CLUSTER, 10))
+        assert item.id == 10
+        assert item.cluster == OTHER_CLUSTER
+        assert (OTHER_CLUSTER, 10) not in col.keys().with_cluster()
+        assert len(col) == col_len - 2
+
     def test_contains(self):
         col = self._create_collection()
         item = pyslurm.db.Job(1)
@@ -301,6 +307,38 @@ class TestMultiClusterMap:
         data = col.to_json(multi_cluster=True)
         assert data
 
+    def test_write_json(self):
+        import io
+        import json
+        col = self._create_collection()
+
+        fp = io.StringIO()
+        assert col.write_json(fp) == 4
+        lines = fp.getvalue().splitlines()
+        assert len(lines) == 4
+        assert [json.loads(line)["id"] for line in lines] == [1, 2, 1, 10]
+
+        fp = io.StringIO()
+        col.write_json(fp, fields=["id", "cluster"])
+        first = json.loads(fp.getvalue().splitlines()[0])
+        assert first == {"id": 1, "cluster": LOCAL_CLUSTER}
+
+        fp = io.StringIO()
+        assert col.write_json(fp, ndjson=False, multi_cluster=True) == 4
+        assert json.loads(fp.getvalue()) == json.loads(
+            col.to_json(multi_cluster=True))
+
+        fp = io.StringIO()
+        assert col.write_json(fp, ndjson=False, fields=["id"]) == 2
+        assert json.loads(fp.getvalue()) == {"1": {"id": 1}, "2": {"id": 2}}
+
+        fp = io.StringIO()
+        assert pyslurm.db.Jobs().write_json(fp, ndjson=False) == 0
+        assert fp.getvalue() == "{}"
+
+        with pytest.raises(ValueError):
+            col.write_json(io.StringIO(), fields=["not_an_attribute"])
+
     def test_cluster_view(self):
         col = self._create_collection()
         assert len(col.clusters()) == 2
@@ -325,6 +363,60 @@ class TestMultiClusterMap:
         expected = 0
         assert sum_property(object_dict, TestObject.cpus) == expected
 
+    def test_to_columns(self):
+        col = self._create_collection()
+        cols = col.to_columns(["id", "cluster", "user_name"])
+
+        assert list(cols["id"]) == [1, 2, 1, 10]
+
+        clusters = cols["cluster"]
+        assert isinstance(clusters, pyslurm.xcollections.CategoricalColumn)
+        assert clusters.categories == [LOCAL_CLUSTER, OTHER_CLUSTER]
+        assert list(clusters.codes) == [0, 0, 1, 1]
+        assert clusters.decode() == [LOCAL_CLUSTER, LOCAL_CLUSTER,
+                                     OTHER_CLUSTER, OTHER_CLUSTER]
+
+        assert len(cols["user_name"]) == 4
+
+        with pytest.raises(ValueError):
+            col.to_columns(["not_an_attribute"])
+
+        with pytest.raises(ValueError):
+            col.to_columns(["to_dict"])
+
+        assert len(pyslurm.db.Jobs().to_columns(["id"])["id"]) == 0
+
+    def test_by(self):
+        col = self._create_collection()
+
+        other = col.by("cluster", OTHER_CLUSTER)
+        assert isinstance(other, pyslurm.db.Jobs)
+        assert list(other.keys().with_cluster()) == [
+            (OTHER_CLUSTER, 1), (OTHER_CLUSTER, 10)]
+        assert other[10] is col[OTHER_CLUSTER][10]
+
+        found = col.by(cluster=OTHER_CLUSTER, id=10)
+        assert list(found.keys().with_cluster()) == [(OTHER_CLUSTER, 10)]
+        assert not col.by("cluster", "unknown")
+
+        col.add(pyslurm.db.Job(20, cluster=OTHER_CLUSTER))
+        assert len(col.by("cluster", OTHER_CLUSTER)) == 3
+
+        col.pop((OTHER_CLUSTER, 1))
+        assert len(col.by("cluster", OTHER_CLUSTER)) == 2
+
+        col.update({OTHER_CLUSTER: {30: pyslurm.db.Job(30, cluster=OTHER_CLUSTER)}})
+        assert len(col.by("cluster", OTHER_CLUSTER)) == 3
+
+        del col[OTHER_CLUSTER][30]
+        assert len(col.by("cluster", OTHER_CLUSTER)) == 2
+
+        with pytest.raises(ValueError):
+            col.by()
+
+        with pytest.raises(ValueError):
+            col.by("not_an_attribute", 1)
+
     def test_ior(self):
         col = self._create_collection()
         col_len = len(col)
@@ -54,6 +54,8 @@ from pyslurm.utils.helpers import (
     nodelist_from_range_str,
     nodelist_to_range_str,
     gres_from_tres_dict,
+    set_name_cache,
+    clear_name_cache,
 )
 from pyslurm.utils import cstr
 
@@ -380,6 +382,45 @@ class TestMiscUtil:
         with pytest.raises(KeyError):
             name = group_to_gid("invalid_group")
 
+    def test_name_cache(self, monkeypatch):
+        import pyslurm.utils.helpers as helpers
+        calls = []
+
+        def _getpwuid(uid):
+            calls.append(uid)
+            if uid == 0:
+                return type("pw", (), {"pw_name": "root"})
+            raise KeyError(uid)
+
+        monkeypatch.setattr(helpers, "getpwuid", _getpwuid)
+        set_name_cache(maxsize=2, ttl=None)
+
+        assert uid_to_name(0) == "root"
+        assert uid_to_name(0) == "root"
+        assert calls == [0]
+
+        # Unknown IDs are also cached
+        assert uid_to_name(2**32 - 5) == str(2**32 - 5)
+        with pytest.raises(KeyError):
+            uid_to_name(2**32 - 5, err_on_invalid=True)
+        assert calls == [0, 2**32 - 5]
+
+        # The oldest entry is removed when the cache is full
+        uid_to_name(1)
+        uid_to_name(0)
+        assert calls == [0, 2**32 - 5, 1, 0]
+
+        clear_name_cache()
+        uid_to_name(0)
+        assert calls == [0, 2**32 - 5, 1, 0, 0]
+
+        set_name_cache(ttl=0)
+        uid_to_name(0)
+        uid_to_name(0)
+        assert calls == [0, 2**32 - 5, 1, 0, 0, 0, 0]
+
+        set_name_cache()
+
     def test_expand_range_str(self):
         r = expand_range_str("1-5,6,7,10-11")
         assert r == [1, 2, 3, 4, 5, 6, 7, 10, 11]
@@ -20,7 +20,11 @@
 # 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 """test_job.py - Unit test basic job functionalities."""
 
-from pyslurm import Job
+import pytest
+from pyslurm import Job, Jobs
+from pyslurm.xcollections import _to_column
+from pyslurm.core.job.job import _JOB_COLUMNS
+from pyslurm.core.job.job import _parse_user_ids
 from pyslurm.core.job.util import (
     acctg_profile_int_to_list,
     dependency_str_to_dict,
@@ -38,6 +42,35 @@ def test_parse_all():
     assert Job(9999).to_dict()
 
 
+def test_to_dict_fields():
+    job = Job(9999)
+    full = job.to_dict()
+    assert job.to_dict() == full
+
+    data = job.to_dict(fields=["name", "id"])
+    assert list(data) == ["name", "id"]
+    assert data == {"name": full["name"], "id": 9999}
+
+    with pytest.raises(ValueError):
+        job.to_dict(fields=["does_not_exist"])
+
+
+def test_to_dict_keys():
+    job = Job(9999)
+    keys = set(job.to_dict())
+
+    # Whether a Job is a view is not part of its data.
+    assert "is_view" not in keys
+    assert job.to_dict(fields=["is_view"]) == {"is_view": False}
+
+    expected = {
+        attr for attr in dir(Job)
+        if not attr.startswith("_")
+        and hasattr(getattr(Job, attr), "__set__")
+    }
+    assert keys == expected - {"is_view"}
+
+
 def test_parse_dependencies_to_dict():
     expected = None
     assert dependency_str_to_dict("") == expected
@@ -69,3 +102,28 @@ def test_acctg_profile_int_to_list():
 def test_cpu_freq_int_to_str():
     expected = None
     assert cpu_freq_int_to_str(0) == expected
+
+
+def test_parse_user_ids():
+    assert _parse_user_ids(None) is None
+    assert _parse_user_ids([]) is None
+    assert _parse_user_ids(()) is None
+    assert _parse_user_ids(0) == [0]
+    assert _parse_user_ids(["root", 0]) == [0]
+
+
+def _column_values(col):
+    return [None if val != val else val for val in list(col)]
+
+
+def test_to_columns_from_c():
+    jobs = Jobs([Job(1), Job(2)])
+    fields = list(_JOB_COLUMNS)
+    cols = jobs.to_columns(fields)
+
+    # The columns read from the C structs must be the same as the ones
+    # created from the attributes.
+    for field in fields:
+        expected = _to_column([getattr(job, field) for job in jobs.values()],
+                              None)
+        assert _column_values(cols[field]) == _column_values(expected)
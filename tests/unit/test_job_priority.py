@@ -0,0 +1,44 @@
+#########################################################################
+# test_job_priority.py - job priority factors unit tests
+#########################################################################
+# Copyright (C) 2026 Toni Harzendorf <toni.harzendorf@gmail.com>
+#
+# This file is part of PySlurm
+#
+# PySlurm is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+
+# PySlurm is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with PySlurm; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""test_job_priority.py - Unit test job priority factor functionalities."""
+
+import pyslurm
+from pyslurm import JobPriorityFactor, JobPriorityFactors
+
+
+def test_create_instance():
+    factor = JobPriorityFactor(9999)
+    assert factor.job_id == 9999
+    assert factor.cluster == pyslurm.settings.LOCAL_CLUSTER
+    assert factor.priority is None
+    assert factor.tres == {}
+    assert factor.to_dict()
+
+
+def test_create_collection():
+    factors = JobPriorityFactors([1, 2, 3])
+    assert len(factors) == 3
+    assert 1 in factors
+    assert factors[2].job_id == 2
+
+    assert factors.tres_to_columns() == {}
+    columns = factors.tres_to_columns(["cpu"])
+    assert list(columns["cpu"]) == [0.0, 0.0, 0.0]
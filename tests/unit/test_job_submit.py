@@ -27,6 +27,7 @@ from os import environ as pyenviron
 from util import create_job_script
 from pyslurm import (
     JobSubmitDescription,
+    HeterogeneousJobSubmitDescription,
 )
 from pyslurm.core.job.submission import (
     _parse_cpu_freq_str_to_dict,
@@ -35,6 +36,8 @@ from pyslurm.core.job.submission import (
     _parse_dependencies,
     _parse_signal_str_to_dict,
     _validate_batch_script,
+    _submit_attrs,
+    _STR_ONLY_ATTRS,
 )
 from pyslurm.core.job.util import (
     mail_type_list_to_int,
@@ -373,3 +376,49 @@ def test_parsing_sbatch_options_from_script():
         assert job.gres_binding == "enforce-binding"
     finally:
         os.remove(path)
+
+
+def test_parsing_sbatch_options_many():
+    fd, path = tempfile.mkstemp()
+    try:
+        with os.fdopen(fd, "w") as tmp:
+            tmp.write("#!/bin/bash\n#SBATCH -J many\n#SBATCH --time=5\n")
+
+        jobs = [job_desc() for _ in range(3)]
+        for job in jobs:
+            job.script = path
+
+        jobs[0].name = "keep"
+        JobSubmitDescription.load_sbatch_options_many(jobs)
+        assert [job.name for job in jobs] == ["keep", "many", "many"]
+        assert all(job.time_limit == "5" for job in jobs)
+
+        with pytest.raises(ValueError):
+            JobSubmitDescription.load_sbatch_options_many(
+                [JobSubmitDescription()])
+    finally:
+        os.remove(path)
+
+
+def test_submit_many_str_only_attrs():
+    # Each of these is submitted by only replacing a string in the template's
+    # descriptor, so they must be real attributes.
+    assert _STR_ONLY_ATTRS.issubset(_submit_attrs())
+
+
+def test_het_job_components():
+    desc = HeterogeneousJobSubmitDescription([
+        job_desc(),
+        JobSubmitDescription(ntasks=2),
+    ])
+    assert len(desc.components) == 2
+
+    # Only the first component carries the script and environment, the
+    # others can be prepared without them.
+    desc.components[1]._create_job_submit_desc(het_offset=1)
+
+    with pytest.raises(ValueError, match="batch script"):
+        JobSubmitDescription(ntasks=2)._create_job_submit_desc(het_offset=0)
+
+    with pytest.raises(ValueError):
+        HeterogeneousJobSubmitDescription().submit()
@@ -0,0 +1,106 @@
+#########################################################################
+# test_job_wait.py - waiting for jobs unit tests
+#########################################################################
+# Copyright (C) 2026 Toni Harzendorf <toni.harzendorf@gmail.com>
+#
+# This file is part of PySlurm
+#
+# PySlurm is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+
+# PySlurm is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with PySlurm; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""test_job_wait.py - Test waiting for Jobs."""
+
+import asyncio
+import pytest
+from pyslurm.core.job import wait
+
+
+class FakeJobs:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def load_states(self, job_ids):
+        self.calls.append(list(job_ids))
+        return self.responses.pop(0)
+
+
+def test_wait_for(monkeypatch):
+    fake = FakeJobs(
+        {1: "RUNNING", 2: "PENDING", 3: "RUNNING"},
+        {1: "COMPLETED", 2: "RUNNING", 3: "RUNNING"},
+        {2: "RUNNING", 3: "FAILED"},
+        {},
+    )
+    monkeypatch.setattr(wait, "Jobs", fake)
+
+    done = list(wait.wait_for([1, 2, 3, 3], min_interval=0, max_interval=0))
+    assert done == [(1, "COMPLETED"), (3, "FAILED"), (2, None)]
+    assert fake.calls == [[1, 2, 3], [1, 2, 3], [2, 3], [2]]
+
+
+def test_wait_for_states(monkeypatch):
+    fake = FakeJobs({1: "PENDING"}, {1: "RUNNING"})
+    monkeypatch.setattr(wait, "Jobs", fake)
+
+    done = dict(wait.wait_for([1], states=["running"], min_interval=0))
+    assert done == {1: "RUNNING"}
+
+
+def test_wait_for_states_finished(monkeypatch):
+    fake = FakeJobs({1: "PENDING", 2: "PENDING"}, {1: "FAILED", 2: "RUNNING"})
+    monkeypatch.setattr(wait, "Jobs", fake)
+
+    # Job 1 will never be running, so it is not waited for anymore.
+    done = dict(wait.wait_for([1, 2], states=["RUNNING"], min_interval=0))
+    assert done == {1: "FAILED", 2: "RUNNING"}
+    assert len(fake.calls) == 2
+
+
+def test_wait_for_timeout(monkeypatch):
+    fake = FakeJobs(*[{1: "RUNNING"}] * 100)
+    monkeypatch.setattr(wait, "Jobs", fake)
+
+    with pytest.raises(TimeoutError):
+        list(wait.wait_for([1], timeout=0.05, min_interval=0.01))
+
+
+def test_backoff():
+    waiter = wait._Waiter([1], None, None, 1.0, 4.0)
+    waiter.update({1: "RUNNING"})
+    assert waiter.interval == 1.5
+    for _ in range(10):
+        waiter.update({1: "RUNNING"})
+    assert waiter.interval == 4.0
+    assert 3.2 <= waiter.next_delay() <= 4.8
+
+    waiter.pending = [1, 2]
+    waiter.update({1: "COMPLETED", 2: "RUNNING"})
+    assert waiter.interval == 1.0
+
+
+def test_wait_for_async(monkeypatch):
+    fake = FakeJobs({1: "RUNNING", 2: "COMPLETED"}, {1: "CANCELLED"})
+    monkeypatch.setattr(wait, "Jobs", fake)
+
+    async def collect():
+        return [item async for item in wait.wait_for_async(
+            [1, 2], min_interval=0)]
+
+    # asyncio.run() is only available since Python 3.7
+    loop = asyncio.new_event_loop()
+    try:
+        done = loop.run_until_complete(collect())
+    finally:
+        loop.close()
+    assert done == [(2, "COMPLETED"), (1, "CANCELLED")]
@@ -20,8 +20,9 @@
 # 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 """test_node.py - Unit Test basic functionality of the Node class."""
 
-from pyslurm import Node
-from pyslurm.core.node import _node_state_from_str
+from pyslurm import Node, Nodes
+from pyslurm.xcollections import _to_column
+from pyslurm.core.node import _node_state_from_str, _NODE_COLUMNS
 
 
 def test_create_instance():
@@ -42,3 +43,20 @@ def test_set_node_state():
 def test_setting_attributes():
     # TODO
     assert True
+
+
+def _column_values(col):
+    return [None if val != val else val for val in list(col)]
+
+
+def test_to_columns_from_c():
+    nodes = Nodes([Node("node1"), Node("node2")])
+    fields = list(_NODE_COLUMNS)
+    cols = nodes.to_columns(fields)
+
+    # The columns read from the C structs must be the same as the ones
+    # created from the attributes.
+    for field in fields:
+        expected = _to_column([getattr(node, field)
+                               for node in nodes.values()], None)
+        assert _column_values(cols[field]) == _column_values(expected)